@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 from pydantic import BaseModel, Field, validator
 
 class CurationRequest(BaseModel):
@@ -50,6 +50,17 @@ class CurationRequest(BaseModel):
                 raise ValueError("Maximum of 10 keywords allowed")
         return keywords
 
+    def cache_key(self) -> tuple:
+        """
+        Normalized identity of the request for response caching.
+
+        Keywords are stripped, lowercased and sorted, since keyword filtering is
+        case-insensitive and their order and duplicates do not change the
+        result; metadata is ignored.
+        """
+        keywords = tuple(sorted({k.strip().lower() for k in self.keywords or [] if k and k.strip()}))
+        return (keywords, self.max_news, self.max_papers, self.max_repos, self.include_sentiment)
+
     model_config = {
         "json_schema_extra": {
             "example": {
@@ -64,4 +75,52 @@ class CurationRequest(BaseModel):
                 }
             }
         }
+    }
+
+
+class SearchRequest(BaseModel):
+    """Schema for full-text search over stored content."""
+
+    keywords: List[str] = Field(
+        ...,
+        description="Keywords to search for; content matches when it contains all terms of any keyword"
+    )
+
+    content_type: Optional[Literal['news', 'paper', 'repo', 'event']] = Field(
+        default=None,
+        description="Restrict results to one content type"
+    )
+
+    limit: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="Maximum number of results to return (1-100)"
+    )
+
+    max_age_days: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Only search content collected in the last N days (default: all stored content)"
+    )
+
+    @validator('keywords', allow_reuse=True)
+    def validate_keywords(cls, keywords):
+        """Validate that at least one non-empty keyword is given"""
+        keywords = list(dict.fromkeys(k.strip() for k in keywords if k and k.strip()))
+        if not keywords:
+            raise ValueError("At least one keyword is required")
+        if len(keywords) > 10:
+            raise ValueError("Maximum of 10 keywords allowed")
+        return keywords
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "keywords": ["machine learning", "LLM"],
+                "content_type": "news",
+                "limit": 20,
+                "max_age_days": 90
+            }
+        }
     }
\ No newline at end of file
@@ -1,10 +1,15 @@
+import asyncio
 import logging
+import time
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from typing import Dict, Any
 
 from config.settings import get_settings
 from curators.sentiment_curator import SentimentEnhancedContentCurator
-from api.schemas import CurationRequest
+from api.schemas import CurationRequest, SearchRequest
+from services.snapshot_service import model_payload
+from utils.cache import ResponseCache
 from utils.formatters import convert_to_json
 
 # Configure logging
@@ -45,14 +50,45 @@ async def root():
         }
     }
 
+async def warm_up_curator(curator: SentimentEnhancedContentCurator):
+    """Preload models, run warm-up inferences and prime feed caches, then mark the API ready"""
+    start = time.perf_counter()
+    try:
+        await curator.warm_up()
+        logger.info(f"Warm-up finished in {time.perf_counter() - start:.2f}s")
+    except Exception as e:
+        # A failed warm-up must not keep the instance out of rotation forever
+        logger.error(f"Warm-up failed after {time.perf_counter() - start:.2f}s: {str(e)}", exc_info=True)
+    finally:
+        app.state.ready = True
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize curator on startup"""
     try:
+        start = time.perf_counter()
+        app.state.ready = False
+        app.state.warmup_task = None
         settings = get_settings()
         logger.info(f"Starting with config: {settings.CURATOR_CONFIG}")
         app.state.curator = SentimentEnhancedContentCurator(settings.CURATOR_CONFIG)
-        logger.info("API initialized successfully")
+        app.state.curate_cache = ResponseCache(settings.curate_cache_ttl, settings.curate_cache_max_entries)
+        app.state.snapshot_service = None
+        if settings.serving_mode == 'snapshot':
+            # Database access is only needed (and imported) when serving from snapshots
+            from config.database import get_db_session
+            from services.snapshot_service import SnapshotService
+            app.state.snapshot_service = SnapshotService(
+                get_db_session, settings.snapshot.max_age_hours, settings.snapshot.keep
+            )
+            logger.info("Serving curation requests from collector snapshots")
+        logger.info(f"API initialized successfully in {time.perf_counter() - start:.2f}s")
+        
+        if settings.warmup.enabled:
+            # Runs in the background so the server starts answering liveness probes right away
+            app.state.warmup_task = asyncio.create_task(warm_up_curator(app.state.curator))
+        else:
+            app.state.ready = True
     except Exception as e:
         logger.error(f"Failed to initialize API: {str(e)}")
         raise
@@ -61,17 +97,118 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup resources on shutdown"""
     try:
+        warmup_task = getattr(app.state, 'warmup_task', None)
+        if warmup_task and not warmup_task.done():
+            warmup_task.cancel()
+        if hasattr(app.state, 'curate_cache'):
+            app.state.curate_cache.clear()
         if hasattr(app.state, 'curator'):
             await app.state.curator.close()
         logger.info("API shutdown complete")
     except Exception as e:
         logger.error(f"Error during shutdown: {str(e)}")
 
+@app.get("/health/live")
+async def health_live() -> Dict[str, Any]:
+    """Liveness probe: the process is up and serving requests"""
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def health_ready():
+    """Readiness probe: 200 only after startup warm-up has finished, 503 before that"""
+    if getattr(app.state, 'ready', False):
+        return {"status": "ready"}
+    return JSONResponse(status_code=503, content={"status": "warming_up"})
+
+@app.get("/api/metrics")
+async def metrics() -> Dict[str, Any]:
+    """Runtime metrics (sentiment worker pool, micro-batching, curation response cache and database pool)"""
+    curator = getattr(app.state, 'curator', None)
+    sentiment_service = getattr(curator, 'sentiment_service', None)
+    curate_cache = getattr(app.state, 'curate_cache', None)
+    return {
+        "sentiment": sentiment_service.metrics() if sentiment_service else None,
+        "curate_cache": curate_cache.metrics() if curate_cache else None,
+        "database": database_pool_metrics()
+    }
+
+def database_pool_metrics():
+    """Connection pool metrics (checkout wait, saturation, churn), or None without a database driver"""
+    try:
+        from config.database import pool_metrics
+    except ImportError:
+        return None
+    return pool_metrics()
+
+async def run_curation(curator: SentimentEnhancedContentCurator, request: CurationRequest,
+                       snapshot_service=None) -> Dict[str, Any]:
+    """
+    Build the JSON response for a request.
+    
+    With a snapshot service, content comes from the latest collector snapshot;
+    without one (or when no fresh snapshot exists) the full fetch, cluster and
+    sentiment pipeline runs live.
+    """
+    request_dict = model_payload(request)
+    
+    content = None
+    if snapshot_service is not None:
+        try:
+            content = await curator.get_snapshot_content(request_dict, snapshot_service)
+        except Exception as e:
+            logger.error(f"Snapshot read failed: {str(e)}", exc_info=True)
+        if content is None:
+            logger.warning("No fresh snapshot available, falling back to the live pipeline")
+    
+    if content is None:
+        # Log that we're about to call get_curated_content
+        logger.info("Calling curator.get_curated_content")
+        content = await curator.get_curated_content(request_dict)
+    
+    # Log whether content is None and its type
+    if content is None:
+        logger.error("curator.get_curated_content returned None")
+    else:
+        logger.info(f"Content returned with type: {type(content)}")
+        
+    # Add sentiment if requested
+    insights = {}
+    if request.include_sentiment:
+        logger.info("Adding sentiment analysis")
+        insights = curator.highlight_sentiment_insights(content)
+        logger.info(f"Sentiment insights type: {type(insights)}")
+    
+    # Convert to JSON
+    logger.info("Converting content to JSON")
+    result = convert_to_json(content, insights)
+    logger.info("Conversion to JSON successful")
+    
+    return result
+
+def is_cacheable_response(result: Dict[str, Any]) -> bool:
+    """
+    Whether a curation response may be served to later identical requests.
+    
+    Failed conversions, curator errors (reported in the content metadata) and
+    responses without any news, papers or repositories are not cached, so the
+    next request retries the pipeline instead of replaying the failure.
+    """
+    if result.get("error") or result.get("metadata", {}).get("status") in ("error", "empty"):
+        return False
+    content = result.get("content") or {}
+    if (content.get("metadata") or {}).get("error") or content.get("error"):
+        return False
+    return any(content.get(section) for section in ("news", "papers", "repos"))
+
 @app.post("/api/curate")
 async def curate_content(request: CurationRequest) -> Dict[str, Any]:
     """
     Curate content based on request parameters
     
+    Identical requests (same normalized keywords, limits and include_sentiment)
+    are answered from a short-lived response cache, and concurrent identical
+    requests share a single pipeline run. Failed or empty responses are not cached.
+    
     Args:
         request: CurationRequest object containing parameters for content curation
             - max_news: Maximum number of news items to return (1-50)
@@ -93,7 +230,7 @@ async def curate_content(request: CurationRequest) -> Dict[str, Any]:
     """
     try:
         # Log the request details for debugging
-        request_dict = request.model_dump()
+        request_dict = model_payload(request)
         logger.info(f"Processing curation request: {request_dict}")
         
         # Get curator from app state
@@ -102,29 +239,14 @@ async def curate_content(request: CurationRequest) -> Dict[str, Any]:
             logger.error("Curator not initialized in app state")
             raise ValueError("API service not properly initialized")
         
-        # Log that we're about to call get_curated_content
-        logger.info("Calling curator.get_curated_content")
-        content = await curator.get_curated_content(request_dict)
-        
-        # Log whether content is None and its type
-        if content is None:
-            logger.error("curator.get_curated_content returned None")
-        else:
-            logger.info(f"Content returned with type: {type(content)}")
-            
-        # Add sentiment if requested
-        insights = {}
-        if request.include_sentiment:
-            logger.info("Adding sentiment analysis")
-            insights = curator.highlight_sentiment_insights(content)
-            logger.info(f"Sentiment insights type: {type(insights)}")
-        
-        # Convert to JSON
-        logger.info("Converting content to JSON")
-        result = convert_to_json(content, insights)
-        logger.info("Conversion to JSON successful")
-        
-        return result
+        snapshot_service = getattr(app.state, 'snapshot_service', None)
+        curate_cache = getattr(app.state, 'curate_cache', None)
+        if curate_cache is None:
+            return await run_curation(curator, request, snapshot_service)
+        return await curate_cache.get_or_compute(
+            request.cache_key(), lambda: run_curation(curator, request, snapshot_service),
+            should_store=is_cacheable_response
+        )
     except ValueError as e:
         logger.error(f"Validation error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -132,6 +254,58 @@ async def curate_content(request: CurationRequest) -> Dict[str, Any]:
         logger.error(f"Curation error: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
+def search_stored_content(request: SearchRequest) -> Dict[str, Any]:
+    """Run the ranked full-text query (blocking database access, called from a worker thread)"""
+    from config.database import get_db_session
+    from repositories.content_repository import ContentRepository
+    
+    start = time.perf_counter()
+    max_age_hours = request.max_age_days * 24 if request.max_age_days else None
+    with get_db_session() as session:
+        matches = ContentRepository(session).search(
+            request.keywords, request.content_type, request.limit, max_age_hours
+        )
+        results = [
+            {
+                "id": content.id,
+                "type": content.type,
+                "title": content.title,
+                "description": content.description,
+                "link": content.link,
+                "source": content.source_name,
+                "created_at": content.created_at.isoformat() if content.created_at else None,
+                "rank": round(float(rank), 6)
+            }
+            for content, rank in matches
+        ]
+    return {
+        "results": results,
+        "metadata": {
+            "keywords": request.keywords,
+            "content_type": request.content_type,
+            "total_results": len(results),
+            "query_ms": round((time.perf_counter() - start) * 1000, 2)
+        }
+    }
+
+@app.post("/api/search")
+async def search_content(request: SearchRequest) -> Dict[str, Any]:
+    """
+    Ranked full-text search over stored content
+    
+    Uses the Postgres tsvector column on content (title weighted over
+    description, GIN index), so keyword queries cover the whole collected
+    history without fetching external sources.
+    
+    Raises:
+        HTTPException(500): If the search fails
+    """
+    try:
+        return await asyncio.to_thread(search_stored_content, request)
+    except Exception as e:
+        logger.error(f"Search error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -1,21 +1,57 @@
 # config/database.py
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
+from typing import Any, Dict, Optional
 import os
 
-from config.settings import get_settings
+from config.settings import Settings, get_settings
+from utils.db_pool import InstrumentedQueuePool
 
 settings = get_settings()
 
-# Pegar a URL do ambiente ou usar o padrão
-DATABASE_URL = os.environ.get(
-    "DATABASE_URL", 
-    "postgresql://postgres:postgres@db:5432/ailert"  # Use 'db' como host, não 'localhost'
-)
+# Pegar a URL do ambiente ou usar a das configurações
+DATABASE_URL = os.environ.get("DATABASE_URL", settings.DATABASE_URL)
 
-engine = create_engine(DATABASE_URL)
+def pool_limits(settings: Settings, role: str) -> Dict[str, int]:
+    """Tamanho do pool e overflow para o papel do processo ('api' ou 'collector')."""
+    if role == 'collector':
+        return {'pool_size': settings.DB_COLLECTOR_POOL_SIZE, 'max_overflow': settings.DB_COLLECTOR_MAX_OVERFLOW}
+    if role == 'api':
+        return {'pool_size': settings.DB_POOL_SIZE, 'max_overflow': settings.DB_MAX_OVERFLOW}
+    raise ValueError(f"Papel de banco desconhecido: {role} (use 'api' ou 'collector')")
+
+def build_engine(url: str, settings: Settings, role: Optional[str] = None):
+    """
+    Cria o engine com o pool dimensionado para o papel do processo.
+
+    Cada réplica abre no máximo pool_size + max_overflow conexões, então o
+    total no PostgreSQL é a soma disso por réplica de API e de coletor.
+
+    Args:
+        url: URL de conexão
+        settings: Configurações (tamanhos, timeouts, pre-ping e reciclagem)
+        role: 'api' ou 'collector' (None usa settings.DB_ROLE)
+    """
+    connect_args = {}
+    if make_url(url).get_backend_name() == 'postgresql':
+        connect_args['connect_timeout'] = settings.DB_CONNECT_TIMEOUT
+        if settings.DB_STATEMENT_TIMEOUT_MS:
+            connect_args['options'] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+
+    return create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+        **pool_limits(settings, role or settings.DB_ROLE)
+    )
+
+engine = build_engine(DATABASE_URL, settings)
 
 # Criar fábrica de sessões
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -34,4 +70,8 @@ def get_db_session():
         session.rollback()
         raise
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
+
+def pool_metrics() -> Dict[str, Any]:
+    """Papel do processo e métricas do pool de conexões (checkout, saturação e rotatividade)."""
+    return {'role': settings.DB_ROLE, **engine.pool.metrics()}
@@ -1,12 +1,54 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from functools import lru_cache
 from pydantic import BaseModel, Field
 from pydantic import BaseSettings
 
 class SentimentConfig(BaseModel):
     """Configuration for sentiment analysis."""
-    type: str = 'vader'  # 'basic', 'vader', ou 'bert'
+    type: str = 'vader'  # 'basic', 'vader', 'bert' ou 'bert_int8' (quantizado, CPU)
     language: str = 'en'  # 'en' ou 'pt'
+    batch_size: int = 16  # Textos por lote de inferência (BERT)
+    cache_size: int = 10000  # Resultados mantidos no cache em memória (0 desativa)
+    persist_cache: bool = False  # Também grava/consulta resultados na tabela sentiment_analysis
+    workers: int = 2  # Threads do pool de inferência
+    max_queue: int = 32  # Chamadas pendentes no pool antes de aplicar espera (backpressure)
+    microbatch_max_size: int = 64  # Textos por micro-lote entre requisições
+    microbatch_max_wait_ms: float = 5.0  # Janela de agrupamento entre requisições (0 desativa)
+    model_dir: Optional[str] = None  # Diretório local do modelo BERT (None usa o modelo do hub)
+    num_threads: Optional[int] = None  # Threads do PyTorch na inferência em CPU
+    chunk_long_texts: bool = False  # Divide textos longos em trechos e agrega (em vez de truncar)
+    max_chunks: int = 4  # Máximo de trechos por texto
+    chunk_overlap: int = 32  # Tokens compartilhados entre trechos consecutivos
+    token_cache_size: int = 4096  # Textos com tokenização mantida em cache
+
+class SourceTimeoutsConfig(BaseModel):
+    """Prazo (segundos) de cada fonte na coleta concorrente do curador."""
+    news: float = 20.0
+    papers: float = 45.0
+    repos: float = 15.0
+
+class ClusteringConfig(BaseModel):
+    """Configuration for news clustering."""
+    method: str = 'auto'  # 'auto', 'dense' ou 'sparse'
+    linkage: str = 'leader'  # 'leader' (guloso) ou 'single'
+    top_k: Optional[int] = None  # Máximo de vizinhos por notícia no modo esparso
+    dedupe_threshold: Optional[float] = 0.8  # Jaccard mínimo para colapsar quase-duplicatas
+    persisted: bool = False  # Serve os clusters gravados pelo coletor em vez de reagrupar a cada requisição
+    persisted_window_hours: int = 48  # Apenas clusters atualizados nesta janela são servidos
+
+class WarmupConfig(BaseModel):
+    """Aquecimento da API na inicialização (a prontidão só é sinalizada ao final)."""
+    enabled: bool = True  # Carrega modelos em segundo plano em vez de no construtor do curador
+    inferences: int = 2  # Rodadas de inferência de aquecimento do analisador de sentimento
+    prime_feeds: bool = True  # Busca os feeds e executa o pipeline de notícias uma vez
+    max_news: int = 10  # Tamanho da curadoria de notícias usada no aquecimento
+
+class SnapshotConfig(BaseModel):
+    """Snapshots de curadoria materializados pelo coletor (serving_mode='snapshot')."""
+    max_news: int = 200  # Notícias materializadas (base para o filtro por palavra-chave)
+    max_repos: int = 20  # Repositórios materializados
+    max_age_hours: float = 6.0  # Snapshots mais velhos não são servidos (a API usa o pipeline ao vivo)
+    keep: int = 3  # Snapshots mantidos no banco
 
 class Settings(BaseSettings):
     """Application settings using Pydantic BaseSettings."""
@@ -16,14 +58,55 @@ class Settings(BaseSettings):
         description="URL de conexão com o banco de dados"
     )
     
+    # Papel do processo: define o tamanho do pool ('api' ou 'collector')
+    DB_ROLE: str = Field(
+        default='api',
+        description="Papel do processo no acesso ao banco: 'api' ou 'collector'"
+    )
+    
     DB_POOL_SIZE: int = Field(
         default=5,
-        description="Tamanho do pool de conexões com o banco"
+        description="Tamanho do pool de conexões com o banco (processo da API)"
     )
     
     DB_MAX_OVERFLOW: int = Field(
         default=10,
-        description="Número máximo de conexões adicionais no pool"
+        description="Número máximo de conexões adicionais no pool (processo da API)"
+    )
+    
+    DB_COLLECTOR_POOL_SIZE: int = Field(
+        default=2,
+        description="Tamanho do pool de conexões do coletor"
+    )
+    
+    DB_COLLECTOR_MAX_OVERFLOW: int = Field(
+        default=2,
+        description="Número máximo de conexões adicionais no pool do coletor"
+    )
+    
+    DB_POOL_TIMEOUT: float = Field(
+        default=10.0,
+        description="Segundos de espera por uma conexão livre antes de falhar"
+    )
+    
+    DB_POOL_RECYCLE: int = Field(
+        default=1800,
+        description="Idade máxima (segundos) de uma conexão antes de ser reaberta; -1 desativa"
+    )
+    
+    DB_POOL_PRE_PING: bool = Field(
+        default=True,
+        description="Testa a conexão no checkout (descarta conexões derrubadas pelo servidor)"
+    )
+    
+    DB_CONNECT_TIMEOUT: int = Field(
+        default=5,
+        description="Prazo (segundos) para abrir uma conexão com o PostgreSQL"
+    )
+    
+    DB_STATEMENT_TIMEOUT_MS: int = Field(
+        default=0,
+        description="statement_timeout do PostgreSQL em milissegundos; 0 desativa"
     )
     
     # Configuração de retenção de dados
@@ -52,6 +135,44 @@ class Settings(BaseSettings):
         ]
     )
     
+    # Cache de feeds RSS (corpo + ETag/Last-Modified por URL)
+    feed_cache_dir: str = Field(
+        default="data/feed_cache",
+        description="Diretório do cache persistente de feeds RSS"
+    )
+    
+    # Cache de notícias processadas (segundos); 0 desabilita
+    news_cache_ttl: float = Field(
+        default=300,
+        description="Tempo em que as notícias pontuadas são consideradas frescas"
+    )
+    
+    news_cache_max_stale: float = Field(
+        default=3600,
+        description="Tempo adicional em que notícias obsoletas ainda são servidas enquanto atualizam"
+    )
+    
+    # Modo de atendimento do /api/curate: 'live' executa o pipeline na requisição;
+    # 'snapshot' responde do snapshot materializado pelo coletor (com fallback ao vivo)
+    serving_mode: str = Field(
+        default='live',
+        description="Origem das respostas de curadoria: 'live' ou 'snapshot'"
+    )
+    
+    snapshot: SnapshotConfig = Field(default_factory=SnapshotConfig)
+    
+    # Cache de respostas do /api/curate (segundos); 0 desabilita o armazenamento,
+    # mas requisições idênticas simultâneas continuam compartilhando a computação
+    curate_cache_ttl: float = Field(
+        default=60,
+        description="Tempo em que uma resposta de curadoria é reutilizada para requisições idênticas"
+    )
+    
+    curate_cache_max_entries: int = Field(
+        default=256,
+        description="Número máximo de respostas de curadoria mantidas em memória"
+    )
+    
     # API endpoints
     arxiv_url: str = Field(default="http://export.arxiv.org/api/query?")
     github_python_url: str = Field(
@@ -64,10 +185,17 @@ class Settings(BaseSettings):
     
     # Content processing settings
     similarity_threshold: float = Field(default=0.6)
+    clustering: ClusteringConfig = Field(default_factory=ClusteringConfig)
+    
+    # Prazos por fonte na curadoria
+    source_timeouts: SourceTimeoutsConfig = Field(default_factory=SourceTimeoutsConfig)
     
     # Sentiment analysis settings
     sentiment: SentimentConfig = Field(default_factory=SentimentConfig)
     
+    # Aquecimento na inicialização da API
+    warmup: WarmupConfig = Field(default_factory=WarmupConfig)
+    
     @property
     def CURATOR_CONFIG(self) -> Dict[str, Any]:
         """
@@ -76,13 +204,32 @@ class Settings(BaseSettings):
         """
         return {
             'rss_feeds': self.rss_feeds,
+            'feed_cache_dir': self.feed_cache_dir,
+            'news_cache_ttl': self.news_cache_ttl,
+            'news_cache_max_stale': self.news_cache_max_stale,
             'arxiv_url': self.arxiv_url,
             'github_python_url': self.github_python_url,
             'github_javascript_url': self.github_javascript_url,
             'similarity_threshold': self.similarity_threshold,
+            'clustering': self.clustering.dict(),
+            'source_timeouts': self.source_timeouts.dict(),
+            'warmup': self.warmup.dict(),
             'sentiment': {
                 'type': self.sentiment.type,
-                'language': self.sentiment.language
+                'language': self.sentiment.language,
+                'batch_size': self.sentiment.batch_size,
+                'cache_size': self.sentiment.cache_size,
+                'persist_cache': self.sentiment.persist_cache,
+                'workers': self.sentiment.workers,
+                'max_queue': self.sentiment.max_queue,
+                'microbatch_max_size': self.sentiment.microbatch_max_size,
+                'microbatch_max_wait_ms': self.sentiment.microbatch_max_wait_ms,
+                'model_dir': self.sentiment.model_dir,
+                'num_threads': self.sentiment.num_threads,
+                'chunk_long_texts': self.sentiment.chunk_long_texts,
+                'max_chunks': self.sentiment.max_chunks,
+                'chunk_overlap': self.sentiment.chunk_overlap,
+                'token_cache_size': self.sentiment.token_cache_size
             }
         }
     
@@ -98,5 +245,12 @@ def get_settings() -> Settings:
     """
     return Settings()
 
-# For backward compatibility
-CURATOR_CONFIG = get_settings().CURATOR_CONFIG
+def __getattr__(name: str) -> Any:
+    """
+    Lazy module attributes.
+    CURATOR_CONFIG is kept for backward compatibility but is only built
+    (reading the environment) on first access instead of at import time.
+    """
+    if name == "CURATOR_CONFIG":
+        return get_settings().CURATOR_CONFIG
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,6 +6,7 @@ from datetime import datetime
 
 from models.content_models import CuratedContent, NewsItem, ResearchPaper, Repo
 from services.news_service import NewsService
+from utils.feed_cache import FeedCache
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,12 @@ class ContentCurator:
         self.api_keys = config.get('api_keys', {})
         
         # Inicializa serviços
-        self.news_service = NewsService(self.rss_feeds)
+        self.news_service = NewsService(
+            self.rss_feeds,
+            feed_cache=FeedCache(config.get('feed_cache_dir')),
+            cache_ttl=config.get('news_cache_ttl', 0.0),
+            cache_max_stale=config.get('news_cache_max_stale', 0.0)
+        )
         self.research_service = None  # Será inicializado nas classes derivadas se necessário
         self.repo_service = None      # Será inicializado nas classes derivadas se necessário
         
@@ -1,7 +1,8 @@
 # curators/content_curator.py
 
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 from models.content_models import ContentSource, EnhancedNewsItem, EnhancedResearchPaper, EnhancedRepo, CuratedContent, NewsItem, Repo, ResearchPaper
@@ -32,8 +33,30 @@ class EnhancedContentCurator(ContentCurator):
         config = config or {}
         self.similarity_threshold = config.get('similarity_threshold', 0.6)
         
+        # Prazo (segundos) de cada fonte na coleta concorrente
+        self.source_timeouts = {
+            'news': 20.0,
+            'papers': 45.0,
+            'repos': 15.0,
+            **config.get('source_timeouts', {})
+        }
+        
         # Inicializa serviço de clustering
-        self.news_clustering = NewsClusteringService(self.similarity_threshold)
+        clustering_config = config.get('clustering', {})
+        self.news_clustering = NewsClusteringService(
+            self.similarity_threshold,
+            method=clustering_config.get('method', 'auto'),
+            linkage=clustering_config.get('linkage', 'leader'),
+            top_k=clustering_config.get('top_k'),
+            dedupe_threshold=clustering_config.get('dedupe_threshold', 0.8)
+        )
+        
+        # Clusters persistidos pelo coletor (o banco só é importado quando habilitado)
+        self.cluster_session_factory = None
+        self.persisted_window_hours = clustering_config.get('persisted_window_hours', 48)
+        if clustering_config.get('persisted', False):
+            from config.database import get_db_session
+            self.cluster_session_factory = get_db_session
         
         # Inicializa serviços de GitHub e pesquisa
         self.github_url = config.get('github_python_url', 'https://github.com/trending/python?since=daily&spoken_language_code=en')
@@ -43,11 +66,30 @@ class EnhancedContentCurator(ContentCurator):
         logger.info(f"Curador de conteúdo aprimorado inicializado (threshold: {self.similarity_threshold})")
         logger.info(f"Serviço GitHub inicializado com URL: {self.github_url}")
     
+    async def warm_up(self, prime_feeds: bool = True, max_news: int = 10):
+        """
+        Aquece o curador antes de receber tráfego
+        
+        Busca os feeds (preenchendo os caches de feeds e de notícias pontuadas)
+        e executa uma vez o pipeline de notícias, o que também carrega o
+        scikit-learn/scipy usados na vetorização e no clustering.
+        
+        Args:
+            prime_feeds: Se False, não faz nada
+            max_news: Número de notícias da curadoria de aquecimento
+        """
+        if not prime_feeds:
+            return
+        news, timed_out = await self._run_with_deadline('news', self._get_enhanced_news({'max_news': max_news}))
+        logger.info(f"Aquecimento de notícias concluído: {len(news)} itens (timeout: {timed_out})")
+    
     async def close(self):
         """Fecha recursos e conexões assíncronas"""
         try:
             if hasattr(self, 'news_service') and self.news_service:
                 await self.news_service.close()
+            if hasattr(self, 'github_service') and self.github_service:
+                await self.github_service.close()
             logger.info("Recursos do curador de conteúdo aprimorado fechados")
         except Exception as e:
             logger.error(f"Erro ao fechar recursos do curador: {str(e)}")
@@ -81,7 +123,9 @@ class EnhancedContentCurator(ContentCurator):
                 name=item.source or "Unknown Source",
                 link=item.link,
                 published_date=str(item.additional_info.get('published_date')) if item.additional_info and 'published_date' in item.additional_info else None,
-                author=item.additional_info.get('author') if item.additional_info else None
+                author=item.additional_info.get('author') if item.additional_info else None,
+                title=item.title,
+                description=item.description
             )
             
             sources.append(primary_source)
@@ -154,15 +198,15 @@ class EnhancedContentCurator(ContentCurator):
             logger.error(f"Erro ao obter papers de pesquisa: {str(e)}", exc_info=True)
             return []
         
-    async def get_curated_content(self, request: Dict) -> CuratedContent:
+    async def _get_enhanced_news(self, request: Dict) -> List[EnhancedNewsItem]:
         """
-        Retorna conteúdo curado com agrupamento de fontes similares
+        Obtém notícias agrupadas por similaridade
         
         Args:
             request: Parâmetros para a curadoria
             
         Returns:
-            Objeto CuratedContent com o conteúdo curado
+            Lista de EnhancedNewsItem
         """
         enhanced_news = []
         try:
@@ -170,9 +214,18 @@ class EnhancedContentCurator(ContentCurator):
             max_news = request.get('max_news', 10)
             keywords = request.get('keywords', None)
             
+            # Com clusters persistidos, lê os já calculados pelo coletor em vez de reagrupar
+            if self.cluster_session_factory is not None:
+                enhanced_news = await self._get_persisted_news(max_news, keywords)
+                if enhanced_news:
+                    logger.info(f"Obtidos {len(enhanced_news)} clusters persistidos")
+                    return enhanced_news
+                logger.warning("Nenhum cluster persistido recente; agrupando notícias ao vivo")
+            
             # Coleta notícias usando a API pública do serviço de notícias
             logger.info(f"Obtendo top notícias com keywords: {keywords}")
-            news_items = await self.news_service.get_top_news(max_news * 3, keywords)  # Pegamos mais para agrupar depois
+            # Pegamos mais para agrupar depois; a matriz TF-IDF dessas notícias é reaproveitada no clustering
+            news_items, tfidf_matrix = await self.news_service.get_top_news_with_vectors(max_news * 3, keywords)
             
             # Se não conseguimos notícias, vamos tentar o método da classe base como fallback
             if not news_items:
@@ -207,7 +260,7 @@ class EnhancedContentCurator(ContentCurator):
                 else:
                     logger.info(f"Processando {len(all_news)} notícias para agrupamento")
                     # Agrupa notícias similares
-                    news_clusters = self.news_clustering.cluster_news(all_news)
+                    news_clusters = self.news_clustering.cluster_news(all_news, tfidf_matrix)
                     formatted_news = self.news_clustering.format_clustered_news(news_clusters)
                     
                     # Limita ao número máximo solicitado
@@ -222,7 +275,9 @@ class EnhancedContentCurator(ContentCurator):
                                 name=source['name'],
                                 link=source['link'],
                                 published_date=str(source['published_date']) if 'published_date' in source else None,
-                                author=source.get('author')
+                                author=source.get('author'),
+                                title=source.get('title'),
+                                description=source.get('description')
                             )
                             sources.append(content_source)
                         
@@ -246,15 +301,41 @@ class EnhancedContentCurator(ContentCurator):
             logger.error(f"Erro ao processar notícias: {str(e)}", exc_info=True)
             # Em caso de erro, continuamos com enhanced_news vazio
         
-        # Coleta informações de outras fontes (processamento paralelo)
-        max_papers = request.get('max_papers', 5)
-        max_repos = request.get('max_repos', 5)
+        return enhanced_news
+    
+    async def _get_persisted_news(self, max_news: int, keywords: Optional[List[str]]) -> List[EnhancedNewsItem]:
+        """
+        Obtém os clusters gravados pelo coletor (IncrementalClusteringService)
         
-        # Coleta papers e repos usando os métodos sobrescritos
+        Returns:
+            Lista de EnhancedNewsItem, vazia se não há clusters recentes ou o banco falhou
+        """
+        def load():
+            from services.cluster_service import IncrementalClusteringService
+            
+            with self.cluster_session_factory() as session:
+                clustering = IncrementalClusteringService(session, time_window_hours=self.persisted_window_hours)
+                return clustering.get_clustered_news(max_news, keywords)
+        
+        try:
+            return await asyncio.to_thread(load)
+        except Exception as e:
+            logger.error(f"Erro ao ler clusters persistidos: {str(e)}", exc_info=True)
+            return []
+    
+    async def _get_enhanced_papers(self, request: Dict) -> List[EnhancedResearchPaper]:
+        """
+        Obtém papers de pesquisa convertidos para EnhancedResearchPaper
+        
+        Args:
+            request: Parâmetros para a curadoria
+            
+        Returns:
+            Lista de EnhancedResearchPaper
+        """
+        max_papers = request.get('max_papers', 5)
         base_papers = await self._get_research_papers(request)
-        base_repos = await self._get_repositories(request)
         
-        # Converte papers para EnhancedResearchPaper
         enhanced_papers = []
         for paper in base_papers[:max_papers]:
             enhanced_paper = EnhancedResearchPaper(
@@ -271,7 +352,21 @@ class EnhancedContentCurator(ContentCurator):
             )
             enhanced_papers.append(enhanced_paper)
         
-        # Converte repos para EnhancedRepo
+        return enhanced_papers
+    
+    async def _get_enhanced_repos(self, request: Dict) -> List[EnhancedRepo]:
+        """
+        Obtém repositórios convertidos para EnhancedRepo
+        
+        Args:
+            request: Parâmetros para a curadoria
+            
+        Returns:
+            Lista de EnhancedRepo
+        """
+        max_repos = request.get('max_repos', 5)
+        base_repos = await self._get_repositories(request)
+        
         enhanced_repos = []
         for repo in base_repos[:max_repos]:
             enhanced_repo = EnhancedRepo(
@@ -288,6 +383,56 @@ class EnhancedContentCurator(ContentCurator):
             )
             enhanced_repos.append(enhanced_repo)
         
+        return enhanced_repos
+    
+    async def _run_with_deadline(self, source: str, coro) -> Tuple[List, bool]:
+        """
+        Executa a coleta de uma fonte respeitando o prazo configurado para ela
+        
+        Args:
+            source: Nome da fonte ('news', 'papers' ou 'repos')
+            coro: Corrotina que coleta a fonte
+            
+        Returns:
+            Tupla (itens, timed_out). Em caso de timeout ou erro retorna lista vazia.
+        """
+        timeout = self.source_timeouts.get(source)
+        try:
+            return await asyncio.wait_for(coro, timeout=timeout), False
+        except asyncio.TimeoutError:
+            logger.warning(f"Fonte '{source}' excedeu o prazo de {timeout}s, continuando sem ela")
+            return [], True
+        except Exception as e:
+            logger.error(f"Erro ao coletar fonte '{source}': {str(e)}", exc_info=True)
+            return [], False
+        
+    async def get_curated_content(self, request: Dict) -> CuratedContent:
+        """
+        Retorna conteúdo curado com agrupamento de fontes similares.
+        
+        Notícias, papers e repositórios são coletados concorrentemente, cada fonte
+        com seu próprio prazo. Fontes que excedem o prazo são omitidas e listadas
+        em metadata['timed_out_sources'].
+        
+        Args:
+            request: Parâmetros para a curadoria
+            
+        Returns:
+            Objeto CuratedContent com o conteúdo curado
+        """
+        stages = {
+            'news': self._get_enhanced_news(request),
+            'papers': self._get_enhanced_papers(request),
+            'repos': self._get_enhanced_repos(request),
+        }
+        results = await asyncio.gather(
+            *[self._run_with_deadline(source, coro) for source, coro in stages.items()]
+        )
+        (enhanced_news, _), (enhanced_papers, _), (enhanced_repos, _) = results
+        timed_out_sources = [
+            source for source, (_, timed_out) in zip(stages.keys(), results) if timed_out
+        ]
+        
         # Cria resposta final
         try:
             # Garante que timestamp seja uma string válida
@@ -305,7 +450,8 @@ class EnhancedContentCurator(ContentCurator):
                 timestamp=timestamp,
                 metadata={
                     "source": "enhanced_curator",
-                    "request": request.get('metadata', {})
+                    "request": request.get('metadata', {}),
+                    "timed_out_sources": timed_out_sources
                 }
             )
             return curated_content
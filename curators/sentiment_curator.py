@@ -4,7 +4,7 @@ import logging
 import os
 from datetime import datetime
 
-from models.content_models import ContentSource, EnhancedNewsItem
+from models.content_models import ContentSource, EnhancedNewsItem, EnhancedRepo
 from models.sentiment_models import (
     SentimentEnhancedNewsItem, SentimentEnhancedResearchPaper, 
     SentimentEnhancedCuratedContent, ContentSentimentAnalysis,
@@ -12,6 +12,7 @@ from models.sentiment_models import (
 )
 from curators.content_curator import EnhancedContentCurator
 from services.sentiment_service import SentimentAnalysisService
+from utils.sentiment_cache import SentimentCache
 
 logger = logging.getLogger(__name__)
 
@@ -32,16 +33,72 @@ class SentimentEnhancedContentCurator(EnhancedContentCurator):
         # Inicializa serviço de análise de sentimento
         sentiment_type = sentiment_config.get('type', 'basic')
         language = sentiment_config.get('language', 'en')
+        batch_size = sentiment_config.get('batch_size', 16)
+        sentiment_cache = self._build_sentiment_cache(sentiment_config)
+        # Com aquecimento habilitado, os modelos são carregados em warm_up() e não aqui
+        self.warmup_config = config.get('warmup', {})
+        lazy_load = self.warmup_config.get('enabled', False)
         
         try:
-            self.sentiment_service = SentimentAnalysisService(sentiment_type, language)
+            self.sentiment_service = SentimentAnalysisService(
+                sentiment_type, language, batch_size=batch_size, cache=sentiment_cache,
+                workers=sentiment_config.get('workers', 2),
+                max_queue=sentiment_config.get('max_queue', 32),
+                microbatch_max_size=sentiment_config.get('microbatch_max_size', 64),
+                microbatch_max_wait_ms=sentiment_config.get('microbatch_max_wait_ms', 0.0),
+                lazy_load=lazy_load,
+                model_dir=sentiment_config.get('model_dir'),
+                num_threads=sentiment_config.get('num_threads'),
+                chunk_long_texts=sentiment_config.get('chunk_long_texts', False),
+                max_chunks=sentiment_config.get('max_chunks', 4),
+                chunk_overlap=sentiment_config.get('chunk_overlap', 32),
+                token_cache_size=sentiment_config.get('token_cache_size', 4096)
+            )
             logger.info(f"Serviço de análise de sentimento inicializado com tipo: {sentiment_type}")
         except Exception as e:
             logger.error(f"Erro ao inicializar serviço de sentimento: {str(e)}")
-            self.sentiment_service = SentimentAnalysisService('basic', 'en')  # Fallback para básico
+            self.sentiment_service = SentimentAnalysisService('basic', 'en', cache=sentiment_cache)  # Fallback para básico
             
         logger.info("Curador com capacidades de sentimento inicializado")
     
+    async def warm_up(self):
+        """
+        Pré-carrega o analisador de sentimento, executa inferências de
+        aquecimento e prepara os caches de feeds, conforme a configuração 'warmup'
+        """
+        await self.sentiment_service.warm_up(self.warmup_config.get('inferences', 2))
+        await super().warm_up(
+            prime_feeds=self.warmup_config.get('prime_feeds', True),
+            max_news=self.warmup_config.get('max_news', 10)
+        )
+    
+    async def close(self):
+        """Fecha recursos do curador base e o pool de inferência de sentimento"""
+        await super().close()
+        try:
+            if hasattr(self, 'sentiment_service') and self.sentiment_service:
+                await self.sentiment_service.close()
+        except Exception as e:
+            logger.error(f"Erro ao fechar serviço de sentimento: {str(e)}")
+    
+    @staticmethod
+    def _build_sentiment_cache(sentiment_config: Dict[str, Any]) -> Optional[SentimentCache]:
+        """
+        Cria o cache de resultados de sentimento a partir da configuração
+        
+        A camada persistente (tabela sentiment_analysis) só é usada com
+        persist_cache habilitado; o banco é importado apenas nesse caso.
+        """
+        cache_size = sentiment_config.get('cache_size', 10000)
+        session_factory = None
+        if sentiment_config.get('persist_cache', False):
+            from config.database import get_db_session
+            session_factory = get_db_session
+        
+        if cache_size <= 0 and session_factory is None:
+            return None
+        return SentimentCache(max_entries=cache_size, session_factory=session_factory)
+    
     def _convert_to_sentiment_news_item(self, news_item: EnhancedNewsItem) -> SentimentEnhancedNewsItem:
         """
         Converte um EnhancedNewsItem para SentimentEnhancedNewsItem
@@ -122,16 +179,25 @@ class SentimentEnhancedContentCurator(EnhancedContentCurator):
             # Adiciona análise de sentimento
             logger.info("Adicionando análise de sentimento ao conteúdo")
             
-            # Analisa notícias
+            # Analisa em um único lote a manchete de cada cluster e o texto do
+            # artigo de cada fonte (executado no pool do serviço, sem bloquear o event loop)
+            texts = []
+            for item in enhanced_news:
+                headline = f"{item.title} {item.description}"
+                texts.append(headline)
+                for source in item.sources:
+                    # Fontes sem texto próprio usam a manchete (repetições são analisadas uma vez)
+                    texts.append(f"{source.title} {source.description or ''}" if source.title else headline)
+            analyses = await self.sentiment_service.analyze_batch_async(texts)
+            
+            offset = 0
             for item in enhanced_news:
-                # Analisa o conteúdo da notícia
-                text_to_analyze = f"{item.title} {item.description}"
-                analysis = self.sentiment_service.analyze_text(text_to_analyze)
+                analysis = analyses[offset]
+                source_analyses = analyses[offset + 1:offset + 1 + len(item.sources)]
+                offset += 1 + len(item.sources)
                 
-                # Se tivermos múltiplas fontes, analisa cada uma
                 sources_sentiment = []
-                for source in item.sources:
-                    source_analysis = self.sentiment_service.analyze_text(source.name)
+                for source, source_analysis in zip(item.sources, source_analyses):
                     source_sentiment = SourceSentimentInfo(
                         source_name=source.name,
                         sentiment=source_analysis['sentiment'],
@@ -141,15 +207,26 @@ class SentimentEnhancedContentCurator(EnhancedContentCurator):
                     )
                     sources_sentiment.append(source_sentiment)
                 
+                # Variância e consenso entre as fontes, como em analyze_news_cluster
+                cluster_summary = self.sentiment_service.summarize_sources([
+                    {'source': source.name, **source_analysis}
+                    for source, source_analysis in zip(item.sources, source_analyses)
+                ])
+                most_positive = cluster_summary['most_positive_source']
+                most_negative = cluster_summary['most_negative_source']
+                
                 # Cria análise de sentimento completa
                 content_analysis = ContentSentimentAnalysis(
                     overall_sentiment=analysis['sentiment'],
                     mean_polarity=analysis['polarity'],
-                    sentiment_variance=0.0,  # Calculado se houver múltiplas fontes
-                    consensus_level='high',  # Padrão se houver apenas uma fonte
-                    has_divergent_views=False,
-                    most_positive_source=max(sources_sentiment, key=lambda x: x.polarity).source_name if sources_sentiment else None,
-                    most_negative_source=min(sources_sentiment, key=lambda x: x.polarity).source_name if sources_sentiment else None,
+                    sentiment_variance=cluster_summary['sentiment_variance'],
+                    consensus_level=cluster_summary['consensus_level'],
+                    has_divergent_views=(
+                        cluster_summary['consensus_level'] != 'high'
+                        and most_positive is not None and most_negative is not None
+                    ),
+                    most_positive_source=most_positive['source'] if most_positive else None,
+                    most_negative_source=most_negative['source'] if most_negative else None,
                     sources_sentiment=sources_sentiment
                 )
                 
@@ -184,6 +261,48 @@ class SentimentEnhancedContentCurator(EnhancedContentCurator):
                 metadata={"error": str(e)}
             )
     
+    async def get_snapshot_content(self, curation_request: Dict,
+                                   snapshot_service) -> Optional[SentimentEnhancedCuratedContent]:
+        """
+        Monta o conteúdo curado a partir do snapshot mais recente, sem executar o pipeline
+        
+        Args:
+            curation_request: Requisição de curadoria com parâmetros
+            snapshot_service: SnapshotService que lê os snapshots materializados pelo coletor
+            
+        Returns:
+            Conteúdo curado, ou None se não há snapshot recente (o chamador usa o pipeline ao vivo)
+        """
+        snapshot = await snapshot_service.load(curation_request)
+        if snapshot is None:
+            return None
+        
+        include_sentiment = curation_request.get('include_sentiment', True)
+        keywords = curation_request.get('keywords')
+        news = []
+        for payload in snapshot['news']:
+            item = SentimentEnhancedNewsItem(**payload)
+            # Como no pipeline ao vivo, os itens trazem as palavras-chave da requisição
+            item.keywords = keywords
+            if not include_sentiment:
+                item.sentiment_analysis = None
+            news.append(item)
+        repos = [EnhancedRepo(**payload) for payload in snapshot['repos']]
+        
+        return SentimentEnhancedCuratedContent(
+            news=news,
+            papers=[],  # Sem papers por enquanto
+            repos=repos,
+            sentiment_summary=self._create_sentiment_summary(news, []) if include_sentiment else None,
+            timestamp=datetime.now().isoformat(),
+            metadata={
+                "source": "snapshot",
+                "snapshot_id": snapshot['snapshot_id'],
+                "snapshot_created_at": snapshot['created_at'].isoformat(),
+                "request": curation_request.get('metadata', {})
+            }
+        )
+    
     def _create_sentiment_summary(self, news_items, papers) -> Dict[str, Any]:
         """
         Cria um resumo global da análise de sentimento
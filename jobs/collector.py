@@ -7,7 +7,10 @@ from typing import List, Dict, Any, Optional
 from models.database import CollectionJob, News
 from repositories.news_repository import NewsRepository
 from services.news_service import NewsService
+from services.cluster_service import IncrementalClusteringService
 from config.database import get_db_session
+from config.settings import get_settings
+from utils.feed_cache import FeedCache
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +19,10 @@ class NewsCollectorJob:
     
     def __init__(self, rss_urls: List[str]):
         self.rss_urls = rss_urls
-        self.news_service = NewsService(rss_urls)
+        self.news_service = NewsService(
+            rss_urls,
+            feed_cache=FeedCache(get_settings().feed_cache_dir)
+        )
     
     async def run(self):
         """Executa o job de coleta."""
@@ -37,28 +43,26 @@ class NewsCollectorJob:
                 news_items = await self.news_service.get_top_news(100)  # Coletamos mais para ter variedade
                 
                 # Processar e salvar
-                saved_count = 0
+                items = []
                 for item in news_items:
-                    # Verificar se já existe
-                    existing = news_repo.find_by_title_and_source(item.title, item.source)
-                    if not existing:
-                        # Nova notícia, criar objeto e salvar
-                        news_db = News(
-                            title=item.title,
-                            description=item.description,
-                            link=item.link,
-                            source_name=item.source,
-                            read_time=item.read_time,
-                            published_date=item.additional_info.get('published_date') if item.additional_info else None,
-                            author=item.additional_info.get('author') if item.additional_info else None
-                        )
-                        
-                        # Extrair palavras-chave
-                        extracted_keywords = self._extract_keywords(item)
-                        
-                        # Salvar
-                        news_repo.save_with_keywords(news_db, extracted_keywords)
-                        saved_count += 1
+                    news_db = News(
+                        title=item.title,
+                        description=item.description,
+                        link=item.link,
+                        source_name=item.source,
+                        read_time=item.read_time,
+                        published_date=item.additional_info.get('published_date') if item.additional_info else None,
+                        author=item.additional_info.get('author') if item.additional_info else None,
+                        importance_score=item.additional_info.get('importance_score') if item.additional_info else None
+                    )
+                    items.append((news_db, self._extract_keywords(item)))
+                
+                # Salvar o lote; notícias já existentes são descartadas em uma única consulta
+                saved_news = news_repo.bulk_ingest(items, commit=False)
+                
+                # Atribui as notícias novas aos clusters persistidos
+                IncrementalClusteringService(session).assign(saved_news)
+                saved_count = len(saved_news)
                 
                 # Atualizar status do job
                 job.status = "completed"
@@ -69,7 +73,8 @@ class NewsCollectorJob:
                 logger.info(f"Coleta de notícias concluída. Salvas {saved_count} novas notícias.")
                 
             except Exception as e:
-                # Registrar erro
+                # Registrar erro (descartando o lote não confirmado)
+                session.rollback()
                 if job:
                     job.status = "failed"
                     job.end_time = datetime.utcnow()
@@ -0,0 +1,111 @@
+# jobs/rescore_importance.py
+import argparse
+import logging
+from datetime import datetime
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+from models.database import CollectionJob
+from repositories.news_repository import NewsRepository
+from config.database import get_db_session
+from utils.text_vectors import build_tfidf_vectorizer, normalize_scores, raw_importance_scores, term_importance
+
+logger = logging.getLogger(__name__)
+
+class ImportanceRescoreJob:
+    """Job para recalcular a pontuação de importância das notícias armazenadas."""
+
+    def __init__(self, time_window_hours: int = 168, chunk_size: int = 1000):
+        self.time_window_hours = time_window_hours
+        self.chunk_size = chunk_size
+
+    def _chunks(self, news_repo: NewsRepository, max_id: int) -> Iterator[Tuple[List[int], List[str]]]:
+        """Lotes (ids, textos) das notícias da janela, lidos do banco a cada passada"""
+        ids, texts = [], []
+        for news_id, text in news_repo.iter_texts_for_scoring(self.time_window_hours, self.chunk_size, max_id):
+            ids.append(news_id)
+            texts.append(text)
+            if len(ids) == self.chunk_size:
+                yield ids, texts
+                ids, texts = [], []
+        if ids:
+            yield ids, texts
+
+    def run(self) -> int:
+        """
+        Executa o recálculo.
+
+        Apenas um lote de textos fica em memória por vez; a janela (limitada ao
+        maior id no início do job) é lida três vezes:
+        1. o vetorizador TF-IDF é ajustado uma única vez sobre o fluxo de textos;
+        2. cada lote é transformado para acumular o peso médio de cada termo;
+        3. cada lote é transformado e pontuado com o caminho esparso.
+        Só os ids e as pontuações brutas (float32) são mantidos até a
+        normalização global, e as pontuações são gravadas em lotes.
+
+        Returns:
+            Número de notícias atualizadas
+        """
+        with get_db_session() as session:
+            job = CollectionJob(job_type="rescore_importance", status="running")
+            session.add(job)
+            session.commit()
+
+            try:
+                news_repo = NewsRepository(session)
+                updated = 0
+                max_id = news_repo.latest_id_for_scoring(self.time_window_hours)
+                if max_id is not None:
+                    vectorizer = build_tfidf_vectorizer()
+                    vectorizer.fit(text for _, texts in self._chunks(news_repo, max_id) for text in texts)
+
+                    column_sums = np.zeros(len(vectorizer.vocabulary_), dtype=np.float64)
+                    n_docs = 0
+                    for _, texts in self._chunks(news_repo, max_id):
+                        x = vectorizer.transform(texts)
+                        column_sums += np.asarray(x.sum(axis=0)).ravel()
+                        n_docs += x.shape[0]
+                    term_weights = term_importance(column_sums, n_docs)
+
+                    chunk_ids, chunk_scores = [], []
+                    for ids, texts in self._chunks(news_repo, max_id):
+                        chunk_ids.append(np.asarray(ids, dtype=np.int64))
+                        chunk_scores.append(raw_importance_scores(vectorizer.transform(texts), term_weights))
+                    ids = np.concatenate(chunk_ids)
+                    scores = normalize_scores(np.concatenate(chunk_scores))
+
+                    for start in range(0, len(ids), self.chunk_size):
+                        batch = slice(start, start + self.chunk_size)
+                        updated += news_repo.update_importance_scores(
+                            dict(zip(ids[batch].tolist(), scores[batch].tolist()))
+                        )
+
+                job.status = "completed"
+                job.end_time = datetime.utcnow()
+                job.items_collected = updated
+                session.commit()
+
+                logger.info(f"Recálculo de importância concluído. {updated} notícias atualizadas.")
+                return updated
+
+            except Exception as e:
+                job.status = "failed"
+                job.end_time = datetime.utcnow()
+                job.error_message = str(e)
+                session.commit()
+
+                logger.error(f"Erro no recálculo de importância: {str(e)}", exc_info=True)
+                return 0
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    parser = argparse.ArgumentParser(description='Recalcula a importância das notícias armazenadas.')
+    parser.add_argument('--hours', type=int, default=168, help='Janela de notícias em horas (default: 168)')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='Linhas lidas por lote (default: 1000)')
+    args = parser.parse_args()
+
+    ImportanceRescoreJob(args.hours, args.chunk_size).run()
@@ -0,0 +1,112 @@
+# jobs/rescore_sentiment.py
+import argparse
+import logging
+from datetime import datetime
+from typing import Optional
+
+from models.database import CollectionJob
+from repositories.sentiment_repository import SentimentRepository
+from services.sentiment_service import SentimentAnalysisService
+from config.database import get_db_session
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+class SentimentRescoreJob:
+    """Job para recalcular o sentimento dos conteúdos armazenados."""
+
+    def __init__(self, sentiment_type: Optional[str] = None, chunk_size: int = 2000,
+                 content_type: Optional[str] = None, validate: int = 0, tolerance: float = 0.05):
+        """
+        Args:
+            sentiment_type: Analisador a usar (None usa o configurado em settings.sentiment)
+            chunk_size: Conteúdos lidos, pontuados e gravados por lote
+            content_type: Restringe a um tipo de conteúdo ('news', 'paper', 'repo')
+            validate: Textos do primeiro lote comparados com a análise texto a texto (0 desativa)
+            tolerance: Diferença de polaridade aceita na validação
+        """
+        sentiment_config = get_settings().sentiment
+        self.service = SentimentAnalysisService(
+            sentiment_type or sentiment_config.type,
+            language=sentiment_config.language,
+            batch_size=sentiment_config.batch_size,
+            model_dir=sentiment_config.model_dir,
+            num_threads=sentiment_config.num_threads,
+            workers=1
+        )
+        self.chunk_size = chunk_size
+        self.content_type = content_type
+        self.validate = validate
+        self.tolerance = tolerance
+
+    def run(self) -> int:
+        """
+        Executa o recálculo.
+
+        Os conteúdos são lidos em lotes (apenas id e texto), pontuados de uma vez
+        com SentimentAnalysisService.analyze_bulk e gravados com commit por lote,
+        de modo que uma falha no meio preserva os lotes já concluídos.
+
+        Returns:
+            Número de conteúdos atualizados
+        """
+        with get_db_session() as session:
+            job = CollectionJob(job_type="rescore_sentiment", status="running")
+            session.add(job)
+            session.commit()
+
+            try:
+                sentiment_repo = SentimentRepository(session)
+                analyzer = self.service.analyzer_id
+                updated = 0
+                for chunk in sentiment_repo.iter_content_chunks(self.chunk_size, self.content_type):
+                    ids = [content_id for content_id, _ in chunk]
+                    texts = [text for _, text in chunk]
+
+                    if self.validate and updated == 0:
+                        report = self.service.validate_bulk(texts[:self.validate], self.tolerance)
+                        logger.info(
+                            f"Validação do lote vetorizado: {report['texts']} textos, "
+                            f"erro médio {report['mean_abs_error']:.4f}, máximo {report['max_abs_error']:.4f}, "
+                            f"{report['within_tolerance']:.1%} dentro da tolerância, "
+                            f"{report['label_agreement']:.1%} de concordância de rótulos"
+                        )
+
+                    results = self.service.analyze_bulk(texts)
+                    updated += sentiment_repo.upsert_for_content(dict(zip(ids, results)), analyzer)
+                    logger.info(f"{updated} conteúdos re-pontuados ({analyzer})")
+
+                job.status = "completed"
+                job.end_time = datetime.utcnow()
+                job.items_collected = updated
+                session.commit()
+
+                logger.info(f"Recálculo de sentimento concluído. {updated} conteúdos atualizados.")
+                return updated
+
+            except Exception as e:
+                session.rollback()
+                job.status = "failed"
+                job.end_time = datetime.utcnow()
+                job.error_message = str(e)
+                session.commit()
+
+                logger.error(f"Erro no recálculo de sentimento: {str(e)}", exc_info=True)
+                return 0
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    parser = argparse.ArgumentParser(description='Recalcula o sentimento dos conteúdos armazenados.')
+    parser.add_argument('--sentiment-type', default=None, help='basic, vader, bert ou bert_int8 (default: configurado)')
+    parser.add_argument('--content-type', default=None, help='Restringe a news, paper ou repo')
+    parser.add_argument('--chunk-size', type=int, default=2000, help='Conteúdos por lote (default: 2000)')
+    parser.add_argument('--validate', type=int, default=0,
+                        help='Compara N textos do primeiro lote com a análise texto a texto (default: 0)')
+    parser.add_argument('--tolerance', type=float, default=0.05, help='Tolerância de polaridade na validação')
+    args = parser.parse_args()
+
+    SentimentRescoreJob(args.sentiment_type, args.chunk_size, args.content_type,
+                        args.validate, args.tolerance).run()
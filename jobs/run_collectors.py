@@ -10,13 +10,17 @@ from services.news_service import NewsService
 from services.github_service import GitHubScanner
 from services.research_service import ResearchService
 from services.event_service import EventsService
+from services.cluster_service import IncrementalClusteringService
+from services.snapshot_service import SnapshotService
+from utils.feed_cache import FeedCache
+from utils.fingerprint import link_fingerprint
 
 # Importações de configuração
 from config.settings import get_settings
 from config.database import get_db_session
 
 # Importações de modelos
-from models.database import CollectionJob, News, Repository, Keyword
+from models.database import CollectionJob, Content, News, Repository, Keyword
 
 # Importações de repositórios
 from repositories.news_repository import NewsRepository
@@ -43,7 +47,10 @@ class ContentCollector:
         self.settings = config or get_settings()
         
         # Inicializa serviços
-        self.news_service = NewsService(self.settings.rss_feeds)
+        self.news_service = NewsService(
+            self.settings.rss_feeds,
+            feed_cache=FeedCache(self.settings.feed_cache_dir)
+        )
         self.github_python_scanner = GitHubScanner(
             self.settings.github_python_url, 
             top_n=10
@@ -57,6 +64,16 @@ class ContentCollector:
         )
         self.events_service = EventsService()
         
+        # Snapshots de curadoria servidos pela API (serving_mode='snapshot')
+        self.snapshot_service = None
+        self.curator = None
+        if self.settings.serving_mode == 'snapshot':
+            self.snapshot_service = SnapshotService(
+                get_db_session,
+                self.settings.snapshot.max_age_hours,
+                self.settings.snapshot.keep
+            )
+        
         # Configurações de coleta
         self.collection_interval = timedelta(hours=4)  # Coleta a cada 4 horas
         self.max_retries = 3
@@ -84,37 +101,39 @@ class ContentCollector:
             
             # Inicializa repositório de notícias
             news_repo = NewsRepository(session)
-            saved_count = 0
+            items = []
             
             for item in news_items:
-                # Verifica se a notícia já existe
-                existing_news = news_repo.find_by_title_and_source(item.title, item.source)
+                # Cria objeto de notícia para salvar
+                news = News(
+                    title=item.title,
+                    description=item.description,
+                    link=item.link,
+                    source_name=item.source,
+                    read_time=item.read_time,
+                    published_date=item.additional_info.get('published_date') if item.additional_info else None,
+                    author=item.additional_info.get('author') if item.additional_info else None,
+                    importance_score=item.additional_info.get('importance_score') if item.additional_info else None
+                )
                 
-                if not existing_news:
-                    # Cria objeto de notícia para salvar
-                    news = News(
-                        title=item.title,
-                        description=item.description,
-                        link=item.link,
-                        source_name=item.source,
-                        read_time=item.read_time,
-                        published_date=item.additional_info.get('published_date') if item.additional_info else None,
-                        author=item.additional_info.get('author') if item.additional_info else None
-                    )
-                    
-                    # Extrai palavras-chave
-                    keywords = []
-                    if item.additional_info and 'categories' in item.additional_info:
-                        keywords = item.additional_info['categories']
-                    
-                    # Se não tiver categorias, gera palavras-chave simples
-                    if not keywords:
-                        # Método simples de extração de palavras-chave
-                        keywords = [word.lower() for word in item.title.split() if len(word) > 3][:5]
-                    
-                    # Salva notícia com palavras-chave usando o método do repositório
-                    news_repo.save_with_keywords(news, keywords)
-                    saved_count += 1
+                # Extrai palavras-chave
+                keywords = []
+                if item.additional_info and 'categories' in item.additional_info:
+                    keywords = item.additional_info['categories']
+                
+                # Se não tiver categorias, gera palavras-chave simples
+                if not keywords:
+                    # Método simples de extração de palavras-chave
+                    keywords = [word.lower() for word in item.title.split() if len(word) > 3][:5]
+                
+                items.append((news, keywords))
+            
+            # Salva o lote (deduplicação, palavras-chave e notícias) sem commit intermediário
+            saved_news = news_repo.bulk_ingest(items, commit=False)
+            
+            # Atribui as notícias novas aos clusters persistidos
+            IncrementalClusteringService(session).assign(saved_news)
+            saved_count = len(saved_news)
             
             # Atualiza status do job
             job.status = "completed"
@@ -126,7 +145,8 @@ class ContentCollector:
         
         except Exception as e:
             logger.error(f"Erro na coleta de notícias: {str(e)}", exc_info=True)
-            # Em caso de erro, atualiza status do job
+            # Em caso de erro, descarta o lote e atualiza status do job
+            session.rollback()
             job.status = "failed"
             job.end_time = datetime.utcnow()
             job.error_message = str(e)
@@ -151,8 +171,10 @@ class ContentCollector:
             session.commit()
             
             # Coleta repositórios Python e JavaScript
-            python_repos = await self.github_python_scanner.get_trending_repos()
-            js_repos = await self.github_js_scanner.get_trending_repos()
+            python_repos, js_repos = await asyncio.gather(
+                self.github_python_scanner.get_trending_repos(),
+                self.github_js_scanner.get_trending_repos()
+            )
             
             # Combina repositórios
             all_repos = python_repos + js_repos
@@ -162,11 +184,9 @@ class ContentCollector:
             saved_count = 0
             
             for repo in all_repos:
-                # Verifica se o repositório já existe
-                existing_repo = session.query(Repository).filter_by(
-                    title=repo.name, 
-                    link=repo.link
-                ).first()
+                # Verifica se o repositório já existe (índice único de fingerprint)
+                fingerprint = link_fingerprint('repo', repo.name, repo.link)
+                existing_repo = session.query(Content.id).filter(Content.fingerprint == fingerprint).first()
                 
                 if not existing_repo:
                     # Cria novo repositório
@@ -175,12 +195,13 @@ class ContentCollector:
                         description=repo.summary,
                         link=repo.link,
                         source_name=repo.source or "GitHub",
+                        fingerprint=fingerprint,
                         type='repo'
                     )
                     
-                    # Salva repositório
-                    repo_repo.create(repository)
-                    saved_count += 1
+                    # Salva repositório (ignorando se outro coletor gravou antes)
+                    if repo_repo.create_if_absent(repository):
+                        saved_count += 1
             
             # Atualiza status do job
             job.status = "completed"
@@ -224,11 +245,9 @@ class ContentCollector:
             saved_count = 0
             
             for paper in research_papers:
-                # Verifica se o paper já existe
-                existing_paper = session.query(Repository).filter_by(
-                    title=paper.title, 
-                    link=paper.link
-                ).first()
+                # Verifica se o paper já existe (índice único de fingerprint)
+                fingerprint = link_fingerprint('paper', paper.title, paper.link)
+                existing_paper = session.query(Content.id).filter(Content.fingerprint == fingerprint).first()
                 
                 if not existing_paper:
                     # Cria novo paper
@@ -237,12 +256,13 @@ class ContentCollector:
                         description=paper.abstract,
                         link=paper.link,
                         source_name=paper.publication,
+                        fingerprint=fingerprint,
                         type='paper'
                     )
                     
-                    # Salva paper
-                    paper_repo.create(repository)
-                    saved_count += 1
+                    # Salva paper (ignorando se outro coletor gravou antes)
+                    if paper_repo.create_if_absent(repository):
+                        saved_count += 1
             
             # Atualiza status do job
             job.status = "completed"
@@ -286,11 +306,9 @@ class ContentCollector:
             saved_count = 0
             
             for event in events:
-                # Verifica se o evento já existe
-                existing_event = session.query(Repository).filter_by(
-                    title=event.title, 
-                    link=event.location
-                ).first()
+                # Verifica se o evento já existe (índice único de fingerprint)
+                fingerprint = link_fingerprint('event', event.title, event.location)
+                existing_event = session.query(Content.id).filter(Content.fingerprint == fingerprint).first()
                 
                 if not existing_event:
                     # Cria novo evento
@@ -299,12 +317,13 @@ class ContentCollector:
                         description=event.description,
                         link=event.location,
                         source_name="AIEvents",
+                        fingerprint=fingerprint,
                         type='event'
                     )
                     
-                    # Salva evento
-                    event_repo.create(repository)
-                    saved_count += 1
+                    # Salva evento (ignorando se outro coletor gravou antes)
+                    if event_repo.create_if_absent(repository):
+                        saved_count += 1
             
             # Atualiza status do job
             job.status = "completed"
@@ -322,6 +341,52 @@ class ContentCollector:
             job.error_message = str(e)
             session.commit()
     
+    async def materialize_snapshot(self, session):
+        """
+        Executa a curadoria completa (ranking, clustering e sentimento) e grava
+        o snapshot servido pela API
+        
+        Args:
+            session: Sessão do banco de dados
+        """
+        try:
+            logger.info("Iniciando materialização do snapshot de curadoria")
+            
+            # Criar job de coleta
+            job = CollectionJob(
+                job_type="snapshot",
+                status="running"
+            )
+            session.add(job)
+            session.commit()
+            
+            if self.curator is None:
+                # Importado aqui: carrega o curador (e o analisador de sentimento) apenas neste modo
+                from curators.sentiment_curator import SentimentEnhancedContentCurator
+                self.curator = SentimentEnhancedContentCurator(self.settings.CURATOR_CONFIG)
+            
+            snapshot_id = await self.snapshot_service.materialize(
+                self.curator,
+                max_news=self.settings.snapshot.max_news,
+                max_repos=self.settings.snapshot.max_repos
+            )
+            
+            # Atualiza status do job
+            job.status = "completed" if snapshot_id is not None else "failed"
+            job.end_time = datetime.utcnow()
+            job.error_message = None if snapshot_id is not None else "curadoria sem conteúdo"
+            session.commit()
+            
+            logger.info(f"Materialização do snapshot concluída (snapshot: {snapshot_id})")
+        
+        except Exception as e:
+            logger.error(f"Erro na materialização do snapshot: {str(e)}", exc_info=True)
+            # Em caso de erro, atualiza status do job
+            job.status = "failed"
+            job.end_time = datetime.utcnow()
+            job.error_message = str(e)
+            session.commit()
+    
     async def run_collectors(self):
         """
         Executa todos os coletores periodicamente
@@ -342,6 +407,10 @@ class ContentCollector:
                         )
                     except Exception as parallel_error:
                         logger.error(f"Erro em coletas paralelas: {str(parallel_error)}", exc_info=True)
+                    
+                    # Depois da coleta, com os caches de feeds recém-atualizados
+                    if self.snapshot_service is not None:
+                        await self.materialize_snapshot(session)
                 
                 # Aguarda até o próximo ciclo de coleta
                 logger.info(f"Próxima coleta em {self.collection_interval}")
@@ -7,6 +7,8 @@ class ContentSource(BaseModel):
     link: str
     published_date: Optional[str] = None
     author: Optional[str] = None
+    title: Optional[str] = None  # Título do artigo nesta fonte
+    description: Optional[str] = None  # Descrição do artigo nesta fonte
 
 class NewsItem(BaseModel):
     title: str
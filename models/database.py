@@ -1,11 +1,21 @@
 # models/database.py
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Table, Boolean, Text, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Table, Boolean, Text, JSON, Index, Computed, UniqueConstraint
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 import datetime
 
 Base = declarative_base()
 
+# Configuração de busca textual do PostgreSQL usada em content.search_vector e nas consultas
+SEARCH_CONFIG = 'english'
+
+# Título (peso A) e descrição (peso B) indexados para busca textual
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+
 # Tabela de associação entre conteúdo e palavras-chave
 content_keywords = Table(
     'content_keywords',
@@ -22,14 +32,21 @@ class Content(Base):
     description = Column(Text)
     link = Column(String(1000))
     source_name = Column(String(255))
+    fingerprint = Column(String(64), unique=True, index=True)  # Chave de deduplicação (utils/fingerprint.py)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
     type = Column(String(50))  # Para discriminação de tipo (news, paper, repo)
+    # Coluna gerada pelo banco (não carregada com o objeto), com índice GIN para busca textual
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True)))
     
     # Relacionamentos
     keywords = relationship("Keyword", secondary=content_keywords, back_populates="content_items")
     sentiment_analysis = relationship("SentimentAnalysis", back_populates="content", uselist=False)
     
+    __table_args__ = (
+        Index('ix_content_search_vector', 'search_vector', postgresql_using='gin'),
+    )
+    
     __mapper_args__ = {
         'polymorphic_identity': 'content',
         'polymorphic_on': type
@@ -42,6 +59,7 @@ class News(Content):
     read_time = Column(Integer)
     published_date = Column(DateTime)
     author = Column(String(255))
+    importance_score = Column(Float)  # Pontuação TF-IDF de importância (0 a 1)
     cluster_id = Column(Integer, ForeignKey('news_clusters.id'))
     primary_source = Column(Boolean, default=False)  # Se é a fonte primária no cluster
     
@@ -56,12 +74,26 @@ class News(Content):
 class NewsCluster(Base):
     __tablename__ = 'news_clusters'
     id = Column(Integer, primary_key=True)
+    title = Column(String(500))  # Título da notícia que originou o cluster
     relevance_score = Column(Float)
+    size = Column(Integer, default=0)
+    signature = Column(JSON)  # Assinatura MinHash da notícia líder
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow, index=True)
     
     # Relacionamentos
     news_items = relationship("News", back_populates="cluster")
+    bands = relationship("NewsClusterBand", back_populates="cluster", cascade="all, delete-orphan")
+
+# Chaves LSH dos clusters (busca de candidatos por índice)
+class NewsClusterBand(Base):
+    __tablename__ = 'news_cluster_bands'
+    id = Column(Integer, primary_key=True)
+    cluster_id = Column(Integer, ForeignKey('news_clusters.id'), nullable=False, index=True)
+    band_key = Column(String(32), nullable=False, index=True)
+    
+    # Relacionamentos
+    cluster = relationship("NewsCluster", back_populates="bands")
 
 # Papers de pesquisa
 class ResearchPaper(Content):
@@ -104,15 +136,53 @@ class SentimentAnalysis(Base):
     __tablename__ = 'sentiment_analysis'
     id = Column(Integer, primary_key=True)
     content_id = Column(Integer, ForeignKey('content.id'))
+    text_hash = Column(String(64), index=True)  # sha256 do texto normalizado (cache de resultados)
+    analyzer = Column(String(200))  # tipo de análise e modelo que produziram o resultado
     sentiment = Column(String(50))  # positive, negative, neutral
     polarity = Column(Float)
     subjectivity = Column(Float)
     confidence = Column(Float)
+    detailed_scores = Column(JSON(none_as_null=True))  # scores negativo/neutro/positivo do VADER (None nos demais)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     
+    # Um resultado de cache por texto e analisador (linhas por conteúdo ficam sem hash)
+    __table_args__ = (
+        UniqueConstraint('text_hash', 'analyzer', name='uq_sentiment_analysis_text_hash_analyzer'),
+    )
+    
     # Relacionamentos
     content = relationship("Content", back_populates="sentiment_analysis")
 
+# Snapshots de curadoria (ranqueados, agrupados e com sentimento) gerados pelo coletor
+class CuratedSnapshot(Base):
+    __tablename__ = 'curated_snapshots'
+    id = Column(Integer, primary_key=True)
+    analyzer = Column(String(200))  # analisador de sentimento usado na materialização
+    news_count = Column(Integer, default=0)
+    repos_count = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)
+    
+    # Relacionamentos
+    items = relationship("SnapshotItem", back_populates="snapshot", cascade="all, delete-orphan")
+
+# Itens de um snapshot, na ordem de ranking
+class SnapshotItem(Base):
+    __tablename__ = 'snapshot_items'
+    id = Column(Integer, primary_key=True)
+    snapshot_id = Column(Integer, ForeignKey('curated_snapshots.id', ondelete='CASCADE'), nullable=False)
+    kind = Column(String(20), nullable=False)  # news, repo
+    rank = Column(Integer, nullable=False)  # posição no ranking do snapshot (0 = mais relevante)
+    terms = Column(ARRAY(Text))  # termos (minúsculos) do título e descrição, para filtro por palavra-chave
+    payload = Column(JSON, nullable=False)  # item serializado como na resposta da API
+    
+    # Relacionamentos
+    snapshot = relationship("CuratedSnapshot", back_populates="items")
+    
+    __table_args__ = (
+        Index('ix_snapshot_items_snapshot_kind_rank', 'snapshot_id', 'kind', 'rank'),
+        Index('ix_snapshot_items_terms', 'terms', postgresql_using='gin'),
+    )
+
 # Registros de coleta
 class CollectionJob(Base):
     __tablename__ = 'collection_jobs'
@@ -1,4 +1,5 @@
 # repositories/base_repository.py
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import Generic, TypeVar, Type, List, Optional, Dict, Any
 
@@ -26,6 +27,25 @@ class BaseRepository(Generic[T]):
         self.session.refresh(entity)
         return entity
     
+    def create_if_absent(self, entity: T) -> Optional[T]:
+        """
+        Cria a entidade, a menos que ela viole uma restrição única (ex.: content.fingerprint).
+        
+        O insert é feito em um savepoint: um conflito, inclusive com outro
+        processo gravando ao mesmo tempo, descarta apenas esta entidade.
+        
+        Returns:
+            A entidade criada, ou None se já existia
+        """
+        try:
+            with self.session.begin_nested():
+                self.session.add(entity)
+        except IntegrityError:
+            return None
+        self.session.commit()
+        self.session.refresh(entity)
+        return entity
+    
     def update(self, id: int, data: Dict[str, Any]) -> Optional[T]:
         """Atualiza uma entidade existente."""
         entity = self.get_by_id(id)
@@ -0,0 +1,82 @@
+# repositories/cluster_repository.py
+from typing import List, Optional
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import desc, or_
+from datetime import datetime, timedelta
+
+from models.database import News, NewsCluster, NewsClusterBand
+from repositories.base_repository import BaseRepository
+
+class NewsClusterRepository(BaseRepository[NewsCluster]):
+    """Repositório para operações com clusters de notícias."""
+
+    def __init__(self, session: Session):
+        super().__init__(session, NewsCluster)
+
+    def find_candidates(self, band_keys: List[str], time_window_hours: int = 48) -> List[NewsCluster]:
+        """Busca clusters recentes que compartilham ao menos uma chave LSH."""
+        if not band_keys:
+            return []
+        time_threshold = datetime.utcnow() - timedelta(hours=time_window_hours)
+        return self.session.query(NewsCluster).join(
+            NewsCluster.bands
+        ).filter(
+            NewsClusterBand.band_key.in_(band_keys),
+            NewsCluster.updated_at >= time_threshold
+        ).distinct().all()
+
+    def create_for_news(self, news: News, signature: List[int], band_keys: List[str]) -> NewsCluster:
+        """Cria um cluster tendo a notícia como líder (sem commit)."""
+        cluster = NewsCluster(
+            title=news.title,
+            relevance_score=news.importance_score,
+            size=1,
+            signature=signature,
+            bands=[NewsClusterBand(band_key=key) for key in band_keys]
+        )
+        self.session.add(cluster)
+        self.session.flush()
+
+        news.cluster_id = cluster.id
+        news.primary_source = True
+        return cluster
+
+    def add_news(self, cluster: NewsCluster, news: News) -> NewsCluster:
+        """Adiciona uma notícia a um cluster existente (sem commit)."""
+        news.cluster_id = cluster.id
+        news.primary_source = False
+        cluster.size = (cluster.size or 0) + 1
+        if news.importance_score is not None:
+            # Relevância do cluster = maior importância entre suas notícias
+            cluster.relevance_score = max(cluster.relevance_score or 0.0, news.importance_score)
+        cluster.updated_at = datetime.utcnow()
+        return cluster
+
+    def get_top_clusters(self, limit: int = 10, time_window_hours: int = 48,
+                         keywords: Optional[List[str]] = None) -> List[NewsCluster]:
+        """
+        Busca os maiores clusters recentes com suas notícias.
+        
+        Com palavras-chave, mantém apenas clusters com alguma notícia cujo título
+        ou descrição contém uma delas (sem diferenciar maiúsculas, como o filtro ao vivo).
+        """
+        time_threshold = datetime.utcnow() - timedelta(hours=time_window_hours)
+        query = self.session.query(NewsCluster).options(
+            selectinload(NewsCluster.news_items)
+        ).filter(
+            NewsCluster.updated_at >= time_threshold
+        )
+        if keywords:
+            query = query.filter(NewsCluster.news_items.any(or_(*[
+                condition
+                for keyword in keywords
+                for condition in (
+                    News.title.icontains(keyword, autoescape=True),
+                    News.description.icontains(keyword, autoescape=True)
+                )
+            ])))
+        return query.order_by(
+            desc(NewsCluster.size),
+            desc(NewsCluster.relevance_score),
+            desc(NewsCluster.updated_at)
+        ).limit(limit).all()
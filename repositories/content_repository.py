@@ -0,0 +1,63 @@
+# repositories/content_repository.py
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from sqlalchemy import desc, func
+from sqlalchemy.orm import Query, Session
+
+from models.database import Content, SEARCH_CONFIG
+from repositories.base_repository import BaseRepository
+
+def keywords_tsquery(keywords: List[str]):
+    """
+    tsquery que casa com qualquer uma das palavras-chave.
+
+    Os termos de uma mesma palavra-chave são combinados com E ("machine
+    learning" -> 'machin' & 'learn') e as palavras-chave entre si com OU;
+    websearch_to_tsquery não falha com entradas malformadas.
+    """
+    text = ' or '.join(keyword.replace('"', ' ') for keyword in keywords)
+    return func.websearch_to_tsquery(SEARCH_CONFIG, text)
+
+def ranked_search(query: Query, keywords: List[str], max_age_hours: Optional[float] = None) -> Query:
+    """
+    Restringe a consulta aos conteúdos que casam com as palavras-chave
+    (índice GIN de content.search_vector) e ordena pela relevância.
+
+    Adiciona a coluna de relevância (ts_rank_cd) ao resultado.
+    """
+    tsquery = keywords_tsquery(keywords)
+    rank = func.ts_rank_cd(Content.search_vector, tsquery).label('rank')
+    query = query.add_columns(rank).filter(Content.search_vector.op('@@')(tsquery))
+    if max_age_hours is not None:
+        query = query.filter(Content.created_at >= datetime.utcnow() - timedelta(hours=max_age_hours))
+    return query.order_by(desc(rank), desc(Content.created_at))
+
+class ContentRepository(BaseRepository[Content]):
+    """Repositório para consultas sobre todos os tipos de conteúdo."""
+
+    def __init__(self, session: Session):
+        super().__init__(session, Content)
+
+    def search(self, keywords: List[str], content_type: Optional[str] = None, limit: int = 20,
+               max_age_hours: Optional[float] = None) -> List[Tuple[Content, float]]:
+        """
+        Busca textual ranqueada sobre o conteúdo armazenado.
+
+        Args:
+            keywords: Palavras-chave (um conteúdo casa se contém todos os termos de alguma delas)
+            content_type: Restringe a um tipo ('news', 'paper', 'repo', 'event')
+            limit: Máximo de resultados
+            max_age_hours: Ignora conteúdos mais antigos (None = todo o histórico)
+
+        Returns:
+            Pares (conteúdo, relevância), do mais relevante para o menos
+        """
+        if not keywords:
+            return []
+        query = self.session.query(Content)
+        if content_type:
+            query = query.filter(Content.type == content_type)
+        return [
+            (content, rank)
+            for content, rank in ranked_search(query, keywords, max_age_hours).limit(limit)
+        ]
@@ -1,11 +1,14 @@
 # repositories/news_repository.py
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func, insert
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime, timedelta
 
-from models.database import News, NewsCluster, Keyword, SentimentAnalysis
+from models.database import Content, News, NewsCluster, Keyword, SentimentAnalysis, content_keywords
 from repositories.base_repository import BaseRepository
+from repositories.content_repository import ranked_search
+from utils.fingerprint import news_fingerprint
 
 class NewsRepository(BaseRepository[News]):
     """Repositório para operações com notícias."""
@@ -14,12 +17,19 @@ class NewsRepository(BaseRepository[News]):
         super().__init__(session, News)
     
     def find_by_title_and_source(self, title: str, source: str) -> Optional[News]:
-        """Busca notícia por título e fonte para verificar duplicatas."""
+        """Busca notícia por título e fonte para verificar duplicatas (índice único de fingerprint)."""
         return self.session.query(News).filter(
-            News.title == title,
-            News.source_name == source
+            News.fingerprint == news_fingerprint(title, source)
         ).first()
     
+    def find_existing_fingerprints(self, fingerprints: Iterable[str]) -> set:
+        """Dos fingerprints informados, retorna os que já existem (uma consulta ao índice único)."""
+        fingerprints = list(set(fingerprints))
+        if not fingerprints:
+            return set()
+        rows = self.session.query(Content.fingerprint).filter(Content.fingerprint.in_(fingerprints))
+        return {fingerprint for (fingerprint,) in rows}
+    
     def find_similar_for_clustering(self, title: str, time_window_hours: int = 48) -> List[News]:
         """Busca notícias potencialmente similares para clustering."""
         time_threshold = datetime.utcnow() - timedelta(hours=time_window_hours)
@@ -43,6 +53,19 @@ class NewsRepository(BaseRepository[News]):
             desc(News.created_at)
         ).limit(limit).all()
     
+    def search_by_keywords(self, keywords: List[str], limit: int = 10,
+                           max_age_hours: Optional[float] = None) -> List[News]:
+        """
+        Busca textual ranqueada (título e descrição) sobre as notícias armazenadas.
+        
+        Diferente de get_by_keywords, não depende das palavras-chave gravadas na
+        coleta: usa o índice GIN de content.search_vector, com stemming.
+        """
+        if not keywords:
+            return []
+        query = self.session.query(News)
+        return [news for news, _ in ranked_search(query, keywords, max_age_hours).limit(limit)]
+    
     def get_by_sentiment(self, sentiment: str, limit: int = 10) -> List[News]:
         """Busca notícias com um sentimento específico."""
         return self.session.query(News).join(
@@ -54,7 +77,13 @@ class NewsRepository(BaseRepository[News]):
         ).limit(limit).all()
     
     def save_with_keywords(self, news: News, keywords: List[str]) -> News:
-        """Salva notícia com suas palavras-chave."""
+        """
+        Salva notícia com suas palavras-chave.
+        
+        Se outro processo gravou a mesma notícia (mesmo fingerprint) entre a
+        verificação e o commit, retorna a notícia já existente.
+        """
+        news.fingerprint = news.fingerprint or news_fingerprint(news.title, news.source_name)
         for keyword_text in keywords:
             # Busca ou cria palavra-chave
             keyword = self.session.query(Keyword).filter(Keyword.word == keyword_text).first()
@@ -66,6 +95,198 @@ class NewsRepository(BaseRepository[News]):
             news.keywords.append(keyword)
         
         self.session.add(news)
-        self.session.commit()
+        try:
+            self.session.commit()
+        except IntegrityError:
+            self.session.rollback()
+            existing = self.session.query(News).filter(News.fingerprint == news.fingerprint).first()
+            if existing is None:
+                raise
+            return existing
         self.session.refresh(news)
-        return news
\ No newline at end of file
+        return news
+    
+    def latest_id_for_scoring(self, time_window_hours: int = 168) -> Optional[int]:
+        """Maior id entre as notícias recentes (None se não houver nenhuma)."""
+        time_threshold = datetime.utcnow() - timedelta(hours=time_window_hours)
+        return self.session.query(func.max(News.id)).filter(News.created_at >= time_threshold).scalar()
+    
+    def iter_texts_for_scoring(self, time_window_hours: int = 168, chunk_size: int = 1000,
+                               max_id: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        """Percorre (id, texto) das notícias recentes em lotes (até max_id), sem carregar objetos ORM."""
+        time_threshold = datetime.utcnow() - timedelta(hours=time_window_hours)
+        query = self.session.query(News.id, News.title, News.description).filter(
+            News.created_at >= time_threshold
+        )
+        if max_id is not None:
+            query = query.filter(News.id <= max_id)
+        query = query.order_by(News.id).yield_per(chunk_size)
+        for news_id, title, description in query:
+            yield news_id, f"{title} {description or ''}"
+    
+    def update_importance_scores(self, scores: Dict[int, float]) -> int:
+        """Atualiza a pontuação de importância de várias notícias em lote."""
+        self.session.bulk_update_mappings(
+            News,
+            [{'id': news_id, 'importance_score': score} for news_id, score in scores.items()]
+        )
+        self.session.commit()
+        return len(scores)
+    
+    def _upsert_keywords(self, words: List[str]) -> Dict[str, Keyword]:
+        """
+        Garante que as palavras existam em keywords e retorna os objetos por palavra.
+        
+        No PostgreSQL (e SQLite) é um único INSERT ... ON CONFLICT DO NOTHING
+        seguido de um SELECT; em outros bancos, insere apenas as ausentes.
+        """
+        if not words:
+            return {}
+        dialect = self.session.get_bind().dialect.name
+        if dialect in ('postgresql', 'sqlite'):
+            if dialect == 'postgresql':
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            self.session.execute(
+                dialect_insert(Keyword).values([{'word': word} for word in words])
+                .on_conflict_do_nothing(index_elements=['word'])
+            )
+        else:
+            existing = {word for (word,) in self.session.query(Keyword.word).filter(Keyword.word.in_(words))}
+            missing = [{'word': word} for word in words if word not in existing]
+            if missing:
+                self.session.execute(insert(Keyword), missing)
+        
+        return {keyword.word: keyword for keyword in self.session.query(Keyword).filter(Keyword.word.in_(words))}
+    
+    def bulk_ingest(self, items: List[Tuple[News, List[str]]], commit: bool = True) -> List[News]:
+        """
+        Salva um lote de notícias com suas palavras-chave em poucas instruções.
+        
+        A deduplicação usa o fingerprint (título e fonte normalizados) e o
+        índice único de content.fingerprint: repetições dentro do lote são
+        descartadas em memória e, no PostgreSQL (e SQLite), as linhas de
+        content são inseridas com INSERT ... ON CONFLICT DO NOTHING, de modo
+        que coletores concorrentes nunca gravam a mesma notícia duas vezes.
+        O vocabulário de palavras-chave é inserido de uma vez (upsert) e as
+        linhas de news e content_keywords em lote.
+        
+        Args:
+            items: Pares (notícia ainda não persistida, palavras-chave)
+            commit: Se False, apenas faz flush (o chamador faz o commit junto
+                com o restante da transação, ex.: clustering e status do job)
+            
+        Returns:
+            Notícias inseridas (com id), na ordem do lote
+        """
+        batch = {}
+        for news, keywords in items:
+            news.fingerprint = news.fingerprint or news_fingerprint(news.title, news.source_name)
+            if news.fingerprint not in batch:
+                batch[news.fingerprint] = (news, list(dict.fromkeys(k for k in keywords if k)))
+        
+        if not batch:
+            return []
+        
+        words = sorted({word for _, keywords in batch.values() for word in keywords})
+        keywords_by_word = self._upsert_keywords(words)
+        
+        if self.session.get_bind().dialect.name in ('postgresql', 'sqlite'):
+            saved_news = self._insert_on_conflict_do_nothing(list(batch.values()), keywords_by_word)
+        else:
+            saved_news = self._insert_new(list(batch.values()), keywords_by_word)
+        
+        if commit:
+            self.session.commit()
+        return saved_news
+    
+    def _insert_on_conflict_do_nothing(self, items: List[Tuple[News, List[str]]],
+                                       keywords_by_word: Dict[str, Keyword]) -> List[News]:
+        """Insere content (ignorando fingerprints existentes), news e content_keywords em três instruções."""
+        if self.session.get_bind().dialect.name == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        
+        now = datetime.utcnow()
+        inserted = self.session.execute(
+            dialect_insert(Content.__table__).values([
+                {
+                    'type': 'news',
+                    'title': news.title,
+                    'description': news.description,
+                    'link': news.link,
+                    'source_name': news.source_name,
+                    'fingerprint': news.fingerprint,
+                    'created_at': now,
+                    'updated_at': now
+                }
+                for news, _ in items
+            ]).on_conflict_do_nothing(
+                index_elements=['fingerprint']
+            ).returning(Content.__table__.c.id, Content.__table__.c.fingerprint)
+        ).all()
+        if not inserted:
+            return []
+        
+        ids = {fingerprint: content_id for content_id, fingerprint in inserted}
+        new_items = [(ids[news.fingerprint], news, keywords) for news, keywords in items if news.fingerprint in ids]
+        
+        self.session.execute(insert(News.__table__), [
+            {
+                'id': content_id,
+                'read_time': news.read_time,
+                'published_date': news.published_date,
+                'author': news.author,
+                'importance_score': news.importance_score,
+                'cluster_id': news.cluster_id,
+                'primary_source': bool(news.primary_source)
+            }
+            for content_id, news, _ in new_items
+        ])
+        links = [
+            {'content_id': content_id, 'keyword_id': keywords_by_word[word].id}
+            for content_id, _, keywords in new_items
+            for word in keywords if word in keywords_by_word
+        ]
+        if links:
+            self.session.execute(content_keywords.insert(), links)
+        
+        loaded = {news.id: news for news in self.session.query(News).filter(News.id.in_(ids.values()))}
+        return [loaded[content_id] for content_id, _, _ in new_items]
+    
+    def _insert_new(self, items: List[Tuple[News, List[str]]],
+                    keywords_by_word: Dict[str, Keyword]) -> List[News]:
+        """
+        Caminho genérico (sem ON CONFLICT): descarta fingerprints existentes com
+        uma consulta e grava o lote em um savepoint; se outro processo inserir
+        a mesma notícia no meio tempo, regrava item a item ignorando conflitos.
+        """
+        existing = self.find_existing_fingerprints(news.fingerprint for news, _ in items)
+        new_items = [
+            (news, [keywords_by_word[word] for word in keywords if word in keywords_by_word])
+            for news, keywords in items if news.fingerprint not in existing
+        ]
+        
+        def add(news: News, keywords: List[Keyword]):
+            self.session.add(news)
+            news.keywords = keywords
+        
+        try:
+            with self.session.begin_nested():
+                for news, keywords in new_items:
+                    add(news, keywords)
+                self.session.flush()
+            return [news for news, _ in new_items]
+        except IntegrityError:
+            saved_news = []
+            for news, keywords in new_items:
+                try:
+                    with self.session.begin_nested():
+                        add(news, keywords)
+                        self.session.flush()
+                    saved_news.append(news)
+                except IntegrityError:
+                    continue
+            return saved_news
@@ -0,0 +1,126 @@
+# repositories/sentiment_repository.py
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+from sqlalchemy.orm import Session
+
+from models.database import Content, SentimentAnalysis
+from repositories.base_repository import BaseRepository
+
+class SentimentRepository(BaseRepository[SentimentAnalysis]):
+    """Repositório para resultados de análise de sentimento."""
+
+    def __init__(self, session: Session):
+        super().__init__(session, SentimentAnalysis)
+
+    def get_by_text_hashes(self, text_hashes: List[str], analyzer: str) -> Dict[str, SentimentAnalysis]:
+        """Busca resultados já calculados pelo hash do texto e analisador."""
+        if not text_hashes:
+            return {}
+        rows = self.session.query(SentimentAnalysis).filter(
+            SentimentAnalysis.text_hash.in_(text_hashes),
+            SentimentAnalysis.analyzer == analyzer
+        ).all()
+        return {row.text_hash: row for row in rows}
+
+    def save_results(self, results: Dict[str, Dict[str, Any]], analyzer: str) -> int:
+        """
+        Grava resultados indexados por hash de texto, ignorando os que já existem.
+
+        No PostgreSQL (e SQLite) é um único INSERT ... ON CONFLICT DO NOTHING
+        sobre a restrição única (text_hash, analyzer), seguro com outra requisição
+        ou o recálculo gravando o mesmo texto ao mesmo tempo; em outros bancos,
+        cada linha ausente é inserida em um savepoint.
+
+        Returns:
+            Número de linhas inseridas
+        """
+        if not results:
+            return 0
+        now = datetime.utcnow()
+        rows = [
+            {
+                'text_hash': text_hash,
+                'analyzer': analyzer,
+                'sentiment': result['sentiment'],
+                'polarity': result['polarity'],
+                'subjectivity': result['subjectivity'],
+                'confidence': result['confidence'],
+                'detailed_scores': result.get('detailed_scores'),
+                'created_at': now
+            }
+            for text_hash, result in results.items()
+        ]
+
+        dialect = self.session.get_bind().dialect.name
+        if dialect in ('postgresql', 'sqlite'):
+            if dialect == 'postgresql':
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            inserted = self.session.execute(
+                dialect_insert(SentimentAnalysis.__table__).values(rows)
+                .on_conflict_do_nothing(index_elements=['text_hash', 'analyzer'])
+            ).rowcount
+            self.session.commit()
+            return inserted
+
+        existing = self.get_by_text_hashes(list(results.keys()), analyzer)
+        return sum(
+            self.create_if_absent(SentimentAnalysis(**row)) is not None
+            for row in rows
+            if row['text_hash'] not in existing
+        )
+
+    def iter_content_chunks(self, chunk_size: int = 1000,
+                            content_type: Optional[str] = None) -> Iterator[List[Tuple[int, str]]]:
+        """
+        Percorre (id, texto) dos conteúdos em lotes, sem carregar objetos ORM.
+
+        A paginação é por id (keyset), então o chamador pode gravar e fazer
+        commit entre um lote e outro sem invalidar a leitura.
+        """
+        last_id = 0
+        while True:
+            query = self.session.query(Content.id, Content.title, Content.description).filter(
+                Content.id > last_id
+            )
+            if content_type:
+                query = query.filter(Content.type == content_type)
+            rows = query.order_by(Content.id).limit(chunk_size).all()
+            if not rows:
+                return
+            yield [(content_id, f"{title} {description or ''}") for content_id, title, description in rows]
+            last_id = rows[-1][0]
+
+    def upsert_for_content(self, results: Dict[int, Dict[str, Any]], analyzer: str) -> int:
+        """
+        Grava o resultado de sentimento de cada conteúdo, atualizando a linha
+        existente do conteúdo ou inserindo uma nova.
+
+        Returns:
+            Número de conteúdos gravados
+        """
+        if not results:
+            return 0
+        existing = dict(self.session.query(SentimentAnalysis.content_id, SentimentAnalysis.id).filter(
+            SentimentAnalysis.content_id.in_(list(results.keys()))
+        ).all())
+
+        updates, inserts = [], []
+        for content_id, result in results.items():
+            values = {
+                'analyzer': analyzer,
+                'sentiment': result['sentiment'],
+                'polarity': result['polarity'],
+                'subjectivity': result['subjectivity'],
+                'confidence': result['confidence']
+            }
+            if content_id in existing:
+                updates.append({'id': existing[content_id], **values})
+            else:
+                inserts.append({'content_id': content_id, **values})
+
+        self.session.bulk_update_mappings(SentimentAnalysis, updates)
+        self.session.bulk_insert_mappings(SentimentAnalysis, inserts)
+        self.session.commit()
+        return len(results)
@@ -0,0 +1,96 @@
+# repositories/snapshot_repository.py
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from models.database import CuratedSnapshot, SnapshotItem
+from repositories.base_repository import BaseRepository
+
+class SnapshotRepository(BaseRepository[CuratedSnapshot]):
+    """Repositório para snapshots de curadoria."""
+
+    def __init__(self, session: Session):
+        super().__init__(session, CuratedSnapshot)
+
+    def create_snapshot(self, news: List[Tuple[Dict[str, Any], List[str]]],
+                        repos: List[Tuple[Dict[str, Any], List[str]]],
+                        analyzer: Optional[str] = None) -> CuratedSnapshot:
+        """
+        Grava um snapshot e seus itens em uma única transação.
+
+        Args:
+            news: (payload, termos) de cada notícia, na ordem de ranking
+            repos: (payload, termos) de cada repositório, na ordem de ranking
+            analyzer: Analisador de sentimento usado
+
+        Returns:
+            O snapshot gravado
+        """
+        snapshot = CuratedSnapshot(analyzer=analyzer, news_count=len(news), repos_count=len(repos))
+        self.session.add(snapshot)
+        self.session.flush()
+
+        rows = [
+            {'snapshot_id': snapshot.id, 'kind': kind, 'rank': rank, 'terms': terms, 'payload': payload}
+            for kind, items in (('news', news), ('repo', repos))
+            for rank, (payload, terms) in enumerate(items)
+        ]
+        self.session.bulk_insert_mappings(SnapshotItem, rows)
+        self.session.commit()
+        return snapshot
+
+    def get_latest(self, max_age_hours: Optional[float] = None) -> Optional[CuratedSnapshot]:
+        """Snapshot mais recente, opcionalmente limitado à idade máxima."""
+        query = self.session.query(CuratedSnapshot)
+        if max_age_hours is not None:
+            query = query.filter(
+                CuratedSnapshot.created_at >= datetime.utcnow() - timedelta(hours=max_age_hours)
+            )
+        return query.order_by(CuratedSnapshot.created_at.desc()).first()
+
+    def find_items(self, snapshot_id: int, kind: str, term_groups: Optional[List[List[str]]] = None,
+                   limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Itens de um snapshot na ordem de ranking.
+
+        Args:
+            snapshot_id: Snapshot consultado
+            kind: 'news' ou 'repo'
+            term_groups: Termos de cada palavra-chave; um item corresponde se contém
+                todos os termos de alguma delas (operador @> sobre o índice GIN)
+            limit: Máximo de itens
+
+        Returns:
+            Payloads dos itens
+        """
+        query = self.session.query(SnapshotItem.payload).filter(
+            SnapshotItem.snapshot_id == snapshot_id,
+            SnapshotItem.kind == kind
+        )
+        if term_groups:
+            query = query.filter(or_(*[SnapshotItem.terms.contains(terms) for terms in term_groups]))
+        return [payload for (payload,) in query.order_by(SnapshotItem.rank).limit(limit)]
+
+    def prune(self, keep: int) -> int:
+        """
+        Remove os snapshots mais antigos, mantendo os `keep` mais recentes.
+
+        Returns:
+            Número de snapshots removidos
+        """
+        stale_ids = [
+            snapshot_id for (snapshot_id,) in self.session.query(CuratedSnapshot.id)
+            .order_by(CuratedSnapshot.created_at.desc())
+            .offset(max(1, keep))
+        ]
+        if not stale_ids:
+            return 0
+        self.session.query(SnapshotItem).filter(
+            SnapshotItem.snapshot_id.in_(stale_ids)
+        ).delete(synchronize_session=False)
+        self.session.query(CuratedSnapshot).filter(
+            CuratedSnapshot.id.in_(stale_ids)
+        ).delete(synchronize_session=False)
+        self.session.commit()
+        return len(stale_ids)
@@ -0,0 +1,17 @@
+# scripts/add_importance_score.py
+"""
+Adiciona news.importance_score a bancos criados antes da coluna existir.
+
+Notícias já armazenadas ficam sem pontuação até o recálculo:
+python -m jobs.rescore_importance --hours <janela>
+
+Uso: python -m scripts.add_importance_score
+"""
+from config.database import engine
+from models.database import News
+from scripts.schema_utils import add_missing_columns
+
+
+if __name__ == "__main__":
+    add_missing_columns(engine, News.__table__, ['importance_score'])
+    print("Esquema de news atualizado; rode jobs.rescore_importance para pontuar as notícias existentes")
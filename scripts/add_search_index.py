@@ -0,0 +1,39 @@
+# scripts/add_search_index.py
+"""
+Adiciona a busca textual a bancos PostgreSQL criados antes de content.search_vector.
+
+Cria a coluna gerada (título com peso A, descrição com peso B) e o índice GIN;
+o PostgreSQL calcula o vetor de todas as linhas existentes ao adicionar a coluna.
+
+Uso: python -m scripts.add_search_index
+"""
+from sqlalchemy import inspect, text
+
+from config.database import engine
+from models.database import Content, SEARCH_VECTOR_EXPRESSION
+
+
+def add_search_vector():
+    """Adiciona content.search_vector (coluna gerada) se ainda não existir"""
+    columns = {column['name'] for column in inspect(engine).get_columns('content')}
+    if 'search_vector' in columns:
+        return
+    with engine.begin() as connection:
+        connection.execute(text(
+            f"ALTER TABLE content ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED"
+        ))
+    print("Coluna content.search_vector adicionada")
+
+
+def create_index():
+    """Cria o índice GIN de content.search_vector, se ainda não existir"""
+    for index in Content.__table__.indexes:
+        if list(index.columns) == [Content.__table__.c.search_vector]:
+            index.create(bind=engine, checkfirst=True)
+            print(f"Índice {index.name} disponível")
+
+
+if __name__ == "__main__":
+    add_search_vector()
+    create_index()
@@ -0,0 +1,59 @@
+# scripts/add_sentiment_cache_columns.py
+"""
+Adiciona text_hash, analyzer e detailed_scores (o índice de text_hash e a
+restrição única de text_hash + analyzer) a sentiment_analysis em bancos criados
+antes do cache persistente de sentimento.
+
+Antes da restrição, remove as linhas de cache duplicadas (mantém a mais antiga)
+e as linhas de cache do VADER gravadas sem detailed_scores, que são recalculadas
+na próxima consulta; assim o formato do resultado não depende da camada do cache.
+
+Necessário também para o recálculo (python -m jobs.rescore_sentiment), que
+grava o analisador. Resultados antigos ficam sem hash e não são usados como cache.
+
+Uso: python -m scripts.add_sentiment_cache_columns
+"""
+from sqlalchemy import delete, func, select
+
+from config.database import engine
+from models.database import SentimentAnalysis
+from scripts.schema_utils import add_missing_columns, add_unique_constraint, create_indexes
+
+UNIQUE_CONSTRAINT = next(
+    constraint for constraint in SentimentAnalysis.__table__.constraints
+    if constraint.name == 'uq_sentiment_analysis_text_hash_analyzer'
+)
+
+
+def remove_stale_cache_rows() -> int:
+    """
+    Remove duplicatas de (text_hash, analyzer) e linhas de cache do VADER sem detailed_scores.
+
+    Returns:
+        Número de linhas removidas
+    """
+    table = SentimentAnalysis.__table__
+    keep = select(func.min(table.c.id)).where(
+        table.c.text_hash.is_not(None)
+    ).group_by(table.c.text_hash, table.c.analyzer)
+    with engine.begin() as connection:
+        removed = connection.execute(delete(table).where(
+            table.c.text_hash.is_not(None),
+            table.c.id.not_in(keep.scalar_subquery())
+        )).rowcount
+        removed += connection.execute(delete(table).where(
+            table.c.text_hash.is_not(None),
+            table.c.content_id.is_(None),
+            table.c.analyzer == 'vader',
+            table.c.detailed_scores.is_(None)
+        )).rowcount
+    print(f"{removed} linhas de cache removidas")
+    return removed
+
+
+if __name__ == "__main__":
+    add_missing_columns(engine, SentimentAnalysis.__table__, ['text_hash', 'analyzer', 'detailed_scores'])
+    create_indexes(engine, SentimentAnalysis.__table__, ['text_hash'])
+    remove_stale_cache_rows()
+    add_unique_constraint(engine, UNIQUE_CONSTRAINT)
+    print("Esquema de sentiment_analysis atualizado")
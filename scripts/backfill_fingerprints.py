@@ -0,0 +1,93 @@
+# scripts/backfill_fingerprints.py
+"""
+Preenche content.fingerprint em bancos criados antes da coluna existir.
+
+Adiciona a coluna (se ausente), calcula o fingerprint dos conteúdos sem ele em
+lotes e cria o índice único. Quando há duplicatas já gravadas, o conteúdo mais
+antigo (menor id) fica com o fingerprint e os demais permanecem sem ele.
+
+Uso: python -m scripts.backfill_fingerprints [--chunk-size 5000]
+"""
+import argparse
+
+from sqlalchemy import inspect, text
+
+from config.database import SessionLocal, engine
+from models.database import Content
+from utils.fingerprint import link_fingerprint, news_fingerprint
+
+
+def fingerprint_for(content_type, title, source_name, link) -> str:
+    """Fingerprint com a mesma regra usada pelos coletores"""
+    if content_type == 'news':
+        return news_fingerprint(title, source_name)
+    return link_fingerprint(content_type, title, link)
+
+
+def add_column():
+    """Adiciona content.fingerprint se a tabela ainda não a tiver"""
+    columns = {column['name'] for column in inspect(engine).get_columns('content')}
+    if 'fingerprint' not in columns:
+        with engine.begin() as connection:
+            connection.execute(text('ALTER TABLE content ADD COLUMN fingerprint VARCHAR(64)'))
+        print("Coluna content.fingerprint adicionada")
+
+
+def backfill(chunk_size: int) -> dict:
+    """
+    Calcula os fingerprints ausentes, com commit por lote.
+
+    Returns:
+        Contagem de conteúdos atualizados e de duplicatas deixadas sem fingerprint
+    """
+    updated = duplicates = 0
+    last_id = 0
+    with SessionLocal() as session:
+        seen = {fingerprint for (fingerprint,) in session.query(Content.fingerprint).filter(
+            Content.fingerprint.isnot(None)
+        )}
+        while True:
+            rows = session.query(
+                Content.id, Content.type, Content.title, Content.source_name, Content.link
+            ).filter(
+                Content.fingerprint.is_(None),
+                Content.id > last_id
+            ).order_by(Content.id).limit(chunk_size).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            mappings = []
+            for row in rows:
+                fingerprint = fingerprint_for(row.type, row.title, row.source_name, row.link)
+                if fingerprint in seen:
+                    duplicates += 1
+                    continue
+                seen.add(fingerprint)
+                mappings.append({'id': row.id, 'fingerprint': fingerprint})
+
+            session.bulk_update_mappings(Content, mappings)
+            session.commit()
+            updated += len(mappings)
+            print(f"{updated} fingerprints gravados ({duplicates} duplicatas)")
+
+    return {'updated': updated, 'duplicates': duplicates}
+
+
+def create_index():
+    """Cria o índice único de content.fingerprint, se ainda não existir"""
+    for index in Content.__table__.indexes:
+        if list(index.columns) == [Content.__table__.c.fingerprint]:
+            index.create(bind=engine, checkfirst=True)
+            print(f"Índice {index.name} disponível")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Preenche content.fingerprint e cria o índice único.')
+    parser.add_argument('--chunk-size', type=int, default=5000, help='Conteúdos por lote (default: 5000)')
+    args = parser.parse_args()
+
+    add_column()
+    result = backfill(args.chunk_size)
+    create_index()
+    print(f"Backfill concluído: {result['updated']} atualizados, {result['duplicates']} duplicatas sem fingerprint")
@@ -0,0 +1,66 @@
+# scripts/benchmark_importance.py
+"""
+Compara a pontuação de importância densa (x.toarray(), float64) com o caminho
+esparso em float32, medindo tempo e pico de memória conforme cresce o número de
+documentos.
+
+Uso: python -m scripts.benchmark_importance [--sizes 100 1000 10000]
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from utils.text_vectors import build_tfidf_vectorizer, importance_scores
+
+
+def dense_scores(x) -> np.ndarray:
+    """Implementação anterior: materializa a matriz docs × termos"""
+    doc_lengths = x.sum(axis=1).A1
+    term_importance = np.sqrt(np.asarray(x.mean(axis=0)).ravel())
+    scores = doc_lengths * np.dot(x.toarray(), term_importance)
+    return (scores - scores.min()) / (scores.max() - scores.min() + 1e-8)
+
+
+def synthetic_corpus(n_docs: int, seed: int = 42):
+    rng = random.Random(seed)
+    vocabulary = [f"term{i}" for i in range(5000)]
+    return [" ".join(rng.choices(vocabulary, k=rng.randint(20, 80))) for _ in range(n_docs)]
+
+
+def measure(func, x):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(x)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000, 50000])
+    args = parser.parse_args()
+
+    print(f"{'docs':>8} {'dense ms':>10} {'dense MB':>10} {'sparse ms':>10} {'sparse MB':>10} {'max diff':>10}")
+    for n_docs in args.sizes:
+        texts = synthetic_corpus(n_docs)
+        x64 = TfidfVectorizer(max_features=1000, stop_words='english', ngram_range=(1, 2)).fit_transform(texts)
+        x32 = build_tfidf_vectorizer().fit_transform(texts)
+
+        dense, dense_time, dense_peak = measure(dense_scores, x64)
+        sparse, sparse_time, sparse_peak = measure(importance_scores, x32)
+
+        print(
+            f"{n_docs:>8} {dense_time * 1000:>10.1f} {dense_peak / 2**20:>10.1f} "
+            f"{sparse_time * 1000:>10.1f} {sparse_peak / 2**20:>10.1f} "
+            f"{float(np.max(np.abs(dense - sparse))):>10.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
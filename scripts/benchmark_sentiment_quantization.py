@@ -0,0 +1,88 @@
+# scripts/benchmark_sentiment_quantization.py
+"""
+Compara o BERT de sentimento em float32 ('bert') com a versão quantizada em
+int8 ('bert_int8') sobre um corpus local fixo: tempo de carga, latência por
+texto (p50/p95), vazão em lotes e concordância de rótulos.
+
+Uso: python -m scripts.benchmark_sentiment_quantization --model-dir models/distilbert-sst2 \
+         [--corpus data/benchmarks/sentiment_corpus.txt] [--threads 4] [--batch-size 16] [--repeat 5]
+"""
+import argparse
+import statistics
+import time
+
+from services.sentiment_service import SentimentAnalysisService
+from utils.stats import percentile
+
+
+def load_corpus(path: str):
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def run(sentiment_type: str, corpus, args):
+    """Carrega o analisador e mede latência e vazão pela API pública (sem cache de resultados)"""
+    start = time.perf_counter()
+    service = SentimentAnalysisService(
+        sentiment_type,
+        batch_size=args.batch_size,
+        model_dir=args.model_dir,
+        num_threads=args.threads,
+        workers=1
+    )
+    load_seconds = time.perf_counter() - start
+    if service.sentiment_type != sentiment_type:
+        raise RuntimeError(f"não foi possível carregar '{sentiment_type}' (caiu para '{service.sentiment_type}')")
+
+    # Aquecimento fora da medição
+    service.analyze_batch(corpus[:args.batch_size])
+
+    latencies = []
+    for text in corpus:
+        start = time.perf_counter()
+        service.analyze_batch([text])
+        latencies.append((time.perf_counter() - start) * 1000.0)
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        results = service.analyze_batch(corpus)
+    throughput = len(corpus) * args.repeat / (time.perf_counter() - start)
+
+    return {
+        'load_seconds': load_seconds,
+        'latency_p50': statistics.median(latencies),
+        'latency_p95': percentile(latencies, 95),
+        'throughput': throughput,
+        'labels': [result['sentiment'] for result in results]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--model-dir', required=True, help='Diretório local do modelo (tokenizer + pesos)')
+    parser.add_argument('--corpus', default='data/benchmarks/sentiment_corpus.txt')
+    parser.add_argument('--threads', type=int, default=None, help='Threads do PyTorch')
+    parser.add_argument('--batch-size', type=int, default=16)
+    parser.add_argument('--repeat', type=int, default=5, help='Passadas sobre o corpus na medição de vazão')
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    print(f"corpus: {len(corpus)} textos, threads: {args.threads or 'padrão'}, batch: {args.batch_size}")
+
+    results = {name: run(name, corpus, args) for name in ('bert', 'bert_int8')}
+
+    print(f"{'modo':>10} {'carga s':>9} {'p50 ms':>8} {'p95 ms':>8} {'textos/s':>9}")
+    for name, result in results.items():
+        print(
+            f"{name:>10} {result['load_seconds']:>9.2f} {result['latency_p50']:>8.1f} "
+            f"{result['latency_p95']:>8.1f} {result['throughput']:>9.1f}"
+        )
+
+    float_labels, int8_labels = results['bert']['labels'], results['bert_int8']['labels']
+    agreement = sum(a == b for a, b in zip(float_labels, int8_labels)) / len(corpus)
+    speedup = results['bert_int8']['throughput'] / results['bert']['throughput']
+    print(f"concordância de rótulos: {agreement:.1%}  |  ganho de vazão int8: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# scripts/migrate_news_clusters.py
+"""
+Atualiza bancos criados antes do clustering incremental persistido.
+
+Adiciona title, size e signature a news_clusters, o índice de updated_at e a
+tabela news_cluster_bands. Clusters já existentes recebem tamanho, título e
+assinatura MinHash (com suas chaves LSH) calculados a partir da notícia líder,
+para que possam receber notícias novas.
+
+Com --recompute, recalcula as assinaturas e chaves LSH de todos os clusters
+(necessário quando as permutações do MinHasher mudam).
+
+Uso: python -m scripts.migrate_news_clusters [--chunk-size 500] [--recompute]
+"""
+import argparse
+
+from config.database import SessionLocal, engine
+from models.database import News, NewsCluster, NewsClusterBand
+from scripts.schema_utils import add_missing_columns, create_indexes
+from services.cluster_service import IncrementalClusteringService
+
+
+def migrate_schema():
+    """Colunas novas de news_clusters, índice de updated_at e tabela de bandas"""
+    add_missing_columns(engine, NewsCluster.__table__, ['title', 'size', 'signature'])
+    create_indexes(engine, NewsCluster.__table__, ['updated_at'])
+    NewsClusterBand.__table__.create(bind=engine, checkfirst=True)
+    print("Tabela news_cluster_bands disponível")
+
+
+def backfill(chunk_size: int, recompute: bool = False) -> int:
+    """
+    Preenche os clusters sem assinatura (ou todos, com recompute), com commit por lote.
+
+    Lê apenas as colunas necessárias das notícias, para não depender de outras
+    colunas adicionadas ao modelo depois deste banco ser criado.
+
+    Returns:
+        Número de clusters atualizados
+    """
+    updated = 0
+    last_id = 0
+    with SessionLocal() as session:
+        hasher = IncrementalClusteringService(session).hasher
+        while True:
+            query = session.query(NewsCluster).filter(NewsCluster.id > last_id)
+            if not recompute:
+                query = query.filter(NewsCluster.signature.is_(None))
+            clusters = query.order_by(NewsCluster.id).limit(chunk_size).all()
+            if not clusters:
+                break
+            last_id = clusters[-1].id
+
+            members = {}
+            for cluster_id, title, description, primary_source in session.query(
+                News.cluster_id, News.title, News.description, News.primary_source
+            ).filter(
+                News.cluster_id.in_([cluster.id for cluster in clusters])
+            ).order_by(News.cluster_id, News.id):
+                members.setdefault(cluster_id, []).append((title, description, primary_source))
+
+            for cluster in clusters:
+                news_items = members.get(cluster.id, [])
+                cluster.size = len(news_items)
+                if not news_items:
+                    continue
+                title, description, _ = next((item for item in news_items if item[2]), news_items[0])
+                signature = hasher.signature(f"{title} {description or ''}")
+                cluster.title = cluster.title or title
+                cluster.signature = signature.tolist()
+                cluster.bands = [NewsClusterBand(band_key=key) for key in hasher.band_keys(signature)]
+
+            session.commit()
+            updated += len(clusters)
+            print(f"{updated} clusters atualizados")
+
+    return updated
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Atualiza o esquema de clusters de notícias.')
+    parser.add_argument('--chunk-size', type=int, default=500, help='Clusters por lote (default: 500)')
+    parser.add_argument('--recompute', action='store_true',
+                        help='Recalcula as assinaturas de todos os clusters, não só das vazias')
+    args = parser.parse_args()
+
+    migrate_schema()
+    print(f"Migração concluída: {backfill(args.chunk_size, args.recompute)} clusters preenchidos")
@@ -0,0 +1,73 @@
+# scripts/schema_utils.py
+"""
+Funções comuns aos scripts que atualizam bancos criados antes de uma mudança
+no modelo (Base.metadata.create_all não altera tabelas existentes).
+"""
+from typing import Iterable, List
+
+from sqlalchemy import Table, UniqueConstraint, inspect, text
+
+
+def add_missing_columns(engine, table: Table, names: Iterable[str]) -> List[str]:
+    """
+    Adiciona à tabela as colunas do modelo que ainda não existem no banco.
+
+    As colunas são criadas sem NOT NULL nem default do servidor, como no
+    modelo; linhas existentes ficam com NULL até um backfill.
+
+    Returns:
+        Nomes das colunas adicionadas
+    """
+    existing = {column['name'] for column in inspect(engine).get_columns(table.name)}
+    quote = engine.dialect.identifier_preparer.quote
+    added = []
+    with engine.begin() as connection:
+        for name in names:
+            if name in existing:
+                continue
+            column_type = table.c[name].type.compile(dialect=engine.dialect)
+            connection.execute(text(
+                f"ALTER TABLE {quote(table.name)} ADD COLUMN {quote(name)} {column_type}"
+            ))
+            added.append(name)
+            print(f"Coluna {table.name}.{name} adicionada")
+    return added
+
+
+def create_indexes(engine, table: Table, names: Iterable[str]):
+    """Cria, se ainda não existirem, os índices do modelo definidos apenas sobre as colunas informadas"""
+    names = set(names)
+    for index in table.indexes:
+        if {column.name for column in index.columns} <= names:
+            index.create(bind=engine, checkfirst=True)
+            print(f"Índice {index.name} disponível")
+
+
+def add_unique_constraint(engine, constraint: UniqueConstraint) -> bool:
+    """
+    Cria a restrição única do modelo, se ainda não existir.
+
+    O SQLite não aceita ALTER TABLE ... ADD CONSTRAINT; nele é criado um índice
+    único de mesmo nome, equivalente para o ON CONFLICT. Linhas duplicadas
+    precisam ser removidas antes.
+
+    Returns:
+        True se a restrição foi criada
+    """
+    table = constraint.table
+    inspector = inspect(engine)
+    existing = {item['name'] for item in inspector.get_unique_constraints(table.name)}
+    existing |= {item['name'] for item in inspector.get_indexes(table.name)}
+    if constraint.name in existing:
+        return False
+
+    quote = engine.dialect.identifier_preparer.quote
+    columns = ', '.join(quote(column.name) for column in constraint.columns)
+    if engine.dialect.name == 'sqlite':
+        statement = f"CREATE UNIQUE INDEX {quote(constraint.name)} ON {quote(table.name)} ({columns})"
+    else:
+        statement = f"ALTER TABLE {quote(table.name)} ADD CONSTRAINT {quote(constraint.name)} UNIQUE ({columns})"
+    with engine.begin() as connection:
+        connection.execute(text(statement))
+    print(f"Restrição {constraint.name} criada")
+    return True
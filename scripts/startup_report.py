@@ -0,0 +1,87 @@
+# scripts/startup_report.py
+"""
+Relatório de tempo de inicialização.
+
+Para cada módulo de entrada, importa-o em um processo Python novo (sem cache de
+módulos já carregados) e informa o tempo de import, as dependências pesadas que
+foram carregadas e os imports mais caros segundo `python -X importtime`. Com
+--curator, mede também a criação do curador com a configuração atual.
+
+Uso: python -m scripts.startup_report [--modules app.main jobs.run_collectors] [--curator] [--top 10]
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ['transformers', 'torch', 'nltk', 'textblob', 'sklearn', 'scipy', 'sqlalchemy']
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+import_seconds = time.perf_counter() - start
+curator_seconds = None
+if {curator}:
+    from config.settings import get_settings
+    from curators.sentiment_curator import SentimentEnhancedContentCurator
+    start = time.perf_counter()
+    SentimentEnhancedContentCurator(get_settings().CURATOR_CONFIG)
+    curator_seconds = time.perf_counter() - start
+print(json.dumps({{
+    'import_seconds': import_seconds,
+    'curator_seconds': curator_seconds,
+    'heavy_loaded': [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+def probe(module: str, curator: bool):
+    """Executa o import em um processo novo e devolve as medições e o log de importtime"""
+    code = _PROBE.format(module=module, curator=curator, heavy=HEAVY_MODULES)
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr else 'falha no import')
+    return json.loads(completed.stdout.strip().splitlines()[-1]), completed.stderr
+
+
+def slowest_imports(importtime_log: str, top: int):
+    """Imports com maior tempo cumulativo (microssegundos) no log de -X importtime"""
+    entries = []
+    for line in importtime_log.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        entries.append((int(cumulative), name.strip()))
+    entries.sort(reverse=True)
+    return entries[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modules', nargs='+', default=['app.main', 'jobs.run_collectors'])
+    parser.add_argument('--curator', action='store_true', help='Mede também a criação do curador')
+    parser.add_argument('--top', type=int, default=10, help='Imports mais caros listados por módulo')
+    args = parser.parse_args()
+
+    for module in args.modules:
+        try:
+            result, importtime_log = probe(module, args.curator)
+        except RuntimeError as e:
+            print(f"{module}: erro ({e})")
+            continue
+
+        print(f"{module}")
+        print(f"  import: {result['import_seconds'] * 1000:.0f} ms")
+        if result['curator_seconds'] is not None:
+            print(f"  curador: {result['curator_seconds'] * 1000:.0f} ms")
+        print(f"  dependências pesadas carregadas: {', '.join(result['heavy_loaded']) or 'nenhuma'}")
+        for cumulative, name in slowest_imports(importtime_log, args.top):
+            print(f"    {cumulative / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# services/cluster_service.py
+
+import logging
+from typing import List, Optional
+
+from models.content_models import ContentSource, EnhancedNewsItem
+from models.database import News
+from repositories.cluster_repository import NewsClusterRepository
+from utils.minhash import MinHasher
+
+logger = logging.getLogger(__name__)
+
+class IncrementalClusteringService:
+    """
+    Clustering incremental de notícias persistido em NewsCluster.
+
+    Cada cluster guarda a assinatura MinHash da notícia que o originou e suas
+    chaves LSH em news_cluster_bands. Uma notícia nova busca candidatos pelas
+    próprias chaves (consulta por índice, sem varrer a tabela), é comparada
+    apenas com eles e entra no mais similar ou inicia um cluster novo.
+    """
+
+    def __init__(self, session, similarity_threshold: float = 0.4, time_window_hours: int = 48,
+                 hasher: Optional[MinHasher] = None):
+        """
+        Args:
+            session: Sessão do banco de dados
+            similarity_threshold: Jaccard estimado mínimo (sobre palavras) para entrar num cluster
+            time_window_hours: Apenas clusters atualizados nesta janela recebem notícias novas
+            hasher: MinHasher a usar (padrão: unigramas sem stop words, 64 permutações, 32 bandas)
+        """
+        self.cluster_repo = NewsClusterRepository(session)
+        self.similarity_threshold = similarity_threshold
+        self.time_window_hours = time_window_hours
+        if hasher is None:
+            from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+            hasher = MinHasher(
+                num_perm=64,
+                bands=32,
+                shingle_size=1,
+                stop_words=frozenset(ENGLISH_STOP_WORDS)
+            )
+        self.hasher = hasher
+
+    def assign(self, news_items: List[News]) -> int:
+        """
+        Atribui cada notícia a um cluster existente ou a um novo (sem commit).
+
+        Args:
+            news_items: Notícias já persistidas (com id)
+
+        Returns:
+            Número de clusters novos criados
+        """
+        created = 0
+        for news in news_items:
+            if news.cluster_id is not None:
+                continue
+
+            signature = self.hasher.signature(f"{news.title} {news.description or ''}")
+            band_keys = self.hasher.band_keys(signature)
+
+            best_cluster, best_similarity = None, 0.0
+            for cluster in self.cluster_repo.find_candidates(band_keys, self.time_window_hours):
+                if not cluster.signature:
+                    continue
+                similarity = MinHasher.similarity(signature, cluster.signature)
+                if similarity > best_similarity:
+                    best_cluster, best_similarity = cluster, similarity
+
+            if best_cluster is not None and best_similarity >= self.similarity_threshold:
+                self.cluster_repo.add_news(best_cluster, news)
+            else:
+                self.cluster_repo.create_for_news(news, signature.tolist(), band_keys)
+                created += 1
+
+        logger.info(f"Clustering incremental: {len(news_items)} notícias, {created} clusters novos")
+        return created
+
+    def get_clustered_news(self, max_items: int = 10,
+                           keywords: Optional[List[str]] = None) -> List[EnhancedNewsItem]:
+        """
+        Retorna os maiores clusters recentes já prontos, no formato da API
+
+        Args:
+            max_items: Número máximo de clusters
+            keywords: Mantém apenas clusters com notícias que mencionam alguma palavra-chave
+        """
+        enhanced_news = []
+        for cluster in self.cluster_repo.get_top_clusters(max_items, self.time_window_hours, keywords):
+            if not cluster.news_items:
+                continue
+
+            primary = next((n for n in cluster.news_items if n.primary_source), cluster.news_items[0])
+            sources = [
+                ContentSource(
+                    name=news.source_name or "Unknown Source",
+                    link=news.link or "",
+                    published_date=str(news.published_date) if news.published_date else None,
+                    author=news.author,
+                    title=news.title,
+                    description=news.description
+                )
+                for news in cluster.news_items
+            ]
+
+            enhanced_news.append(EnhancedNewsItem(
+                title=primary.title,
+                description=primary.description or "",
+                primary_link=primary.link or "",
+                read_time=primary.read_time or 5,
+                primary_source=primary.source_name or "Unknown Source",
+                sources=sources,
+                source_count=len(sources),
+                relevance_score=min(max(self._relevance(cluster), 0.0), 1.0),
+                keywords=keywords,
+                categories=None
+            ))
+        return enhanced_news
+
+    @staticmethod
+    def _relevance(cluster) -> float:
+        """Relevância gravada no cluster ou, em clusters antigos, a maior importância das notícias"""
+        if cluster.relevance_score is not None:
+            return cluster.relevance_score
+        return max((news.importance_score or 0.0 for news in cluster.news_items), default=0.0)
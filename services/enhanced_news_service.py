@@ -10,6 +10,8 @@ from models.database import News, NewsCluster, SentimentAnalysis
 from repositories.news_repository import NewsRepository
 from services.news_service import NewsService  # Serviço original
 from utils.clustering import NewsClusteringService
+from services.cluster_service import IncrementalClusteringService
+from models.content_models import EnhancedNewsItem
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,7 @@ class EnhancedNewsService:
         self.news_repo = NewsRepository(db_session)
         self.original_service = NewsService(rss_urls)
         self.clustering_service = NewsClusteringService()
+        self.incremental_clustering = IncrementalClusteringService(db_session)
         self.max_age_hours = max_age_hours
     
     async def get_top_news(self, max_items: int = 10, keywords: List[str] = None, 
@@ -43,7 +46,7 @@ class EnhancedNewsService:
         if include_stored and not force_fresh:
             stored_news = []
             if keywords:
-                stored_news = self.news_repo.get_by_keywords(keywords, max_items)
+                stored_news = self.news_repo.search_by_keywords(keywords, max_items)
             else:
                 stored_news = self.news_repo.get_latest_news(max_items)
                 
@@ -81,7 +84,8 @@ class EnhancedNewsService:
                         source_name=item.source,
                         read_time=item.read_time,
                         published_date=item.additional_info.get('published_date') if item.additional_info else None,
-                        author=item.additional_info.get('author') if item.additional_info else None
+                        author=item.additional_info.get('author') if item.additional_info else None,
+                        importance_score=item.additional_info.get('importance_score') if item.additional_info else None
                     )
                     
                     # Extrair palavras-chave do conteúdo ou usar as fornecidas
@@ -111,6 +115,18 @@ class EnhancedNewsService:
         # Retornar resultado limitado
         return result_news[:max_items]
     
+    def get_clustered_news(self, max_items: int = 10) -> List[EnhancedNewsItem]:
+        """
+        Retorna clusters já calculados pelos coletores, sem reagrupar na requisição.
+        
+        Args:
+            max_items: Número máximo de clusters
+            
+        Returns:
+            Lista de EnhancedNewsItem (um por cluster)
+        """
+        return self.incremental_clustering.get_clustered_news(max_items)
+    
     def _extract_keywords(self, news_item) -> List[str]:
         """Extrai palavras-chave do conteúdo da notícia."""
         # Implementação básica - poderia ser aprimorada com NLP
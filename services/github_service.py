@@ -1,4 +1,5 @@
-import requests
+import asyncio
+import aiohttp
 import logging
 from bs4 import BeautifulSoup
 from typing import List, Dict, Any, Optional
@@ -10,37 +11,82 @@ logger = logging.getLogger(__name__)
 class GitHubScanner:
     """Serviço para coleta de repositórios em tendência no GitHub"""
     
-    def __init__(self, site_url, top_n=5):
+    RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+    
+    def __init__(self, site_url, top_n=5, timeout: float = 15.0, max_retries: int = 3):
         self.site_url = site_url
         self.top_n = top_n
+        self.timeout = timeout
+        self.max_retries = max_retries
         self.response = []
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
         logger.info(f"GitHubScanner initialized with URL: {site_url}, top_n: {top_n}")
 
-    def _extract_from_html(self, link):
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Retorna a sessão HTTP (com pool de conexões keep-alive), criando-a se necessário"""
+        if self.session is None or self.session.closed:
+            logger.debug("Criando nova sessão HTTP para o GitHub")
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout, connect=5),
+                connector=aiohttp.TCPConnector(limit_per_host=4, keepalive_timeout=60),
+                headers=self.headers
+            )
+        return self.session
+
+    async def _fetch_html(self, link: str) -> str:
+        """Busca o HTML da página com timeout e novas tentativas (backoff exponencial)"""
+        for attempt in range(self.max_retries):
+            try:
+                session = await self._get_session()
+                async with session.get(link) as response:
+                    logger.debug(f"Status Code: {response.status}")
+                    if response.status == 200:
+                        return await response.text()
+                    
+                    body = await response.text()
+                    if response.status not in self.RETRYABLE_STATUS:
+                        logger.error(f"Erro na requisição HTTP. Status code: {response.status}")
+                        logger.error(f"Response content: {body[:500]}...")  # Primeiros 500 caracteres
+                        return ""
+                    logger.warning(f"GitHub retornou status {response.status} (tentativa {attempt + 1}/{self.max_retries})")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Erro de requisição ao acessar o GitHub (tentativa {attempt + 1}/{self.max_retries}): {str(e)}")
+            
+            if attempt < self.max_retries - 1:
+                await asyncio.sleep(0.5 * (2 ** attempt))
+        
+        logger.error(f"Falha ao acessar o GitHub após {self.max_retries} tentativas: {link}")
+        return ""
+
+    async def close(self):
+        """Fecha a sessão HTTP"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def _extract_from_html(self, link):
         """Extrai repositórios da página de trending do GitHub"""
+        logger.debug(f"Iniciando extração de repositórios do URL: {link}")
+        
+        # Requisição HTTP (não bloqueia o event loop)
+        logger.debug("Fazendo requisição HTTP...")
+        html = await self._fetch_html(link)
+        if not html:
+            return []
+        
+        # Parsing do HTML fora do event loop
+        return await asyncio.to_thread(self._parse_html, html)
+    
+    def _parse_html(self, html: str) -> List[Dict]:
+        """Extrai os repositórios do HTML da página de trending"""
         repos = []
         try:
-            logger.debug(f"Iniciando extração de repositórios do URL: {link}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            # Requisição HTTP
-            logger.debug("Fazendo requisição HTTP...")
-            response = requests.get(link, headers=headers)
-            logger.debug(f"Status Code: {response.status_code}")
-            
-            if response.status_code != 200:
-                logger.error(f"Erro na requisição HTTP. Status code: {response.status_code}")
-                logger.error(f"Response content: {response.text[:500]}...")  # Primeiros 500 caracteres
-                return []
-            
-            response.raise_for_status()
-            
             # Parsing HTML
             logger.debug("Fazendo parsing do HTML...")
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
             
             # Buscando repositórios
             logger.debug("Buscando articles com class 'Box-row'...")
@@ -109,9 +155,6 @@ class GitHubScanner:
             logger.info(f"Extração finalizada. Total de {len(repos)} repositórios extraídos de {len(repo_list)} encontrados")
             return repos[:self.top_n]
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Erro de requisição ao acessar o GitHub: {str(e)}", exc_info=True)
-            return []
         except Exception as e:
             logger.error(f"Erro não esperado ao extrair repositórios do GitHub: {str(e)}", exc_info=True)
             return []
@@ -139,7 +182,7 @@ class GitHubScanner:
         
         try:
             # Extraindo repositórios
-            repositories = self._extract_from_html(self.site_url)
+            repositories = await self._extract_from_html(self.site_url)
             logger.debug(f"Repositories extracted: {len(repositories)}")
             
             # Se a extração falhou, log e retorno
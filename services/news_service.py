@@ -1,6 +1,6 @@
 import asyncio
+import copy
 import logging
-import numpy as np
 import aiohttp
 import xml.etree.ElementTree as ET
 from bs4 import BeautifulSoup
@@ -8,26 +8,37 @@ from datetime import datetime
 import email.utils
 import re
 from typing import Dict, List, Any, Optional, Tuple
-from sklearn.feature_extraction.text import TfidfVectorizer
 
 from models.content_models import NewsItem
+from utils.feed_cache import FeedCache
+from utils.cache import TTLCache
+from utils.text_vectors import build_tfidf_vectorizer, importance_scores
 
 logger = logging.getLogger(__name__)
 
 class NewsService:
     """Serviço para coleta e processamento de notícias via RSS"""
     
-    def __init__(self, rss_urls: List[str]):
+    def __init__(self, rss_urls: List[str], feed_cache: Optional[FeedCache] = None,
+                 cache_ttl: float = 0.0, cache_max_stale: float = 0.0):
         self.rss_urls = rss_urls
-        self.tfidf = TfidfVectorizer(
-            max_features=1000,
-            stop_words='english',
-            ngram_range=(1, 2)
-        )
+        # Cache de feeds para GET condicional (ETag/Last-Modified)
+        self.feed_cache = feed_cache or FeedCache()
+        # Cache de notícias já processadas e pontuadas (stale-while-revalidate)
+        self.results_cache = TTLCache(cache_ttl, cache_max_stale)
+        self._refresh_tasks: Dict[Tuple[str, ...], asyncio.Task] = {}
+        self._tfidf = None  # Vetorizador TF-IDF, criado no primeiro uso
         self.session: Optional[aiohttp.ClientSession] = None
         self.news = []
         self._is_closed = False
 
+    @property
+    def tfidf(self):
+        """Vetorizador TF-IDF (o scikit-learn só é importado no primeiro uso)"""
+        if self._tfidf is None:
+            self._tfidf = build_tfidf_vectorizer()
+        return self._tfidf
+
     def _clean_html(self, text: str) -> str:
         """Remove HTML tags do texto"""
         if not text:
@@ -77,19 +88,42 @@ class NewsService:
                 timeout=aiohttp.ClientTimeout(total=10)
             )
         
-    async def _fetch_feed_content(self, url: str) -> str:
-        """Busca o conteúdo de um feed RSS de forma assíncrona"""
+    async def _fetch_feed_content(self, url: str) -> Tuple[str, bool]:
+        """
+        Busca o conteúdo de um feed RSS de forma assíncrona, revalidando o cache
+        com If-None-Match/If-Modified-Since.
+        
+        Returns:
+            Tupla (conteúdo, not_modified). Em caso de 304 o conteúdo vem do cache.
+        """
+        cached = self.feed_cache.get(url)
+        headers = cached.conditional_headers() if cached else {}
         try:
             session = await self._get_session()
-            async with session.get(url) as response:
-                if response.status == 200:
-                    return await response.text()
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and cached is not None:
+                    logger.debug(f"Feed não modificado (304): {url}")
+                    self.feed_cache.touch(url)
+                    return cached.body, True
+                elif response.status == 200:
+                    content = await response.text()
+                    self.feed_cache.put(
+                        url,
+                        content,
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified')
+                    )
+                    return content, False
                 else:
                     logger.error(f"Erro ao buscar feed {url}: Status {response.status}")
-                    return ""
+                    return "", False
         except Exception as e:
             logger.error(f"Erro ao buscar feed {url}: {str(e)}")
-            return ""
+            # Se o servidor falhar, usa a última versão conhecida do feed
+            if cached is not None and cached.body:
+                logger.info(f"Usando versão em cache do feed {url}")
+                return cached.body, True
+            return "", False
             
     def _get_feed_type_and_namespaces(self, root: ET.Element) -> Tuple[str, Dict[str, str]]:
         """Determine feed type (RSS or Atom) and extract namespaces"""
@@ -293,30 +327,44 @@ class NewsService:
         """Busca e processa um feed RSS de forma assíncrona"""
         try:
             logger.info(f"Buscando feed: {url}")
-            content = await self._fetch_feed_content(url)
+            content, not_modified = await self._fetch_feed_content(url)
             if not content:
                 return []
+            
+            cached = self.feed_cache.get(url)
+            if not_modified and cached is not None and cached.items is not None:
+                # Feed não mudou: reaproveita os itens já processados
+                logger.info(f"Reutilizando {len(cached.items)} itens em cache do feed: {url}")
+                return copy.deepcopy(cached.items)
                 
             news_items = await self._parse_feed(content, url)
+            if cached is not None:
+                cached.items = copy.deepcopy(news_items)
             logger.info(f"Processados {len(news_items)} itens do feed: {url}")
             return news_items
         except Exception as e:
             logger.error(f"Erro ao processar feed {url}: {str(e)}")
             return []
 
-    def _calculate_importance_scores(self, news_items: List[Dict]) -> List[float]:
-        """Calcula pontuação de importância usando TF-IDF"""
+    def _vectorize(self, news_items: List[Dict]):
+        """Ajusta o TF-IDF e retorna a matriz esparsa (uma linha por notícia)"""
+        texts = [item['full_text'] for item in news_items]
+        return self.tfidf.fit_transform(texts)
+
+    def _calculate_importance_scores(self, news_items: List[Dict], x=None) -> List[float]:
+        """
+        Calcula pontuação de importância usando TF-IDF
+        
+        Args:
+            news_items: Notícias a pontuar
+            x: Matriz TF-IDF já calculada para as notícias (opcional)
+        """
         if not news_items:
             return []
         try:
-            texts = [item['full_text'] for item in news_items]
-            x = self.tfidf.fit_transform(texts)
-            doc_lengths = x.sum(axis=1).A1
-            term_importance = np.sqrt(np.asarray(x.mean(axis=0)).ravel())
-            scores = doc_lengths * np.dot(x.toarray(), term_importance)
-            if len(scores) > 0:
-                scores = (scores - scores.min()) / (scores.max() - scores.min() + 1e-8)
-            return scores.tolist()
+            if x is None:
+                x = self._vectorize(news_items)
+            return importance_scores(x).tolist()
         except Exception as e:
             logger.error(f"Erro ao calcular scores de importância: {str(e)}")
             return [0.5] * len(news_items)  # Valor padrão em caso de erro
@@ -339,63 +387,152 @@ class NewsService:
                 filtered_items.append(item)
         return filtered_items
         
-    async def get_top_news(self, max_items: int = 10, keywords: List[str] = None) -> List[NewsItem]:
-        """Retorna as notícias mais relevantes de forma assíncrona"""
-        try:
-            # Coleta todas as notícias de forma concorrente
-            logger.info(f"Buscando notícias de {len(self.rss_urls)} feeds")
-            feed_results = await asyncio.gather(
-                *[self._fetch_feed(url) for url in self.rss_urls],
-                return_exceptions=True
-            )
-            
-            # Processa resultados, ignorando exceções
-            all_news = []
-            for result in feed_results:
-                if isinstance(result, Exception):
-                    logger.error(f"Erro ao buscar feed: {str(result)}")
-                else:
-                    all_news.extend(result)
-            
+    async def _collect_scored_news(self, keywords: List[str] = None) -> List[Dict]:
+        """Busca, filtra e pontua as notícias de todos os feeds, ordenadas por importância"""
+        # Coleta todas as notícias de forma concorrente
+        logger.info(f"Buscando notícias de {len(self.rss_urls)} feeds")
+        feed_results = await asyncio.gather(
+            *[self._fetch_feed(url) for url in self.rss_urls],
+            return_exceptions=True
+        )
+        
+        # Processa resultados, ignorando exceções
+        all_news = []
+        for result in feed_results:
+            if isinstance(result, Exception):
+                logger.error(f"Erro ao buscar feed: {str(result)}")
+            else:
+                all_news.extend(result)
+        
+        if not all_news:
+            logger.warning("Nenhuma notícia encontrada")
+            return []
+        
+        # Filtra por palavras-chave se fornecidas
+        if keywords:
+            all_news = self.filter_by_keywords(all_news, keywords)
             if not all_news:
-                logger.warning("Nenhuma notícia encontrada")
+                logger.warning(f"Nenhuma notícia encontrada com as palavras-chave: {keywords}")
                 return []
-            
-            # Filtra por palavras-chave se fornecidas
-            if keywords:
-                all_news = self.filter_by_keywords(all_news, keywords)
-                if not all_news:
-                    logger.warning(f"Nenhuma notícia encontrada com as palavras-chave: {keywords}")
-                    return []
 
-            # Calcula pontuações e adiciona aos itens
-            importance_scores = self._calculate_importance_scores(all_news)
-            for item, score in zip(all_news, importance_scores):
-                item['additional_info']['importance_score'] = float(score)
+        # Vetoriza uma única vez para a pontuação
+        try:
+            x = self._vectorize(all_news)
+        except Exception as e:
+            logger.error(f"Erro ao vetorizar notícias: {str(e)}")
+            x = None
+
+        # Calcula pontuações e adiciona aos itens
+        importance_scores = self._calculate_importance_scores(all_news, x)
+        for item, score in zip(all_news, importance_scores):
+            item['additional_info']['importance_score'] = float(score)
+
+        # Ordena por pontuação de importância
+        return sorted(all_news, key=lambda item: item['additional_info']['importance_score'], reverse=True)
+
+    def _cache_key(self, keywords: List[str] = None) -> Tuple[str, ...]:
+        """Chave do cache de resultados: palavras-chave normalizadas"""
+        if not keywords:
+            return ()
+        return tuple(sorted({k.strip().lower() for k in keywords if k and k.strip()}))
 
-            # Ordena por pontuação de importância
-            sorted_news = sorted(
-                all_news,
-                key=lambda x: x['additional_info']['importance_score'],
-                reverse=True
+    async def _refresh(self, key: Tuple[str, ...], keywords: List[str] = None) -> List[Dict]:
+        """Recalcula as notícias pontuadas e atualiza o cache"""
+        try:
+            scored_news = await self._collect_scored_news(keywords)
+            # Não armazena resultados vazios (ex.: todos os feeds fora do ar)
+            if scored_news and self.results_cache.enabled:
+                self.results_cache.set(key, scored_news)
+            return scored_news
+        except Exception as e:
+            logger.error(f"Erro ao atualizar cache de notícias: {str(e)}")
+            return []
+        finally:
+            self._refresh_tasks.pop(key, None)
+
+    def _start_refresh(self, key: Tuple[str, ...], keywords: List[str] = None) -> asyncio.Task:
+        """Inicia (ou reaproveita) uma atualização em andamento para a chave"""
+        task = self._refresh_tasks.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._refresh(key, keywords))
+            self._refresh_tasks[key] = task
+        return task
+
+    def _to_news_items(self, scored_news: List[Dict], max_items: int) -> List[NewsItem]:
+        """Converte notícias pontuadas para objetos NewsItem"""
+        top_news = []
+        for item in scored_news[:max_items]:
+            read_time = self._calculate_read_time(item['description'])
+            news_item = NewsItem(
+                title=item['title'],
+                description=item['description'],
+                link=item['link'],
+                read_time=read_time,
+                source=item['source'],
+                engagement=item['engagement'],
+                additional_info=dict(item['additional_info'])
             )
+            top_news.append(news_item)
+        return top_news
+        
+    async def _get_scored_news(self, keywords: List[str] = None) -> List[Dict]:
+        """
+        Notícias pontuadas e ordenadas, do cache quando possível.
+        
+        Com cache habilitado, resultados obsoletos são servidos imediatamente
+        enquanto uma atualização roda em segundo plano.
+        """
+        key = self._cache_key(keywords)
+        
+        if self.results_cache.enabled:
+            entry = self.results_cache.get(key)
+            if entry is not None:
+                if self.results_cache.is_stale(entry):
+                    logger.info(f"Cache de notícias obsoleto para {key}, atualizando em segundo plano")
+                    self._start_refresh(key, keywords)
+                return entry.value
+        
+        # Sem cache utilizável: aguarda a atualização (compartilhada entre requisições)
+        return await asyncio.shield(self._start_refresh(key, keywords))
 
-            # Converte para objetos NewsItem
-            top_news = []
-            for item in sorted_news[:max_items]:
-                read_time = self._calculate_read_time(item['description'])
-                news_item = NewsItem(
-                    title=item['title'],
-                    description=item['description'],
-                    link=item['link'],
-                    read_time=read_time,
-                    source=item['source'],
-                    engagement=item['engagement'],
-                    additional_info=item['additional_info']
-                )
-                top_news.append(news_item)
-            
-            return top_news
+    def _vectorize_top(self, top_news: List[Dict]):
+        """
+        Matriz TF-IDF ajustada apenas nas notícias selecionadas.
+        
+        O IDF depende do conjunto de documentos: recortar a matriz do corpus inteiro
+        mudaria as similaridades para as quais o similarity_threshold do clustering
+        foi calibrado. Ajustar só as notícias selecionadas custa pouco.
+        """
+        if not top_news:
+            return None
+        try:
+            return self._vectorize(top_news)
+        except Exception as e:
+            logger.error(f"Erro ao vetorizar notícias selecionadas: {str(e)}")
+            return None
+        
+    async def get_top_news_with_vectors(self, max_items: int = 10,
+                                        keywords: List[str] = None) -> Tuple[List[NewsItem], Any]:
+        """
+        Retorna as notícias mais relevantes junto com sua matriz TF-IDF.
+        
+        A matriz é ajustada nas notícias retornadas (não no corpus inteiro), o
+        mesmo que o clustering calcularia sozinho.
+        
+        Returns:
+            Tupla (notícias, matriz TF-IDF esparsa alinhada às notícias ou None)
+        """
+        try:
+            top_news = (await self._get_scored_news(keywords))[:max_items]
+            return self._to_news_items(top_news, max_items), self._vectorize_top(top_news)
+        except Exception as e:
+            logger.error(f"Erro ao obter top notícias: {str(e)}")
+            return [], None
+        
+    async def get_top_news(self, max_items: int = 10, keywords: List[str] = None) -> List[NewsItem]:
+        """Retorna as notícias mais relevantes de forma assíncrona"""
+        try:
+            return self._to_news_items(await self._get_scored_news(keywords), max_items)
         except Exception as e:
             logger.error(f"Erro ao obter top notícias: {str(e)}")
             return []
@@ -406,16 +543,19 @@ class NewsService:
             return
             
         try:
+            # Cancela atualizações de cache em segundo plano
+            for task in list(self._refresh_tasks.values()):
+                task.cancel()
+            self._refresh_tasks.clear()
+            self.results_cache.clear()
+            
             # Fecha a sessão HTTP
             if self.session and not self.session.closed:
                 await self.session.close()
                 self.session = None
                 
-            # Limpa o estado do vetorizador
-            if hasattr(self.tfidf, '_tfidf'):
-                delattr(self.tfidf, '_tfidf')
-            if hasattr(self.tfidf, 'vocabulary_'):
-                delattr(self.tfidf, 'vocabulary_')
+            # Descarta o vetorizador (e o vocabulário ajustado)
+            self._tfidf = None
             
             # Limpa outras referências
             self.news = []
@@ -5,9 +5,7 @@ import urllib.request
 import feedparser
 import numpy as np
 import asyncio
-from sklearn import svm
 from typing import List, Dict, Any, Optional, Tuple
-from sklearn.feature_extraction.text import TfidfVectorizer
 
 from models.content_models import ResearchPaper
 
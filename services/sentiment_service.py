@@ -1,34 +1,126 @@
 # services/sentiment_service.py
 
+import asyncio
 import numpy as np
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Tuple, Optional
-from textblob import TextBlob
-import nltk
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
+
+from utils.lexicon_sentiment import LexiconSentimentEngine, load_vader
+from utils.micro_batcher import MicroBatcher
+from utils.sentiment_cache import SentimentCache, normalize_text
 
 logger = logging.getLogger(__name__)
 
 class SentimentAnalysisService:
-    """Serviço para analisar o sentimento de textos."""
+    """
+    Serviço para analisar o sentimento de textos.
+    
+    As bibliotecas de análise (textblob, nltk, transformers) são importadas
+    apenas quando o tipo configurado as utiliza.
+    """
     
     SENTIMENT_TYPES = {
         'BASIC': 'basic',      # Análise rápida e simples (TextBlob)
         'VADER': 'vader',      # Análise específica para mídias sociais (VADER)
-        'BERT': 'bert'         # Análise avançada baseada em redes neurais (BERT)
+        'BERT': 'bert',        # Análise avançada baseada em redes neurais (BERT)
+        'BERT_INT8': 'bert_int8'  # BERT com quantização dinâmica int8 (inferência em CPU)
     }
     
-    def __init__(self, sentiment_type='basic', language='en'):
+    DEFAULT_BERT_MODELS = {
+        'en': "distilbert-base-uncased-finetuned-sst-2-english",
+        'pt': "neuralmind/bert-base-portuguese-cased-sentiment"
+    }
+    
+    def __init__(self, sentiment_type='basic', language='en', batch_size: int = 16,
+                 cache: Optional[SentimentCache] = None, workers: int = 2, max_queue: int = 32,
+                 microbatch_max_size: int = 64, microbatch_max_wait_ms: float = 0.0,
+                 lazy_load: bool = False, model_dir: Optional[str] = None,
+                 num_threads: Optional[int] = None, chunk_long_texts: bool = False,
+                 max_chunks: int = 4, chunk_overlap: int = 32, token_cache_size: int = 4096):
         """
         Inicializa o serviço de análise de sentimento.
         
         Args:
-            sentiment_type: Tipo de análise a ser usada ('basic', 'vader' ou 'bert')
+            sentiment_type: Tipo de análise a ser usada ('basic', 'vader', 'bert' ou 'bert_int8')
             language: Código de idioma (atualmente suporta 'en' e 'pt')
+            batch_size: Número de textos por lote de inferência no modo BERT
+            cache: Cache de resultados por hash do texto (None desativa)
+            workers: Threads do pool que executa a inferência das APIs assíncronas
+            max_queue: Máximo de chamadas assíncronas em execução ou aguardando o pool;
+                as excedentes esperam por uma vaga antes de enfileirar
+            microbatch_max_size: Textos a partir dos quais um micro-lote é despachado sem esperar
+            microbatch_max_wait_ms: Janela para agrupar textos de chamadas assíncronas
+                concorrentes em um único lote (0 desativa o micro-batching)
+            lazy_load: Adia o carregamento do analisador (modelos, léxicos) para load()
+                ou para a primeira análise, em vez de carregar no construtor
+            model_dir: Diretório local com o modelo BERT (tokenizer + pesos); se None,
+                usa o modelo padrão do idioma a partir do hub
+            num_threads: Threads do PyTorch para a inferência em CPU (None mantém o padrão)
+            chunk_long_texts: No modo BERT, divide textos maiores que o limite do modelo em
+                trechos e agrega as probabilidades, em vez de truncar
+            max_chunks: Máximo de trechos analisados por texto
+            chunk_overlap: Tokens compartilhados entre trechos consecutivos
+            token_cache_size: Textos cujos IDs de tokens ficam em cache
         """
         self.sentiment_type = sentiment_type
         self.language = language
+        self.batch_size = max(1, batch_size)
+        self.cache = cache
+        self.model_name = None
+        self.model_dir = model_dir
+        self.num_threads = num_threads
+        self.chunk_long_texts = chunk_long_texts
+        self.max_chunks = max(1, max_chunks)
+        self.chunk_overlap = max(0, chunk_overlap)
+        self.token_cache_size = token_cache_size
+        self._token_cache: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._token_lock = threading.Lock()
+        self._tokenizer_calls = 0
+        self._tokenized_texts = 0
+        self._token_cache_hits = 0
+        self._lexicon_engine = None
+        self.workers = max(1, workers)
+        self.max_queue = max(1, max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='sentiment')
+        self._queue_slots: Optional[asyncio.Semaphore] = None
+        self._batcher: Optional[MicroBatcher] = None
+        if microbatch_max_wait_ms > 0:
+            self._batcher = MicroBatcher(
+                self._analyze_in_pool,
+                max_batch_size=microbatch_max_size,
+                max_wait_ms=microbatch_max_wait_ms,
+                max_concurrency=self.workers
+            )
+        
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        # Provisório até o carregamento, que pode cair para outro analisador
+        self.analyzer_id = sentiment_type
+        
+        if not lazy_load:
+            self.load()
+    
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+    
+    def load(self):
+        """Carrega o analisador configurado (idempotente e seguro entre threads)"""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            self._load_analyzer()
+            self._loaded = True
+    
+    def _load_analyzer(self):
+        """Inicializa o analisador, com fallback BERT -> VADER -> básico em caso de erro"""
+        sentiment_type = self.sentiment_type
         
         # Inicializa o analisador apropriado
         if sentiment_type == self.SENTIMENT_TYPES['BASIC']:
@@ -37,28 +129,20 @@ class SentimentAnalysisService:
             
         elif sentiment_type == self.SENTIMENT_TYPES['VADER']:
             try:
-                nltk.download('vader_lexicon', quiet=True)
-                self.vader = SentimentIntensityAnalyzer()
+                self.vader = load_vader()
             except Exception as e:
                 logger.error(f"Erro ao inicializar VADER: {e}")
                 logger.info("Caindo para análise básica")
                 self.sentiment_type = self.SENTIMENT_TYPES['BASIC']
                 
-        elif sentiment_type == self.SENTIMENT_TYPES['BERT']:
+        elif sentiment_type in (self.SENTIMENT_TYPES['BERT'], self.SENTIMENT_TYPES['BERT_INT8']):
             try:
-                model_name = "distilbert-base-uncased-finetuned-sst-2-english"
-                if language == 'pt':
-                    model_name = "neuralmind/bert-base-portuguese-cased-sentiment"
-                    
-                self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-                self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
-                self.nlp = pipeline("sentiment-analysis", model=self.model, tokenizer=self.tokenizer)
+                self._load_bert(quantize=sentiment_type == self.SENTIMENT_TYPES['BERT_INT8'])
             except Exception as e:
                 logger.error(f"Erro ao inicializar BERT: {e}")
                 logger.info("Caindo para análise VADER")
                 try:
-                    nltk.download('vader_lexicon', quiet=True)
-                    self.vader = SentimentIntensityAnalyzer()
+                    self.vader = load_vader()
                     self.sentiment_type = self.SENTIMENT_TYPES['VADER']
                 except:
                     logger.info("Caindo para análise básica")
@@ -66,9 +150,60 @@ class SentimentAnalysisService:
         else:
             logger.warning(f"Tipo de sentimento '{sentiment_type}' não reconhecido. Usando 'basic'.")
             self.sentiment_type = self.SENTIMENT_TYPES['BASIC']
+        
+        # Identifica o analisador efetivo (após eventuais fallbacks) nas chaves do cache
+        self.analyzer_id = self.sentiment_type
+        if self.uses_bert:
+            self.analyzer_id = f"{self.sentiment_type}:{self.model_name}"
             
         logger.info(f"Serviço de análise de sentimento inicializado com tipo: {self.sentiment_type}")
     
+    def _load_bert(self, quantize: bool = False):
+        """
+        Carrega tokenizer e modelo BERT (a inferência é feita diretamente no modelo,
+        sobre IDs de tokens em cache; ver _forward).
+        
+        Com quantize=True, as camadas lineares são convertidas para int8 com
+        quantização dinâmica (pesos int8, ativações quantizadas em tempo de
+        execução), o que reduz memória e latência em CPU.
+        """
+        import torch
+        from transformers import AutoTokenizer, AutoModelForSequenceClassification
+        
+        if self.num_threads:
+            torch.set_num_threads(self.num_threads)
+        
+        model_name = self.DEFAULT_BERT_MODELS.get(self.language, self.DEFAULT_BERT_MODELS['en'])
+        source = self.model_dir or model_name
+        local_only = self.model_dir is not None
+        
+        # Identifica o modelo nas chaves do cache (nome do hub ou do diretório local)
+        self.model_name = os.path.basename(os.path.normpath(self.model_dir)) if local_only else model_name
+        self.tokenizer = AutoTokenizer.from_pretrained(source, local_files_only=local_only)
+        model = AutoModelForSequenceClassification.from_pretrained(source, local_files_only=local_only)
+        model.eval()
+        if quantize:
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        self.model = model
+    
+    @property
+    def uses_bert(self) -> bool:
+        return self.sentiment_type in (self.SENTIMENT_TYPES['BERT'], self.SENTIMENT_TYPES['BERT_INT8'])
+    
+    @staticmethod
+    def _neutral_result() -> Dict[str, Any]:
+        return {
+            'polarity': 0.0,         # Varia de -1 (negativo) a 1 (positivo)
+            'subjectivity': 0.0,     # Varia de 0 (objetivo) a 1 (subjetivo)
+            'sentiment': 'neutral',  # 'positive', 'negative', ou 'neutral'
+            'confidence': 0.0        # Confiança na classificação
+        }
+    
+    @staticmethod
+    def _is_analyzable(text: str) -> bool:
+        """Textos vazios ou muito curtos recebem o resultado neutro sem análise"""
+        return bool(text) and len(text.strip()) >= 10
+    
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """
         Analisa o sentimento de um texto.
@@ -79,14 +214,15 @@ class SentimentAnalysisService:
         Returns:
             Dicionário com pontuações de sentimento e outras métricas
         """
-        if not text or len(text.strip()) < 10:
-            return {
-                'polarity': 0.0,         # Varia de -1 (negativo) a 1 (positivo)
-                'subjectivity': 0.0,     # Varia de 0 (objetivo) a 1 (subjetivo)
-                'sentiment': 'neutral',  # 'positive', 'negative', ou 'neutral'
-                'confidence': 0.0        # Confiança na classificação
-            }
-            
+        if not self._is_analyzable(text):
+            return self._neutral_result()
+        self.load()
+        if self.cache is not None:
+            return self.analyze_batch([text])[0]
+        return self._analyze_uncached(text)
+    
+    def _analyze_uncached(self, text: str) -> Dict[str, Any]:
+        """Executa o analisador configurado sobre um texto, sem consultar o cache"""
         try:
             if self.sentiment_type == self.SENTIMENT_TYPES['BASIC']:
                 return self._analyze_with_textblob(text)
@@ -94,7 +230,7 @@ class SentimentAnalysisService:
             elif self.sentiment_type == self.SENTIMENT_TYPES['VADER']:
                 return self._analyze_with_vader(text)
                 
-            elif self.sentiment_type == self.SENTIMENT_TYPES['BERT']:
+            elif self.uses_bert:
                 return self._analyze_with_bert(text)
                 
         except Exception as e:
@@ -104,19 +240,18 @@ class SentimentAnalysisService:
                 return self._analyze_with_textblob(text)
             except:
                 # Retornar valores neutros em caso de falha total
-                return {
-                    'polarity': 0.0,
-                    'subjectivity': 0.0,
-                    'sentiment': 'neutral',
-                    'confidence': 0.0
-                }
+                return self._neutral_result()
     
     def _analyze_with_textblob(self, text: str) -> Dict[str, Any]:
         """Analisa sentimento usando TextBlob (rápido mas básico)"""
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
-        subjectivity = blob.sentiment.subjectivity
+        from textblob import TextBlob
         
+        blob = TextBlob(text)
+        return self._textblob_result(blob.sentiment.polarity, blob.sentiment.subjectivity)
+    
+    @staticmethod
+    def _textblob_result(polarity: float, subjectivity: float) -> Dict[str, Any]:
+        """Classifica a polaridade do TextBlob (usado pela análise por texto e em lote)"""
         # Determina o sentimento com base na polaridade
         if polarity > 0.1:
             sentiment = 'positive'
@@ -140,10 +275,15 @@ class SentimentAnalysisService:
         scores = self.vader.polarity_scores(text)
         
         # VADER retorna scores compound, neg, neu, pos
-        polarity = scores['compound']  # Varia de -1 a 1
+        return self._vader_result(scores['compound'], scores['neg'], scores['neu'], scores['pos'])
+    
+    @staticmethod
+    def _vader_result(compound: float, negative: float, neutral: float, positive: float) -> Dict[str, Any]:
+        """Classifica os scores do VADER (usado pela análise por texto e em lote)"""
+        polarity = compound  # Varia de -1 a 1
         
         # Estima subjetividade baseado em ausência de neutralidade
-        subjectivity = 1.0 - scores['neu']
+        subjectivity = 1.0 - neutral
         
         # Determina sentimento baseado no score composto
         if polarity >= 0.05:
@@ -162,25 +302,117 @@ class SentimentAnalysisService:
             'sentiment': sentiment,
             'confidence': confidence,
             'detailed_scores': {
-                'negative': scores['neg'],
-                'neutral': scores['neu'],
-                'positive': scores['pos']
+                'negative': negative,
+                'neutral': neutral,
+                'positive': positive
             }
         }
         
     def _analyze_with_bert(self, text: str) -> Dict[str, Any]:
         """Analisa sentimento usando modelo BERT (mais preciso mas mais lento)"""
-        # Limita tamanho do texto para evitar problemas com sequências muito longas
-        max_length = 512
-        if len(text) > max_length:
-            # Usa os primeiros n caracteres (poderia ser otimizado)
-            text = text[:max_length]
-            
-        # Executa a inferência
-        results = self.nlp(text)
-        result = results[0]  # Pega o primeiro resultado
+        sequences = self._chunks(self._token_ids([text])[0])
+        probabilities = self._forward(sequences)
+        if np.isnan(probabilities).any():
+            raise RuntimeError("Falha na inferência BERT")
+        lengths = [len(sequence) for sequence in sequences]
+        return self._probabilities_to_analysis(self._aggregate_chunks(probabilities, lengths))
+    
+    def _token_ids(self, texts: List[str]) -> List[List[int]]:
+        """
+        IDs de tokens (sem tokens especiais) de cada texto.
         
-        # Mapeia o resultado para nosso formato padrão
+        A tokenização completa é feita uma única vez por texto, em uma chamada em
+        lote para os textos ainda não vistos, e guardada em um LRU; truncamento e
+        divisão em trechos operam sobre os IDs em cache.
+        """
+        found: Dict[str, List[int]] = {}
+        with self._token_lock:
+            for text in texts:
+                ids = self._token_cache.get(text)
+                if ids is not None:
+                    self._token_cache.move_to_end(text)
+                    found[text] = ids
+        
+        missing = list(dict.fromkeys(text for text in texts if text not in found))
+        if missing:
+            encoded = self.tokenizer(missing, add_special_tokens=False, truncation=False, verbose=False)
+            with self._token_lock:
+                for text, ids in zip(missing, encoded['input_ids']):
+                    found[text] = ids
+                    self._token_cache[text] = ids
+                while len(self._token_cache) > self.token_cache_size:
+                    self._token_cache.popitem(last=False)
+        
+        # Chamado em paralelo pelas threads do executor: contadores só sob o lock
+        with self._token_lock:
+            self._tokenizer_calls += int(bool(missing))
+            self._tokenized_texts += len(missing)
+            self._token_cache_hits += len(texts) - len(missing)
+        return [found[text] for text in texts]
+    
+    @property
+    def _max_content_tokens(self) -> int:
+        """Tokens de conteúdo por sequência (limite do modelo menos os tokens especiais)"""
+        max_length = min(self.tokenizer.model_max_length, self.model.config.max_position_embeddings)
+        return max_length - self.tokenizer.num_special_tokens_to_add()
+    
+    def _chunks(self, ids: List[int]) -> List[List[int]]:
+        """
+        Sequências a inferir para um texto: apenas o início truncado por tokens ou,
+        no modo de trechos, janelas sobrepostas cobrindo até max_chunks trechos.
+        """
+        size = self._max_content_tokens
+        if not self.chunk_long_texts or len(ids) <= size:
+            return [ids[:size]]
+        step = max(1, size - self.chunk_overlap)
+        return [ids[start:start + size] for start in range(0, len(ids) - self.chunk_overlap, step)][:self.max_chunks]
+    
+    def _forward(self, sequences: List[List[int]]) -> np.ndarray:
+        """
+        Executa o modelo sobre sequências de IDs já tokenizadas.
+        
+        As sequências são ordenadas por tamanho e processadas em lotes de
+        batch_size (menos padding). Lotes que falham ficam com NaN.
+        
+        Returns:
+            Probabilidades por classe (sequências × classes), na ordem recebida
+        """
+        import torch
+        
+        probabilities = np.zeros((len(sequences), self.model.config.num_labels), dtype=np.float32)
+        order = sorted(range(len(sequences)), key=lambda i: len(sequences[i]))
+        
+        for start in range(0, len(order), self.batch_size):
+            batch = order[start:start + self.batch_size]
+            try:
+                encoded = self.tokenizer.pad(
+                    {'input_ids': [self.tokenizer.build_inputs_with_special_tokens(sequences[i]) for i in batch]},
+                    return_tensors='pt'
+                )
+                with torch.inference_mode():
+                    logits = self.model(**encoded).logits
+                probabilities[batch] = torch.softmax(logits.float(), dim=-1).numpy()
+            except Exception as e:
+                logger.error(f"Erro na inferência em lote: {e}")
+                probabilities[batch] = np.nan
+        
+        return probabilities
+    
+    @staticmethod
+    def _aggregate_chunks(probabilities: np.ndarray, lengths: Optional[List[int]] = None) -> np.ndarray:
+        """Média das probabilidades dos trechos de um texto, ponderada pelo tamanho"""
+        weights = np.asarray(lengths if lengths else [1] * len(probabilities), dtype=np.float32)
+        return (probabilities * weights[:, None]).sum(axis=0) / max(weights.sum(), 1.0)
+    
+    def _probabilities_to_analysis(self, probabilities: np.ndarray) -> Dict[str, Any]:
+        index = int(np.argmax(probabilities))
+        return self._bert_result_to_analysis({
+            'label': self.model.config.id2label[index],
+            'score': float(probabilities[index])
+        })
+    
+    def _bert_result_to_analysis(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Mapeia a saída do classificador BERT (rótulo e probabilidade) para nosso formato padrão"""
         label = result['label'].lower()
         score = result['score']
         
@@ -203,22 +435,246 @@ class SentimentAnalysisService:
             'sentiment': sentiment,
             'confidence': score
         }
+    
+    def _analyze_batch_with_bert(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Inferência BERT em lotes.
+        
+        Cada texto é tokenizado uma vez (com cache) e truncado por tokens; no modo
+        de trechos, os trechos de todos os textos são inferidos juntos e as
+        probabilidades agregadas por texto. Textos cujo lote falhou são
+        reanalisados individualmente.
+        """
+        sequences, owners = [], []
+        for index, ids in enumerate(self._token_ids(texts)):
+            for chunk in self._chunks(ids):
+                sequences.append(chunk)
+                owners.append(index)
+        
+        probabilities = self._forward(sequences)
+        
+        chunks_by_text: Dict[int, List[int]] = {}
+        for position, index in enumerate(owners):
+            chunks_by_text.setdefault(index, []).append(position)
+        
+        results = []
+        for index, text in enumerate(texts):
+            positions = chunks_by_text[index]
+            text_probabilities = probabilities[positions]
+            if np.isnan(text_probabilities).any():
+                results.append(self._analyze_uncached(text))
+                continue
+            lengths = [len(sequences[position]) for position in positions]
+            results.append(self._probabilities_to_analysis(self._aggregate_chunks(text_probabilities, lengths)))
+        
+        return results
+    
+    def _compute_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Analisa textos válidos com o analisador configurado, sem cache"""
+        if self.uses_bert:
+            return self._analyze_batch_with_bert(texts)
+        return [self._analyze_uncached(text) for text in texts]
         
     def analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
         """
         Analisa sentimento para uma lista de textos.
         
+        Resultados já conhecidos vêm do cache (quando configurado); textos
+        repetidos na lista são analisados uma única vez.
+        
         Args:
             texts: Lista de textos para análise
             
         Returns:
             Lista de resultados de análise, um para cada texto
         """
-        results = []
-        for text in texts:
-            results.append(self.analyze_text(text))
+        self.load()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        pending = []
+        for index, text in enumerate(texts):
+            if self._is_analyzable(text):
+                pending.append(index)
+            else:
+                results[index] = self._neutral_result()
+        
+        if self.cache is not None and pending:
+            cached = self.cache.get_many([texts[i] for i in pending], self.analyzer_id)
+            for index in pending:
+                if texts[index] in cached:
+                    results[index] = cached[texts[index]]
+            pending = [index for index in pending if results[index] is None]
+        
+        if pending:
+            unique_texts = {normalize_text(texts[i]): texts[i] for i in pending}
+            computed = dict(zip(unique_texts.values(), self._compute_batch(list(unique_texts.values()))))
+            for index in pending:
+                results[index] = dict(computed[unique_texts[normalize_text(texts[index])]])
+            if self.cache is not None:
+                self.cache.put_many(computed, self.analyzer_id)
+        
         return results
         
+    def _get_lexicon_engine(self) -> LexiconSentimentEngine:
+        """Motor vetorizado do léxico do analisador atual (criado na primeira chamada)"""
+        if self._lexicon_engine is None:
+            if self.sentiment_type == self.SENTIMENT_TYPES['VADER']:
+                self._lexicon_engine = LexiconSentimentEngine('vader', self.vader.lexicon)
+            else:
+                self._lexicon_engine = LexiconSentimentEngine('textblob')
+        return self._lexicon_engine
+    
+    def analyze_bulk(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analisa um volume grande de textos de uma vez (re-pontuação em massa).
+        
+        Nos modos 'basic' e 'vader' o lote inteiro é pontuado pelo motor
+        vetorizado de léxico, cujos resultados acompanham os da análise por
+        texto dentro de uma tolerância (veja validate_bulk); no BERT equivale a
+        analyze_batch. O cache não é consultado nem alimentado.
+        
+        Args:
+            texts: Lista de textos para análise
+            
+        Returns:
+            Lista de resultados de análise, um para cada texto
+        """
+        self.load()
+        if self.uses_bert:
+            return self._compute_batch(texts)
+        
+        results: List[Dict[str, Any]] = [self._neutral_result() for _ in texts]
+        pending = [index for index, text in enumerate(texts) if self._is_analyzable(text)]
+        if not pending:
+            return results
+        
+        engine = self._get_lexicon_engine()
+        scores = engine.score([texts[i] for i in pending])
+        for position, index in enumerate(pending):
+            if engine.kind == 'vader':
+                results[index] = self._vader_result(
+                    float(scores['polarity'][position]),
+                    float(scores['negative'][position]),
+                    float(scores['neutral'][position]),
+                    float(scores['positive'][position])
+                )
+            else:
+                results[index] = self._textblob_result(
+                    float(scores['polarity'][position]),
+                    float(scores['subjectivity'][position])
+                )
+        return results
+    
+    def validate_bulk(self, texts: List[str], tolerance: float = 0.05) -> Dict[str, Any]:
+        """
+        Compara analyze_bulk com a análise texto a texto do analisador configurado.
+        
+        Args:
+            texts: Amostra de textos
+            tolerance: Diferença máxima de polaridade considerada equivalente
+            
+        Returns:
+            Erro absoluto médio e máximo da polaridade, fração dentro da tolerância
+            e concordância de rótulos
+        """
+        self.load()
+        texts = [text for text in texts if self._is_analyzable(text)]
+        if not texts:
+            return {'texts': 0, 'mean_abs_error': 0.0, 'max_abs_error': 0.0,
+                    'within_tolerance': 1.0, 'label_agreement': 1.0}
+        
+        bulk = self.analyze_bulk(texts)
+        reference = [self._analyze_uncached(text) for text in texts]
+        errors = np.abs(np.array([r['polarity'] for r in bulk]) - np.array([r['polarity'] for r in reference]))
+        return {
+            'texts': len(texts),
+            'mean_abs_error': float(errors.mean()),
+            'max_abs_error': float(errors.max()),
+            'within_tolerance': float(np.mean(errors <= tolerance)),
+            'label_agreement': float(np.mean([
+                b['sentiment'] == r['sentiment'] for b, r in zip(bulk, reference)
+            ]))
+        }
+        
+    async def _analyze_in_pool(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Executa analyze_batch no pool de threads, respeitando o limite de fila"""
+        if self._queue_slots is None:
+            self._queue_slots = asyncio.Semaphore(self.max_queue)
+        
+        async with self._queue_slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self.analyze_batch, texts)
+    
+    async def analyze_batch_async(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Versão assíncrona de analyze_batch.
+        
+        A inferência roda no pool de threads do serviço, sem bloquear o event loop.
+        No máximo max_queue chamadas ficam pendentes no pool; as demais aguardam.
+        Com micro-batching habilitado, textos de chamadas concorrentes são
+        agrupados em um único lote e cada chamador recebe os próprios resultados.
+        """
+        if not texts:
+            return []
+        if self._batcher is not None:
+            return await self._batcher.submit(texts)
+        return await self._analyze_in_pool(texts)
+    
+    async def analyze_text_async(self, text: str) -> Dict[str, Any]:
+        """Versão assíncrona de analyze_text (executada no pool de threads)"""
+        if not self._is_analyzable(text):
+            return self._neutral_result()
+        return (await self.analyze_batch_async([text]))[0]
+    
+    def _warm_up(self, inferences: int):
+        """Carrega o analisador e executa inferências de aquecimento (sem passar pelo cache)"""
+        self.load()
+        samples = [
+            "The new model release was received with great enthusiasm by researchers.",
+            "Critics warned that the rollout was rushed and riddled with problems."
+        ]
+        for _ in range(max(0, inferences)):
+            # Um texto isolado e um lote cheio, os dois formatos vistos nas requisições
+            self._compute_batch(samples[:1])
+            self._compute_batch((samples * self.batch_size)[:self.batch_size])
+    
+    async def warm_up(self, inferences: int = 2):
+        """
+        Pré-carrega modelos/léxicos e aquece a inferência no pool de threads.
+        
+        Args:
+            inferences: Rodadas de inferência de aquecimento após o carregamento
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._warm_up, inferences)
+        logger.info(f"Aquecimento do analisador de sentimento concluído ({self.analyzer_id})")
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Configuração efetiva e métricas do micro-batching"""
+        return {
+            'analyzer': self.analyzer_id,
+            'loaded': self._loaded,
+            'workers': self.workers,
+            'max_queue': self.max_queue,
+            'cache_entries': len(self.cache) if self.cache is not None else None,
+            'tokenizer': self._tokenizer_metrics() if self.uses_bert else None,
+            'microbatch': self._batcher.metrics() if self._batcher is not None else None
+        }
+    
+    def _tokenizer_metrics(self) -> Dict[str, Any]:
+        with self._token_lock:
+            return {
+                'calls': self._tokenizer_calls,
+                'tokenized_texts': self._tokenized_texts,
+                'cache_hits': self._token_cache_hits,
+                'cache_entries': len(self._token_cache)
+            }
+    
+    async def close(self):
+        """Encerra o micro-batcher e o pool de threads de inferência"""
+        if self._batcher is not None:
+            await self._batcher.close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        
     def analyze_news_cluster(self, news_cluster: List[Dict]) -> Dict[str, Any]:
         """
         Analisa o sentimento em um cluster de notícias similares.
@@ -236,28 +692,45 @@ class SentimentAnalysisService:
                 'sources': []
             }
             
-        # Analisa cada fonte
-        sources_analysis = []
-        polarities = []
+        # Combina título e descrição para análise (um único lote para todas as fontes)
+        analyses = self.analyze_batch([f"{news['title']} {news['description']}" for news in news_cluster])
         
-        for news in news_cluster:
-            # Combina título e descrição para análise
-            text = f"{news['title']} {news['description']}"
-            analysis = self.analyze_text(text)
-            
-            source_info = {
+        sources_analysis = []
+        for news, analysis in zip(news_cluster, analyses):
+            sources_analysis.append({
                 'source': news['source'],
                 'sentiment': analysis['sentiment'],
                 'polarity': analysis['polarity'],
                 'subjectivity': analysis['subjectivity'],
                 'confidence': analysis['confidence']
-            }
+            })
             
-            sources_analysis.append(source_info)
-            polarities.append(analysis['polarity'])
+        return self.summarize_sources(sources_analysis)
+    
+    @staticmethod
+    def summarize_sources(sources_analysis: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Calcula as métricas de um cluster a partir das análises de cada fonte.
+        
+        Args:
+            sources_analysis: Análises por fonte (com 'source' e os campos de analyze_text)
             
+        Returns:
+            Sentimento geral, variância, nível de consenso e fontes extremas
+        """
+        if not sources_analysis:
+            return {
+                'overall_sentiment': 'neutral',
+                'mean_polarity': 0.0,
+                'sentiment_variance': 0.0,
+                'consensus_level': 'high',
+                'most_positive_source': None,
+                'most_negative_source': None,
+                'sources': []
+            }
+        
         # Calcula métricas globais
-        polarities = np.array(polarities)
+        polarities = np.array([source['polarity'] for source in sources_analysis])
         mean_polarity = np.mean(polarities)
         variance = np.var(polarities)
         
@@ -270,9 +743,9 @@ class SentimentAnalysisService:
             overall_sentiment = 'neutral'
             
         # Identifica fontes mais positivas e negativas
-        sources_analysis.sort(key=lambda x: x['polarity'], reverse=True)
-        most_positive = sources_analysis[0] if sources_analysis and sources_analysis[0]['polarity'] > 0 else None
-        most_negative = sources_analysis[-1] if sources_analysis and sources_analysis[-1]['polarity'] < 0 else None
+        sources_analysis = sorted(sources_analysis, key=lambda x: x['polarity'], reverse=True)
+        most_positive = sources_analysis[0] if sources_analysis[0]['polarity'] > 0 else None
+        most_negative = sources_analysis[-1] if sources_analysis[-1]['polarity'] < 0 else None
         
         # Calcula o grau de consenso/divergência
         if variance < 0.03:
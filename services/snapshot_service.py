@@ -0,0 +1,127 @@
+# services/snapshot_service.py
+
+import asyncio
+import logging
+import re
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_TERM = re.compile(r"\w+")
+
+
+def snapshot_terms(*texts: Optional[str]) -> List[str]:
+    """Termos distintos (minúsculos) dos textos, gravados em snapshot_items.terms"""
+    return sorted({term for text in texts if text for term in _TERM.findall(text.lower())})
+
+
+def model_payload(model) -> Dict[str, Any]:
+    """Dicionário de um modelo Pydantic (model_dump no v2, dict no v1)"""
+    if hasattr(model, 'model_dump'):
+        return model.model_dump()
+    return model.dict()
+
+
+def keyword_term_groups(keywords: Optional[List[str]]) -> List[List[str]]:
+    """Termos de cada palavra-chave ("machine learning" -> ['learning', 'machine'])"""
+    return [terms for terms in (snapshot_terms(keyword) for keyword in keywords or []) if terms]
+
+
+class SnapshotService:
+    """
+    Materializa e lê snapshots de curadoria.
+
+    O coletor executa o pipeline completo (RSS, TF-IDF, clustering e
+    sentimento) sem palavras-chave e com limites amplos e grava o resultado
+    ranqueado; a API então responde com consultas indexadas ao snapshot mais
+    recente (filtro por palavra-chave via índice GIN sobre os termos e limite
+    pela ordem de ranking), sem buscar conteúdo externo na requisição.
+
+    Diferente do filtro ao vivo (substring no texto), uma palavra-chave
+    corresponde quando todos os seus termos aparecem no título ou descrição.
+    """
+
+    def __init__(self, session_factory: Callable[[], ContextManager], max_age_hours: float = 6.0,
+                 keep: int = 3):
+        """
+        Args:
+            session_factory: Gerenciador de contexto de sessão (ex.: get_db_session)
+            max_age_hours: Idade máxima de um snapshot servido (mais velho = sem snapshot)
+            keep: Snapshots mantidos no banco após cada materialização
+        """
+        self.session_factory = session_factory
+        self.max_age_hours = max_age_hours
+        self.keep = keep
+
+    async def materialize(self, curator, max_news: int = 200, max_repos: int = 20) -> Optional[int]:
+        """
+        Executa a curadoria completa e grava o snapshot.
+
+        Args:
+            curator: SentimentEnhancedContentCurator usado no pipeline
+            max_news: Notícias materializadas (limite para requisições com palavra-chave)
+            max_repos: Repositórios materializados
+
+        Returns:
+            Id do snapshot gravado, ou None se a curadoria não trouxe conteúdo
+        """
+        content = await curator.get_curated_content({
+            'max_news': max_news,
+            'max_papers': 0,
+            'max_repos': max_repos,
+            'keywords': None,
+            'include_sentiment': True
+        })
+        if (content.metadata or {}).get('error') or not (content.news or content.repos):
+            logger.warning("Curadoria sem conteúdo; snapshot não materializado")
+            return None
+
+        news = [
+            (model_payload(item), snapshot_terms(item.title, item.description))
+            for item in content.news
+        ]
+        repos = [
+            (model_payload(repo), snapshot_terms(repo.name, repo.summary))
+            for repo in content.repos
+        ]
+        analyzer = curator.sentiment_service.analyzer_id
+        return await asyncio.to_thread(self._save, news, repos, analyzer)
+
+    def _save(self, news, repos, analyzer: str) -> int:
+        from repositories.snapshot_repository import SnapshotRepository
+
+        with self.session_factory() as session:
+            snapshot_repo = SnapshotRepository(session)
+            snapshot = snapshot_repo.create_snapshot(news, repos, analyzer)
+            removed = snapshot_repo.prune(self.keep)
+            logger.info(
+                f"Snapshot {snapshot.id} materializado: {len(news)} notícias, {len(repos)} repositórios "
+                f"({removed} snapshots antigos removidos)"
+            )
+            return snapshot.id
+
+    async def load(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Lê do snapshot mais recente os itens da requisição.
+
+        Returns:
+            Dicionário com 'news' e 'repos' (payloads), 'snapshot_id' e
+            'created_at', ou None se não há snapshot dentro da idade máxima
+        """
+        return await asyncio.to_thread(self._load, request)
+
+    def _load(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        from repositories.snapshot_repository import SnapshotRepository
+
+        with self.session_factory() as session:
+            snapshot_repo = SnapshotRepository(session)
+            snapshot = snapshot_repo.get_latest(self.max_age_hours)
+            if snapshot is None:
+                return None
+            term_groups = keyword_term_groups(request.get('keywords'))
+            return {
+                'snapshot_id': snapshot.id,
+                'created_at': snapshot.created_at,
+                'news': snapshot_repo.find_items(snapshot.id, 'news', term_groups, request.get('max_news', 10)),
+                'repos': snapshot_repo.find_items(snapshot.id, 'repo', term_groups, request.get('max_repos', 5))
+            }
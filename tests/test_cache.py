@@ -0,0 +1,129 @@
+# tests/test_cache.py
+
+import asyncio
+
+from services.news_service import NewsService
+from utils.cache import SingleFlight, TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_fresh_stale_and_expired():
+    clock = FakeClock()
+    cache = TTLCache(ttl_seconds=10, max_stale_seconds=20, clock=clock)
+    cache.set('k', 'v')
+
+    clock.now += 10
+    assert not cache.is_stale(cache.get('k'))
+    clock.now += 5
+    assert cache.is_stale(cache.get('k'))
+    clock.now += 16
+    assert cache.get('k') is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(ttl_seconds=10, max_entries=2, clock=FakeClock())
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert (cache.get('a').value, cache.get('c').value) == (1, 3)
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 'resultado'
+
+    async def main():
+        flight = SingleFlight()
+        results = await asyncio.gather(*(flight.run('k', compute) for _ in range(5)))
+        return results, len(flight)
+
+    results, inflight = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert [value for value, _ in results] == ['resultado'] * 5
+    assert [coalesced for _, coalesced in results] == [False] + [True] * 4
+    assert inflight == 0
+
+
+def scored(title):
+    return {
+        'title': title, 'description': 'texto', 'link': f"https://example.com/{title}",
+        'source': 'Example', 'engagement': '', 'additional_info': {'importance_score': 1.0}
+    }
+
+
+class CountingNewsService(NewsService):
+    """NewsService cujos feeds são substituídos por uma lista fixa de lotes de resultados"""
+
+    def __init__(self, results, **kwargs):
+        super().__init__([], **kwargs)
+        self.results = list(results)
+        self.collected = []
+
+    async def _collect_scored_news(self, keywords=None):
+        self.collected.append(keywords)
+        await asyncio.sleep(0.01)
+        return self.results.pop(0)
+
+
+def test_news_cache_normalizes_keywords():
+    service = CountingNewsService([[scored('a')]], cache_ttl=60)
+
+    async def main():
+        await service.get_top_news(5, ['AI', ' robots'])
+        return await service.get_top_news(5, ['robots', 'ai', 'Ai '])
+
+    news = asyncio.run(main())
+
+    assert [item.title for item in news] == ['a']
+    assert len(service.collected) == 1
+
+
+def test_news_cache_serves_stale_while_refreshing():
+    clock = FakeClock()
+    service = CountingNewsService([[scored('old')], [scored('new')]])
+    service.results_cache = TTLCache(ttl_seconds=10, max_stale_seconds=60, clock=clock)
+
+    async def main():
+        first = await service.get_top_news(5)
+        clock.now += 30
+        stale = await service.get_top_news(5)
+        await asyncio.gather(*service._refresh_tasks.values())
+        fresh = await service.get_top_news(5)
+        return first, stale, fresh
+
+    first, stale, fresh = asyncio.run(main())
+
+    assert [item.title for item in first] == ['old']
+    assert [item.title for item in stale] == ['old']
+    assert [item.title for item in fresh] == ['new']
+    assert len(service.collected) == 2
+
+
+def test_news_cache_coalesces_cold_misses_and_skips_empty_results():
+    service = CountingNewsService([[], [scored('a')]], cache_ttl=60)
+
+    async def main():
+        empty = await asyncio.gather(*(service.get_top_news(5) for _ in range(3)))
+        return empty, await service.get_top_news(5)
+
+    empty, news = asyncio.run(main())
+
+    assert empty == [[], [], []]
+    assert [item.title for item in news] == ['a']
+    assert len(service.collected) == 2
@@ -0,0 +1,114 @@
+# tests/test_clustering.py
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from services.news_service import NewsService
+from utils.clustering import NewsClusteringService, leader_clusters, sparse_neighbor_graph
+
+TOPICS = [
+    "OpenAI releases new GPT model with better reasoning",
+    "Nvidia reports record data center revenue from AI chips",
+    "European Union approves the AI Act regulation",
+    "Google DeepMind robot learns to cook from videos",
+    "Startup raises funding for open source vector database",
+]
+VARIANTS = [
+    "{topic}",
+    "{topic} analysts say",
+    "Report: {topic}",
+    "{topic} in surprise announcement",
+]
+
+
+def corpus():
+    """Corpus fixo: variações de alguns tópicos intercaladas, mais notícias isoladas"""
+    items = [
+        {'title': variant.format(topic=topic), 'description': f"Coverage of {topic.lower()}"}
+        for variant in VARIANTS for topic in TOPICS
+    ]
+    # Notícias que ligam dois tópicos: a ordem dos líderes passa a importar
+    items += [
+        {'title': "OpenAI GPT model runs on Nvidia AI chips", 'description': "Data center revenue and reasoning"},
+        {'title': "EU AI Act regulation hits OpenAI GPT model", 'description': "Coverage of the approval"},
+        {'title': "DeepMind robot uses open source vector database", 'description': "Startup funding news"},
+    ]
+    items += [
+        {'title': "Weather forecast for the weekend", 'description': "Sunny with light winds"},
+        {'title': "Local football team wins the cup", 'description': "Fans celebrate downtown"},
+    ]
+    return items
+
+
+def titles(clusters):
+    return [[item['title'] for item in cluster] for cluster in clusters]
+
+
+@pytest.mark.parametrize('threshold', [0.2, 0.3, 0.5])
+@pytest.mark.parametrize('dedupe_threshold', [None, 0.8])
+def test_sparse_matches_dense_leader_clusters(threshold, dedupe_threshold):
+    items = corpus()
+    dense = NewsClusteringService(threshold, method='dense', dedupe_threshold=dedupe_threshold).cluster_news(items)
+    sparse = NewsClusteringService(threshold, method='sparse', dedupe_threshold=dedupe_threshold).cluster_news(items)
+
+    assert titles(sparse) == titles(dense)
+    assert sorted(len(cluster) for cluster in dense) != [1] * len(items)
+
+
+def test_sparse_chunking_does_not_change_clusters():
+    items = corpus()
+    service = NewsClusteringService(0.5, method='sparse', dedupe_threshold=None)
+    x = service.vectorizer.fit_transform([f"{item['title']} {item['description']}" for item in items])
+
+    whole = leader_clusters(sparse_neighbor_graph(x, 0.5))
+    chunked = leader_clusters(sparse_neighbor_graph(x, 0.5, chunk_size=3))
+
+    assert chunked == whole
+
+
+def test_single_linkage_merges_leader_clusters():
+    items = corpus()
+    leader = NewsClusteringService(0.2, method='sparse', dedupe_threshold=None).cluster_news(items)
+    single = NewsClusteringService(0.2, linkage='single', dedupe_threshold=None).cluster_news(items)
+
+    assert len(single) < len(leader)
+    assert sum(len(cluster) for cluster in single) == len(items)
+
+
+class CorpusNewsService(NewsService):
+    """NewsService que pontua um corpus fixo em vez de buscar os feeds"""
+
+    def __init__(self, items):
+        super().__init__([])
+        self.items = items
+
+    async def _collect_scored_news(self, keywords=None):
+        # As notícias do corpus vêm primeiro; as demais só entram no corpus inteiro
+        return [
+            {**item, 'link': f"https://example.com/{i}", 'source': 'Example', 'engagement': None,
+             'additional_info': {'importance_score': 1.0 - i / len(self.items)},
+             'full_text': f"{item['title']} {item['description']}"}
+            for i, item in enumerate(self.items)
+        ]
+
+
+@pytest.mark.parametrize('threshold', [0.2, 0.3, 0.5])
+@pytest.mark.parametrize('dedupe_threshold', [None, 0.8])
+def test_top_news_vectors_do_not_change_clusters(threshold, dedupe_threshold):
+    top = corpus()
+    rest = [
+        {'title': f"{topic} follow-up {n}", 'description': "More coverage of AI chips and models"}
+        for n in range(20) for topic in TOPICS
+    ]
+    service = CorpusNewsService(top + rest)
+
+    news_items, x = asyncio.run(service.get_top_news_with_vectors(len(top)))
+    items = [{'title': item.title, 'description': item.description, 'additional_info': item.additional_info}
+             for item in news_items]
+    clustering = NewsClusteringService(threshold, dedupe_threshold=dedupe_threshold)
+
+    fresh = clustering.vectorizer.fit_transform([f"{item['title']} {item['description']}" for item in items])
+    assert np.allclose(x.toarray(), fresh.toarray())
+    assert titles(clustering.cluster_news(items, x)) == titles(clustering.cluster_news(items))
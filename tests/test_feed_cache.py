@@ -0,0 +1,104 @@
+# tests/test_feed_cache.py
+
+import asyncio
+import os
+
+from services.news_service import NewsService
+from utils.feed_cache import FeedCache
+
+URL = "https://example.com/feed.xml"
+RSS = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><title>First story</title><link>https://example.com/1</link>
+<description>Something happened</description><pubDate>Sat, 17 Oct 2026 10:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+class FakeResponse:
+    def __init__(self, status, body="", headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def text(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Responde 200 com ETag na primeira requisição e 304 quando recebe If-None-Match"""
+
+    closed = False
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, headers=None):
+        self.requests.append(dict(headers or {}))
+        if (headers or {}).get('If-None-Match') == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(200, RSS, {'ETag': '"v1"'})
+
+
+def test_conditional_headers_use_stored_validators():
+    cache = FeedCache()
+    entry = cache.put(URL, "<rss/>", etag='"v1"', last_modified="Sat, 17 Oct 2026 10:00:00 GMT")
+
+    assert entry.conditional_headers() == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': "Sat, 17 Oct 2026 10:00:00 GMT"
+    }
+    assert cache.put(URL, "<rss/>").conditional_headers() == {}
+
+
+def test_entries_persist_across_instances(tmp_path):
+    FeedCache(str(tmp_path)).put(URL, "<rss>1</rss>", etag='"v1"')
+
+    entry = FeedCache(str(tmp_path)).get(URL)
+
+    assert entry is not None
+    assert (entry.body, entry.etag, entry.items) == ("<rss>1</rss>", '"v1"', None)
+
+
+def test_touch_refreshes_fetched_at():
+    cache = FeedCache()
+    entry = cache.put(URL, "<rss/>")
+    entry.fetched_at = 0.0
+
+    assert cache.touch(URL).fetched_at > 0.0
+    assert cache.touch("https://example.com/other.xml") is None
+
+
+def test_corrupted_file_is_ignored(tmp_path):
+    cache = FeedCache(str(tmp_path))
+    cache.put(URL, "<rss/>")
+    path = os.path.join(str(tmp_path), os.listdir(str(tmp_path))[0])
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("{not json")
+
+    assert FeedCache(str(tmp_path)).get(URL) is None
+
+
+def test_not_modified_feed_reuses_parsed_items():
+    service = NewsService([URL])
+    service.session = FakeSession()
+    parsed = []
+    parse_feed = service._parse_feed
+
+    async def counting_parse(content, source_url):
+        parsed.append(source_url)
+        return await parse_feed(content, source_url)
+
+    service._parse_feed = counting_parse
+
+    first = asyncio.run(service._fetch_feed(URL))
+    second = asyncio.run(service._fetch_feed(URL))
+
+    assert service.session.requests == [{}, {'If-None-Match': '"v1"'}]
+    assert parsed == [URL]
+    assert [item['title'] for item in second] == [item['title'] for item in first] == ["First story"]
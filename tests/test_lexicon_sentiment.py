@@ -0,0 +1,94 @@
+# tests/test_lexicon_sentiment.py
+
+import pytest
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+from services.sentiment_service import SentimentAnalysisService
+
+TOLERANCE = 0.05
+
+TEXTS = [
+    "The new model is good",
+    "The new model is not good",
+    "The launch was great but the pricing is terrible",
+    "The results are very good and extremely promising",
+    "The results are somewhat disappointing",
+    "This is AMAZING news for the industry",
+    "Investors are thrilled!!",
+    "Shares fell sharply after the weak earnings report!!!",
+    "Nothing about this update is bad",
+    "It was hardly a success, but not a disaster either",
+    "Regulators approved the merger on Tuesday",
+    ":) great job",
+    "Great results (!)",
+    "So sad :( but really :) good",
+    "<3 this, not bad at all",
+    "",
+    "   ",
+]
+
+# Léxico reduzido no formato do vader_lexicon.txt, para testar sem baixar o do NLTK
+VADER_LEXICON = {
+    'good': 1.9, 'great': 3.1, 'terrible': -2.1, 'promising': 1.7, 'disappointing': -2.2,
+    'amazing': 2.8, 'thrilled': 2.1, 'weak': -1.9, 'bad': -2.5, 'success': 2.7,
+    'disaster': -3.1, 'approved': 1.8, 'fell': -0.5, ':)': 2.0,
+}
+
+
+@pytest.fixture(scope='module')
+def textblob_service():
+    return SentimentAnalysisService('basic')
+
+
+@pytest.fixture(scope='module')
+def vader_service(tmp_path_factory):
+    path = tmp_path_factory.mktemp('vader') / 'vader_lexicon.txt'
+    path.write_text("\n".join(f"{word}\t{valence}\t0.5\t[]" for word, valence in VADER_LEXICON.items()),
+                    encoding='utf-8')
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr('services.sentiment_service.load_vader',
+                      lambda: SentimentIntensityAnalyzer(f"file:{path}"))
+        service = SentimentAnalysisService('vader')
+    assert service.analyzer_id == 'vader'
+    return service
+
+
+def assert_bulk_matches(bulk, reference):
+    for text, b, r in zip(TEXTS, bulk, reference):
+        assert b['sentiment'] == r['sentiment'], text
+        assert b['polarity'] == pytest.approx(r['polarity'], abs=TOLERANCE), text
+
+
+def reference_results(service, analyze):
+    return [
+        analyze(text) if service._is_analyzable(text) else service._neutral_result()
+        for text in TEXTS
+    ]
+
+
+def test_textblob_bulk_matches_per_text(textblob_service):
+    bulk = textblob_service.analyze_bulk(TEXTS)
+
+    assert_bulk_matches(bulk, reference_results(textblob_service, textblob_service._analyze_with_textblob))
+
+
+def test_vader_bulk_matches_per_text(vader_service):
+    bulk = vader_service.analyze_bulk(TEXTS)
+
+    assert_bulk_matches(bulk, reference_results(vader_service, vader_service._analyze_with_vader))
+
+
+@pytest.mark.parametrize('fixture', ['textblob_service', 'vader_service'])
+def test_validate_bulk_reports_agreement(fixture, request):
+    report = request.getfixturevalue(fixture).validate_bulk(TEXTS, tolerance=TOLERANCE)
+
+    assert report['texts'] == len([text for text in TEXTS if text.strip()])
+    assert report['within_tolerance'] == 1.0
+    assert report['label_agreement'] == 1.0
+
+
+def test_empty_texts_are_neutral(textblob_service):
+    results = textblob_service.analyze_bulk(["", "   "])
+
+    assert [result['sentiment'] for result in results] == ['neutral', 'neutral']
+    assert [result['polarity'] for result in results] == [0.0, 0.0]
@@ -0,0 +1,84 @@
+# tests/test_micro_batcher.py
+
+import asyncio
+
+import pytest
+
+from utils.micro_batcher import MicroBatcher
+
+
+def test_each_caller_gets_its_own_results():
+    batches = []
+
+    async def process(items):
+        batches.append(list(items))
+        await asyncio.sleep(0.01)
+        return [item * 10 for item in items]
+
+    async def main():
+        batcher = MicroBatcher(process, max_batch_size=64, max_wait_ms=20)
+        requests = [list(range(start, start + size)) for start, size in ((0, 3), (100, 1), (200, 5), (300, 2))]
+        try:
+            results = await asyncio.gather(*(batcher.submit(items) for items in requests))
+        finally:
+            await batcher.close()
+        return requests, results, batcher.metrics()
+
+    requests, results, metrics = asyncio.run(main())
+
+    assert results == [[item * 10 for item in items] for items in requests]
+    assert len(batches) == 1
+    assert metrics['requests'] == 4 and metrics['items'] == 11 and metrics['batches'] == 1
+
+
+def test_full_batches_are_dispatched_without_waiting():
+    batches = []
+
+    async def process(items):
+        batches.append(len(items))
+        return [item + 1 for item in items]
+
+    async def main():
+        batcher = MicroBatcher(process, max_batch_size=4, max_wait_ms=1000, max_concurrency=2)
+        try:
+            return await asyncio.wait_for(
+                asyncio.gather(*(batcher.submit([i, i]) for i in range(4))), timeout=0.5
+            )
+        finally:
+            await batcher.close()
+
+    results = asyncio.run(main())
+
+    assert results == [[i + 1, i + 1] for i in range(4)]
+    assert batches == [4, 4]
+
+
+def test_batch_error_reaches_every_caller():
+    async def process(items):
+        raise RuntimeError("falha no lote")
+
+    async def main():
+        batcher = MicroBatcher(process, max_wait_ms=10)
+        try:
+            return await asyncio.gather(batcher.submit([1]), batcher.submit([2]), return_exceptions=True)
+        finally:
+            await batcher.close()
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_close_cancels_pending_requests():
+    async def process(items):
+        return items
+
+    async def main():
+        batcher = MicroBatcher(process, max_wait_ms=10_000)
+        pending = asyncio.ensure_future(batcher.submit([1]))
+        await asyncio.sleep(0.01)
+        await batcher.close()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+
+    asyncio.run(main())
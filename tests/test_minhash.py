@@ -0,0 +1,81 @@
+# tests/test_minhash.py
+
+import numpy as np
+
+from utils.clustering import NewsClusteringService
+from utils.minhash import MinHasher, find_near_duplicate_groups
+
+STORY = (
+    "The central bank raised interest rates by a quarter point on Wednesday, "
+    "citing persistent inflation in services and a tight labor market"
+)
+
+
+def test_signatures_are_deterministic_across_instances():
+    a, b = MinHasher(), MinHasher()
+
+    assert np.array_equal(a.signature(STORY), b.signature(STORY))
+    assert a.band_keys(a.signature(STORY)) == b.band_keys(b.signature(STORY))
+
+
+def test_similarity_estimates_jaccard():
+    hasher = MinHasher(num_perm=128, bands=32)
+    syndicated = STORY + " according to officials"
+    unrelated = "A new smartphone with a foldable screen goes on sale next month in Europe and Asia"
+
+    assert hasher.similarity(hasher.signature(STORY), hasher.signature(STORY)) == 1.0
+    assert hasher.similarity(hasher.signature(STORY), hasher.signature(syndicated)) > 0.7
+    assert hasher.similarity(hasher.signature(STORY), hasher.signature(unrelated)) < 0.2
+
+
+def test_near_duplicates_are_grouped():
+    texts = [
+        STORY,
+        "A new smartphone with a foldable screen goes on sale next month in Europe and Asia",
+        STORY.upper(),
+        STORY + " according to officials",
+        "Local elections saw record turnout as voters queued for hours in the rain",
+    ]
+
+    groups = find_near_duplicate_groups(texts, threshold=0.7)
+
+    assert groups == [[0, 2, 3], [1], [4]]
+
+
+def test_dedupe_keeps_duplicates_in_the_representative_cluster():
+    items = [
+        {'title': "Central bank raises rates", 'description': STORY,
+         'additional_info': {'importance_score': 0.2}},
+        {'title': "Central bank raises rates", 'description': STORY,
+         'additional_info': {'importance_score': 0.9}},
+        {'title': "Foldable phone launch", 'description': "A new smartphone with a foldable screen goes on sale"},
+    ]
+    service = NewsClusteringService(0.6, dedupe_threshold=0.8)
+
+    clusters = service.cluster_news(items)
+
+    # O representante é a notícia de maior importância; a duplicata vem logo depois
+    assert [[id(item) for item in cluster] for cluster in clusters] == [
+        [id(items[1]), id(items[0])],
+        [id(items[2])]
+    ]
+
+
+def test_signature_does_not_overflow_uint64():
+    hasher = MinHasher()
+    hashes = hasher._shingle_hashes(STORY)
+
+    expected = [
+        min(((int(a) * int(h) + int(b)) % ((1 << 61) - 1)) & 0xFFFFFFFF for h in hashes)
+        for a, b in zip(hasher._a, hasher._b)
+    ]
+
+    assert hasher.signature(STORY).tolist() == expected
+
+
+def test_texts_without_words_are_never_duplicates():
+    hasher = MinHasher()
+    texts = ["", "!!! ...", "   ", STORY, STORY]
+
+    assert hasher.band_keys(hasher.signature("!!! ...")) == []
+    assert find_near_duplicate_groups(texts) == [[0], [1], [2], [3, 4]]
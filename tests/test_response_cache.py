@@ -0,0 +1,165 @@
+# tests/test_response_cache.py
+
+import asyncio
+
+import pytest
+
+from api.schemas import CurationRequest
+from app.main import app, curate_content, is_cacheable_response, run_curation
+from models.content_models import CuratedContent, EnhancedNewsItem
+from utils.cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def response(news=None, content_metadata=None):
+    return {
+        'content': {'news': news or [], 'papers': [], 'repos': [], 'metadata': content_metadata or {}},
+        'insights': {},
+        'metadata': {'version': '1.0'}
+    }
+
+
+def test_cache_key_normalizes_keywords():
+    a = CurationRequest(keywords=['AI', ' robots', 'ai'], metadata={'client': 'x'})
+    b = CurationRequest(keywords=['Robots ', 'ai'])
+
+    assert a.cache_key() == b.cache_key()
+    assert a.cache_key() != CurationRequest(keywords=['ai']).cache_key()
+    assert a.cache_key() != CurationRequest(keywords=['ai', 'robots'], max_news=5).cache_key()
+    assert CurationRequest(keywords=[' ', '']).cache_key() == CurationRequest().cache_key()
+
+
+def test_responses_expire_after_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(ttl_seconds=30, clock=clock)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return len(calls)
+
+    async def main():
+        first = await cache.get_or_compute('k', compute)
+        clock.now += 29
+        cached = await cache.get_or_compute('k', compute)
+        clock.now += 2
+        return first, cached, await cache.get_or_compute('k', compute)
+
+    assert asyncio.run(main()) == (1, 1, 2)
+    assert cache.metrics()['hits'] == 1 and cache.metrics()['misses'] == 2
+
+
+def test_concurrent_requests_share_one_computation():
+    cache = ResponseCache(ttl_seconds=30)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return response([{'title': 'a'}])
+
+    async def main():
+        return await asyncio.gather(*(cache.get_or_compute('k', compute) for _ in range(4)))
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert cache.metrics()['coalesced'] == 3
+
+
+def test_exceptions_are_not_cached():
+    cache = ResponseCache(ttl_seconds=30)
+    outcomes = [RuntimeError("falha"), 'ok']
+
+    async def compute():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            await cache.get_or_compute('k', compute)
+        return await cache.get_or_compute('k', compute)
+
+    assert asyncio.run(main()) == 'ok'
+
+
+@pytest.mark.parametrize('result', [
+    response(),
+    response([{'title': 'a'}], {'error': 'Falha ao buscar notícias'}),
+    {'error': 'falha na conversão', 'metadata': {'status': 'error'}},
+    {'content': {}, 'insights': {}, 'metadata': {'status': 'empty'}},
+])
+def test_failed_or_empty_curations_are_not_cached(result):
+    cache = ResponseCache(ttl_seconds=30)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return result
+
+    async def main():
+        for _ in range(2):
+            await cache.get_or_compute('k', compute, should_store=is_cacheable_response)
+
+    asyncio.run(main())
+
+    assert len(calls) == 2
+    assert cache.metrics()['not_stored'] == 2 and cache.metrics()['entries'] == 0
+
+
+def test_successful_curation_is_cached():
+    assert is_cacheable_response(response([{'title': 'a'}]))
+
+
+class StubCurator:
+    """Curador que devolve uma notícia fixa e registra as requisições recebidas"""
+
+    def __init__(self):
+        self.requests = []
+
+    async def get_curated_content(self, request):
+        self.requests.append(request)
+        return CuratedContent(news=[EnhancedNewsItem(
+            title='Notícia', description='Descrição', primary_link='https://example.com/1',
+            read_time=1, primary_source='Example', sources=[], source_count=1, relevance_score=0.5
+        )])
+
+    def highlight_sentiment_insights(self, content):
+        return {'overall': 'neutral'}
+
+
+def test_run_curation_builds_the_response():
+    curator = StubCurator()
+
+    result = asyncio.run(run_curation(curator, CurationRequest(keywords=['AI'])))
+
+    assert curator.requests[0]['keywords'] == ['AI']
+    assert [item['title'] for item in result['content']['news']] == ['Notícia']
+    assert result['insights'] == {'overall': 'neutral'}
+    assert is_cacheable_response(result)
+
+
+def test_curate_endpoint_caches_successful_responses(monkeypatch):
+    curator = StubCurator()
+    monkeypatch.setattr(app.state, 'curator', curator, raising=False)
+    monkeypatch.setattr(app.state, 'snapshot_service', None, raising=False)
+    monkeypatch.setattr(app.state, 'curate_cache', ResponseCache(ttl_seconds=30), raising=False)
+
+    async def main():
+        first = await curate_content(CurationRequest(keywords=['AI']))
+        return first, await curate_content(CurationRequest(keywords=[' ai ']))
+
+    first, second = asyncio.run(main())
+
+    assert second is first
+    assert len(curator.requests) == 1
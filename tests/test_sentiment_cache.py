@@ -0,0 +1,68 @@
+# tests/test_sentiment_cache.py
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from models.database import SentimentAnalysis
+from repositories.sentiment_repository import SentimentRepository
+from utils.sentiment_cache import SentimentCache, text_hash
+
+VADER_RESULT = {
+    'polarity': 0.44, 'subjectivity': 0.51, 'sentiment': 'positive', 'confidence': 0.78,
+    'detailed_scores': {'negative': 0.0, 'neutral': 0.49, 'positive': 0.51}
+}
+TEXTBLOB_RESULT = {'polarity': 0.7, 'subjectivity': 0.6, 'sentiment': 'positive', 'confidence': 1.0}
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine('sqlite://')
+    SentimentAnalysis.__table__.create(engine)
+    return engine
+
+
+@pytest.fixture
+def session_factory(engine):
+    @contextmanager
+    def factory():
+        with Session(engine) as session:
+            yield session
+            session.commit()
+    return factory
+
+
+def test_save_results_ignores_existing_rows(session_factory):
+    with session_factory() as session:
+        repository = SentimentRepository(session)
+        first = repository.save_results({'a': TEXTBLOB_RESULT, 'b': TEXTBLOB_RESULT}, 'basic')
+        second = repository.save_results({'b': TEXTBLOB_RESULT, 'c': TEXTBLOB_RESULT}, 'basic')
+        other_analyzer = repository.save_results({'a': VADER_RESULT}, 'vader')
+        rows = session.query(SentimentAnalysis.text_hash, SentimentAnalysis.analyzer).all()
+
+    assert (first, second, other_analyzer) == (2, 1, 1)
+    assert sorted(rows) == [('a', 'basic'), ('a', 'vader'), ('b', 'basic'), ('c', 'basic')]
+
+
+@pytest.mark.parametrize('analyzer, result', [('vader', VADER_RESULT), ('basic', TEXTBLOB_RESULT)])
+def test_database_tier_returns_the_same_shape_as_memory(session_factory, analyzer, result):
+    SentimentCache(session_factory=session_factory).put_many({"Texto de exemplo": result}, analyzer)
+
+    memory = SentimentCache(session_factory=session_factory)
+    memory.put_many({"Outro texto": result}, analyzer)
+    from_database = SentimentCache(session_factory=session_factory).get_many(["Texto de exemplo"], analyzer)
+
+    assert from_database["Texto de exemplo"] == result
+    assert memory.get_many(["Outro texto"], analyzer)["Outro texto"] == result
+
+
+def test_texts_are_matched_by_normalized_hash(session_factory):
+    cache = SentimentCache(session_factory=session_factory)
+    cache.put_many({"Texto  de\nexemplo": TEXTBLOB_RESULT}, 'basic')
+
+    assert text_hash("Texto  de\nexemplo") == text_hash("Texto de exemplo")
+    assert SentimentCache(session_factory=session_factory).get_many(["Texto de exemplo"], 'basic') == {
+        "Texto de exemplo": TEXTBLOB_RESULT
+    }
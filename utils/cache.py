@@ -0,0 +1,182 @@
+# utils/cache.py
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class CacheEntry:
+    """Valor armazenado em cache com o instante em que foi gravado"""
+
+    def __init__(self, value: Any, stored_at: float):
+        self.value = value
+        self.stored_at = stored_at
+
+    def age(self, now: float) -> float:
+        return now - self.stored_at
+
+
+class TTLCache:
+    """
+    Cache em memória com expiração (TTL) e janela de validade estendida.
+
+    Entradas mais novas que `ttl_seconds` são frescas; entre `ttl_seconds` e
+    `ttl_seconds + max_stale_seconds` são obsoletas mas ainda utilizáveis
+    (stale-while-revalidate); acima disso são descartadas.
+    """
+
+    def __init__(self, ttl_seconds: float, max_stale_seconds: float = 0.0,
+                 max_entries: int = 128, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """Retorna a entrada se ainda utilizável (fresca ou obsoleta), senão None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.age(self._clock()) > self.ttl_seconds + self.max_stale_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def is_stale(self, entry: CacheEntry) -> bool:
+        return entry.age(self._clock()) > self.ttl_seconds
+
+    def set(self, key: Hashable, value: Any) -> CacheEntry:
+        entry = CacheEntry(value, self._clock())
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight:
+    """
+    Coalesce chamadas assíncronas concorrentes com a mesma chave.
+
+    A primeira chamada inicia a computação; as que chegam enquanto ela está em
+    andamento aguardam o mesmo resultado (ou a mesma exceção). A computação é
+    protegida com shield: o cancelamento de um chamador não a interrompe para
+    os demais.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def _forget(self, key: Hashable, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def run(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Returns:
+            Tupla (resultado, coalesced), com coalesced=True quando a chamada
+            reaproveitou uma computação já em andamento
+        """
+        task = self._inflight.get(key)
+        coalesced = task is not None
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task), coalesced
+
+    def cancel_all(self):
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+class ResponseCache:
+    """
+    Cache de respostas com TTL e coalescência de requisições idênticas.
+
+    Respostas frescas vêm do TTLCache; na ausência, requisições concorrentes
+    com a mesma chave compartilham uma única computação (SingleFlight), cujo
+    resultado é armazenado. Exceções não são armazenadas, nem resultados
+    recusados pelo critério `should_store` (ex.: respostas com erro ou vazias).
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            ttl_seconds: Validade das respostas (0 desativa o armazenamento, mantendo a coalescência)
+            max_entries: Respostas mantidas em memória
+        """
+        self._cache = TTLCache(ttl_seconds, max_entries=max_entries, clock=clock)
+        self._flight = SingleFlight()
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._not_stored = 0
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]],
+                             should_store: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Retorna a resposta em cache para a chave ou a computa (uma vez por chave)
+
+        Args:
+            key: Identidade normalizada da requisição
+            compute: Produz a resposta
+            should_store: Decide se a resposta computada pode ser reutilizada
+                (None armazena todas); requisições coalescidas a recebem de qualquer forma
+        """
+        if self._cache.enabled:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._hits += 1
+                return entry.value
+
+        async def compute_and_store():
+            value = await compute()
+            if self._cache.enabled and (should_store is None or should_store(value)):
+                self._cache.set(key, value)
+            elif self._cache.enabled:
+                self._not_stored += 1
+            return value
+
+        value, coalesced = await self._flight.run(key, compute_and_store)
+        if coalesced:
+            self._coalesced += 1
+        else:
+            self._misses += 1
+        return value
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            'entries': len(self._cache),
+            'inflight': len(self._flight),
+            'hits': self._hits,
+            'misses': self._misses,
+            'coalesced': self._coalesced,
+            'not_stored': self._not_stored,
+            'ttl_seconds': self._cache.ttl_seconds
+        }
+
+    def clear(self):
+        """Descarta as respostas armazenadas e cancela as computações em andamento"""
+        self._flight.cancel_all()
+        self._cache.clear()
@@ -1,33 +1,179 @@
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.feature_extraction.text import TfidfVectorizer
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 import logging
 
+from utils.minhash import find_near_duplicate_groups
+from utils.text_vectors import build_tfidf_vectorizer, news_texts
+
+# scipy e scikit-learn são importados nas funções que os usam, para não pesar
+# no tempo de inicialização de quem apenas importa este módulo
+if TYPE_CHECKING:
+    from scipy import sparse
+
 logger = logging.getLogger(__name__)
 
+
+def sparse_neighbor_graph(tfidf_matrix, threshold: float, top_k: Optional[int] = None,
+                          chunk_size: int = 512) -> "sparse.csr_matrix":
+    """
+    Calcula apenas os pares de vizinhos com similaridade >= threshold.
+    
+    As linhas da matriz TF-IDF já são normalizadas (L2), então o produto X·Xᵀ é a
+    similaridade de cosseno. O produto é feito em blocos de linhas e cada bloco é
+    filtrado pelo limiar antes de ser acumulado, de forma que a matriz n×n densa
+    nunca é materializada.
+    
+    Args:
+        tfidf_matrix: Matriz esparsa (n × termos) com linhas normalizadas
+        threshold: Similaridade mínima para manter um par
+        top_k: Se definido, mantém no máximo k vizinhos (os mais similares) por linha
+        chunk_size: Número de linhas processadas por bloco
+        
+    Returns:
+        Matriz esparsa CSR n×n com as similaridades mantidas (sem a diagonal),
+        com índices ordenados por linha
+    """
+    from scipy import sparse
+
+    x = sparse.csr_matrix(tfidf_matrix)
+    n = x.shape[0]
+    xt = x.T.tocsc()
+    rows, cols, values = [], [], []
+    
+    for start in range(0, n, chunk_size):
+        end = min(start + chunk_size, n)
+        block = (x[start:end] @ xt).tocoo()
+        
+        keep = (block.data >= threshold) & (block.row + start != block.col)
+        block_rows = block.row[keep] + start
+        block_cols = block.col[keep]
+        block_values = block.data[keep]
+        
+        if top_k is not None and len(block_values) > 0:
+            # Ordena por linha e similaridade decrescente e mantém os k primeiros de cada linha
+            order = np.lexsort((-block_values, block_rows))
+            block_rows, block_cols, block_values = block_rows[order], block_cols[order], block_values[order]
+            row_starts = np.searchsorted(block_rows, block_rows, side='left')
+            rank = np.arange(len(block_rows)) - row_starts
+            keep = rank < top_k
+            block_rows, block_cols, block_values = block_rows[keep], block_cols[keep], block_values[keep]
+        
+        rows.append(block_rows)
+        cols.append(block_cols)
+        values.append(block_values)
+    
+    if rows:
+        rows, cols, values = np.concatenate(rows), np.concatenate(cols), np.concatenate(values)
+    graph = sparse.csr_matrix((values, (rows, cols)), shape=(n, n))
+    graph.sort_indices()
+    return graph
+
+
+def leader_clusters(graph: "sparse.csr_matrix") -> List[List[int]]:
+    """
+    Agrupamento guloso (líder) sobre o grafo esparso de vizinhos.
+    
+    Reproduz exatamente o laço duplo original: cada item ainda não processado
+    inicia um cluster e absorve seus vizinhos não processados, em ordem de índice.
+    O custo é O(n + arestas).
+    """
+    n = graph.shape[0]
+    indptr, indices = graph.indptr, graph.indices
+    processed = np.zeros(n, dtype=bool)
+    clusters = []
+    
+    for i in range(n):
+        if processed[i]:
+            continue
+        processed[i] = True
+        members = [i]
+        for j in indices[indptr[i]:indptr[i + 1]]:
+            if not processed[j]:
+                processed[j] = True
+                members.append(int(j))
+        clusters.append(members)
+    
+    return clusters
+
+
+def single_linkage_clusters(graph: "sparse.csr_matrix") -> List[List[int]]:
+    """
+    Agrupamento por ligação simples: componentes conexas do grafo de vizinhos.
+    Clusters são retornados na ordem do primeiro índice de cada componente.
+    """
+    n = graph.shape[0]
+    if n == 0:
+        return []
+    from scipy.sparse.csgraph import connected_components
+
+    _, labels = connected_components(graph, directed=False)
+    
+    clusters: Dict[int, List[int]] = {}
+    for index, label in enumerate(labels):
+        clusters.setdefault(int(label), []).append(index)
+    return list(clusters.values())
+
+
 class NewsClusteringService:
-    def __init__(self, similarity_threshold=0.6):
+    METHODS = ('auto', 'dense', 'sparse')
+    LINKAGES = ('leader', 'single')
+    
+    def __init__(self, similarity_threshold=0.6, method: str = 'auto', linkage: str = 'leader',
+                 top_k: Optional[int] = None, dense_max_items: int = 500,
+                 dedupe_threshold: Optional[float] = 0.8):
         """
         Inicializa o serviço de clustering.
         
         Args:
             similarity_threshold: Valor entre 0 e 1 que define quando duas notícias
                                   são consideradas similares.
+            method: 'dense' (matriz n×n completa), 'sparse' (apenas pares acima do limiar)
+                    ou 'auto' (denso até dense_max_items itens, esparso acima disso)
+            linkage: 'leader' (guloso, equivalente ao algoritmo original) ou
+                     'single' (componentes conexas do grafo de similaridade)
+            top_k: Número máximo de vizinhos mantidos por notícia no modo esparso
+                   (None mantém todos e preserva a equivalência com o modo denso)
+            dense_max_items: Limite de itens para o modo denso quando method='auto'
+            dedupe_threshold: Similaridade de Jaccard (MinHash) a partir da qual notícias
+                              são colapsadas como quase-duplicatas antes do clustering
+                              (None desabilita)
         """
+        if method not in self.METHODS:
+            raise ValueError(f"Método de clustering inválido: {method}")
+        if linkage not in self.LINKAGES:
+            raise ValueError(f"Linkage de clustering inválido: {linkage}")
+            
         self.similarity_threshold = similarity_threshold
-        self.vectorizer = TfidfVectorizer(
-            max_features=1000,
-            stop_words='english',
-            ngram_range=(1, 2)
-        )
+        self.method = method
+        self.linkage = linkage
+        self.top_k = top_k
+        self.dense_max_items = dense_max_items
+        self.dedupe_threshold = dedupe_threshold
+        self._vectorizer = None
+    
+    @property
+    def vectorizer(self):
+        """Vetorizador TF-IDF, criado no primeiro uso"""
+        if self._vectorizer is None:
+            self._vectorizer = build_tfidf_vectorizer()
+        return self._vectorizer
+    
+    def _vectorize(self, news_items: List[Dict], tfidf_matrix=None):
+        """
+        Vetoriza título e descrição das notícias usando TF-IDF.
+        Se a matriz já foi calculada em um estágio anterior, ela é reaproveitada.
+        """
+        if tfidf_matrix is not None:
+            return tfidf_matrix
+        return self.vectorizer.fit_transform(news_texts(news_items))
         
-    def _compute_similarity_matrix(self, news_items: List[Dict]) -> np.ndarray:
+    def _compute_similarity_matrix(self, news_items: List[Dict], tfidf_matrix=None) -> np.ndarray:
         """
         Calcula a matriz de similaridade entre todas as notícias.
         
         Args:
             news_items: Lista de notícias para comparar
+            tfidf_matrix: Matriz TF-IDF já calculada para as notícias (opcional)
             
         Returns:
             Matriz de similaridade (numpy array)
@@ -37,19 +183,11 @@ class NewsClusteringService:
                 logger.warning("Lista de notícias vazia, retornando matriz vazia")
                 return np.array([[]])
                 
-            # Extrai texto para vetorização
-            text_content = []
-            for item in news_items:
-                # Usa título e descrição para melhor comparação
-                title = item.get('title', '')
-                description = item.get('description', '')
-                text = f"{title} {description}"
-                text_content.append(text)
-                
             # Vetoriza o texto usando TF-IDF
-            tfidf_matrix = self.vectorizer.fit_transform(text_content)
+            tfidf_matrix = self._vectorize(news_items, tfidf_matrix)
             
             # Calcula similaridade de cosseno entre todos os pares
+            from sklearn.metrics.pairwise import cosine_similarity
             similarity_matrix = cosine_similarity(tfidf_matrix)
             
             return similarity_matrix
@@ -58,12 +196,94 @@ class NewsClusteringService:
             # Retorna matriz vazia em caso de erro
             return np.zeros((len(news_items), len(news_items)))
     
-    def cluster_news(self, news_items: List[Dict]) -> List[List[Dict]]:
+    def _deduplicate(self, news_items: List[Dict]) -> Tuple[List[int], Dict[int, List[Dict]]]:
+        """
+        Colapsa quase-duplicatas (ex.: matérias sindicadas) via MinHash-LSH.
+        
+        Returns:
+            Tupla (índices dos representantes, duplicatas por id do representante).
+            O representante de cada grupo é a notícia de maior pontuação de importância.
+        """
+        groups = find_near_duplicate_groups(news_texts(news_items), self.dedupe_threshold)
+        
+        representatives = []
+        duplicates = {}
+        for group in groups:
+            primary_index = max(
+                group,
+                key=lambda i: news_items[i].get('additional_info', {}).get('importance_score', 0.0)
+            )
+            representatives.append(primary_index)
+            if len(group) > 1:
+                primary = news_items[primary_index]
+                duplicates[id(primary)] = [news_items[i] for i in group if i != primary_index]
+        
+        if duplicates:
+            logger.info(f"Colapsadas {len(news_items) - len(representatives)} notícias quase duplicadas")
+        return representatives, duplicates
+    
+    def _use_sparse(self, n_items: int) -> bool:
+        """Decide entre o modo denso e o esparso"""
+        if self.method == 'sparse' or self.linkage != 'leader':
+            return True
+        if self.method == 'dense':
+            return False
+        return n_items > self.dense_max_items
+    
+    def _cluster_dense(self, news_items: List[Dict], tfidf_matrix=None) -> List[List[Dict]]:
+        """Agrupamento guloso sobre a matriz de similaridade densa (O(n²))"""
+        # Calcula a matriz de similaridade
+        similarity_matrix = self._compute_similarity_matrix(news_items, tfidf_matrix)
+        
+        # Inicializa clusters e notícias não processadas
+        clusters = []
+        processed = [False] * len(news_items)
+        
+        # Agrupa notícias
+        for i in range(len(news_items)):
+            if processed[i]:
+                continue
+                
+            # Inicia novo cluster com notícia atual
+            cluster = [news_items[i]]
+            processed[i] = True
+            
+            # Adiciona notícias similares ao cluster
+            for j in range(len(news_items)):
+                if i != j and not processed[j] and similarity_matrix[i, j] >= self.similarity_threshold:
+                    cluster.append(news_items[j])
+                    processed[j] = True
+            
+            clusters.append(cluster)
+        
+        return clusters
+    
+    def _cluster_sparse(self, news_items: List[Dict], tfidf_matrix=None) -> List[List[Dict]]:
+        """Agrupamento sobre o grafo esparso de vizinhos acima do limiar"""
+        try:
+            tfidf_matrix = self._vectorize(news_items, tfidf_matrix)
+        except ValueError as e:
+            # Vocabulário vazio (ex.: apenas stop words): cada notícia é seu próprio cluster
+            logger.warning(f"Não foi possível vetorizar notícias: {str(e)}")
+            return [[item] for item in news_items]
+            
+        graph = sparse_neighbor_graph(tfidf_matrix, self.similarity_threshold, self.top_k)
+        
+        if self.linkage == 'single':
+            index_clusters = single_linkage_clusters(graph)
+        else:
+            index_clusters = leader_clusters(graph)
+            
+        return [[news_items[i] for i in members] for members in index_clusters]
+    
+    def cluster_news(self, news_items: List[Dict], tfidf_matrix=None) -> List[List[Dict]]:
         """
         Agrupa notícias similares.
         
         Args:
             news_items: Lista de notícias para agrupar
+            tfidf_matrix: Matriz TF-IDF ajustada nessas mesmas notícias (uma linha por
+                          notícia, na mesma ordem). Se omitida, o TF-IDF é ajustado aqui.
             
         Returns:
             Lista de clusters (cada cluster é uma lista de notícias)
@@ -73,29 +293,27 @@ class NewsClusteringService:
                 logger.warning("Lista de notícias vazia, retornando lista vazia")
                 return []
                 
-            # Calcula a matriz de similaridade
-            similarity_matrix = self._compute_similarity_matrix(news_items)
-            
-            # Inicializa clusters e notícias não processadas
-            clusters = []
-            processed = [False] * len(news_items)
-            
-            # Agrupa notícias
-            for i in range(len(news_items)):
-                if processed[i]:
-                    continue
-                    
-                # Inicia novo cluster com notícia atual
-                cluster = [news_items[i]]
-                processed[i] = True
-                
-                # Adiciona notícias similares ao cluster
-                for j in range(len(news_items)):
-                    if i != j and not processed[j] and similarity_matrix[i, j] >= self.similarity_threshold:
-                        cluster.append(news_items[j])
-                        processed[j] = True
+            # Colapsa quase-duplicatas antes do TF-IDF e da comparação par a par
+            items_to_cluster, duplicates = news_items, {}
+            if self.dedupe_threshold is not None:
+                representatives, duplicates = self._deduplicate(news_items)
+                items_to_cluster = [news_items[i] for i in representatives]
+                # A matriz recebida foi ajustada em todas as notícias; sem as duplicatas
+                # o IDF muda, então o TF-IDF é reajustado nos representantes
+                if len(representatives) < len(news_items):
+                    tfidf_matrix = None
                 
-                clusters.append(cluster)
+            if self._use_sparse(len(items_to_cluster)):
+                clusters = self._cluster_sparse(items_to_cluster, tfidf_matrix)
+            else:
+                clusters = self._cluster_dense(items_to_cluster, tfidf_matrix)
+            
+            # Reinsere as duplicatas junto ao seu representante, mantendo todas as fontes
+            if duplicates:
+                clusters = [
+                    [member for item in cluster for member in [item] + duplicates.get(id(item), [])]
+                    for cluster in clusters
+                ]
             
             # Ordena clusters por tamanho (maior primeiro)
             clusters.sort(key=len, reverse=True)
@@ -155,7 +373,9 @@ class NewsClusteringService:
                         'name': item.get('source', 'Unknown Source'),
                         'link': item.get('link', ''),
                         'published_date': item.get('additional_info', {}).get('published_date', None),
-                        'author': item.get('additional_info', {}).get('author', None)
+                        'author': item.get('additional_info', {}).get('author', None),
+                        'title': item.get('title', ''),
+                        'description': item.get('description', '')
                     }
                     formatted_item['sources'].append(source_info)
                 
@@ -0,0 +1,128 @@
+# utils/db_pool.py
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+from utils.stats import percentile
+
+
+class PoolStats:
+    """Contadores do pool de conexões (thread-safe), compartilhados entre recriações do pool"""
+
+    def __init__(self, history_size: int = 1024):
+        self._lock = threading.Lock()
+        self._waits_ms: Deque[float] = deque(maxlen=history_size)
+        self.checkouts = 0
+        self.waited = 0  # checkouts que encontraram o pool esgotado e tiveram de esperar
+        self.timeouts = 0
+        self.peak_checked_out = 0
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.invalidated = 0
+
+    def record_checkout(self, wait_seconds: float, waited: bool, checked_out: int):
+        with self._lock:
+            self.checkouts += 1
+            self.waited += int(waited)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            self._waits_ms.append(wait_seconds * 1000.0)
+
+    def record_timeout(self, wait_seconds: float):
+        with self._lock:
+            self.timeouts += 1
+            self.waited += 1
+            self._waits_ms.append(wait_seconds * 1000.0)
+
+    def on_connect(self, *args):
+        with self._lock:
+            self.connections_opened += 1
+
+    def on_close(self, *args):
+        with self._lock:
+            self.connections_closed += 1
+
+    def on_invalidate(self, *args):
+        with self._lock:
+            self.invalidated += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            waits = list(self._waits_ms)
+            return {
+                'checkouts': self.checkouts,
+                'waited': self.waited,
+                'timeouts': self.timeouts,
+                'peak_checked_out': self.peak_checked_out,
+                'wait_ms_p50': percentile(waits, 50),
+                'wait_ms_p95': percentile(waits, 95),
+                'wait_ms_max': max(waits) if waits else 0.0,
+                'connections_opened': self.connections_opened,
+                'connections_closed': self.connections_closed,
+                'invalidated': self.invalidated
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool que mede o tempo de checkout e a rotatividade de conexões.
+
+    O tempo de checkout cobre a espera por uma conexão livre (pool esgotado)
+    e a abertura de conexões novas; abertura, fechamento e invalidação de
+    conexões (incluindo reciclagem e falhas do pre-ping) vêm dos eventos do pool.
+    """
+
+    def __init__(self, *args, **kwargs):
+        recreated = kwargs.get('_dispatch') is not None
+        super().__init__(*args, **kwargs)
+        self._local = threading.local()
+        self.stats = PoolStats()
+        if not recreated:
+            # Em recriações (engine.dispose) os listeners são herdados do pool anterior
+            event.listen(self, 'connect', self.stats.on_connect)
+            event.listen(self, 'close', self.stats.on_close)
+            event.listen(self, 'close_detached', self.stats.on_close)
+            event.listen(self, 'invalidate', self.stats.on_invalidate)
+
+    def recreate(self) -> 'InstrumentedQueuePool':
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def _do_get(self):
+        # QueuePool._do_get é recursivo; só a chamada externa é medida
+        if getattr(self._local, 'in_checkout', False):
+            return super()._do_get()
+
+        saturated = self._pool.qsize() == 0 and self._overflow >= self._max_overflow
+        self._local.in_checkout = True
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record_timeout(time.perf_counter() - start)
+            raise
+        finally:
+            self._local.in_checkout = False
+        self.stats.record_checkout(time.perf_counter() - start, saturated, self.checkedout())
+        return record
+
+    def metrics(self) -> Dict[str, Any]:
+        """Estado atual do pool e contadores acumulados"""
+        capacity = self.size() + max(self._max_overflow, 0)
+        checked_out = self.checkedout()
+        return {
+            'pool_size': self.size(),
+            'max_overflow': self._max_overflow,
+            'timeout': self._timeout,
+            'recycle': self._recycle,
+            'pre_ping': self._pre_ping,
+            'checked_out': checked_out,
+            'idle': self.checkedin(),
+            'utilization': checked_out / capacity if capacity else 0.0,
+            **self.stats.snapshot()
+        }
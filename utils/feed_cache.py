@@ -0,0 +1,121 @@
+# utils/feed_cache.py
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FeedCacheEntry:
+    """Entrada de cache de um feed: corpo bruto, validadores HTTP e itens já processados"""
+
+    def __init__(self, url: str, body: str = "", etag: Optional[str] = None,
+                 last_modified: Optional[str] = None, fetched_at: Optional[float] = None):
+        self.url = url
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at or time.time()
+        # Itens processados ficam apenas em memória (contêm objetos datetime)
+        self.items: Optional[List[Dict]] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Retorna os cabeçalhos para uma requisição condicional (If-None-Match/If-Modified-Since)"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def to_dict(self) -> Dict:
+        return {
+            'url': self.url,
+            'body': self.body,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'fetched_at': self.fetched_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FeedCacheEntry':
+        return cls(
+            url=data['url'],
+            body=data.get('body', ''),
+            etag=data.get('etag'),
+            last_modified=data.get('last_modified'),
+            fetched_at=data.get('fetched_at')
+        )
+
+
+class FeedCache:
+    """
+    Cache persistente de feeds RSS/Atom para revalidação com GET condicional.
+
+    Cada URL é armazenada em um arquivo JSON no diretório configurado com o corpo,
+    o ETag e o Last-Modified da última resposta 200. Sem diretório, o cache funciona
+    apenas em memória.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir
+        self._entries: Dict[str, FeedCacheEntry] = {}
+
+        if self.cache_dir:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            except OSError as e:
+                logger.error(f"Erro ao criar diretório de cache de feeds {self.cache_dir}: {str(e)}")
+                self.cache_dir = None
+
+    def _path_for(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, url: str) -> Optional[FeedCacheEntry]:
+        """Retorna a entrada de cache da URL, carregando do disco se necessário"""
+        entry = self._entries.get(url)
+        if entry is not None or not self.cache_dir:
+            return entry
+
+        path = self._path_for(url)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = FeedCacheEntry.from_dict(json.load(f))
+            self._entries[url] = entry
+            return entry
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Cache de feed corrompido para {url}, ignorando: {str(e)}")
+            return None
+
+    def put(self, url: str, body: str, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> FeedCacheEntry:
+        """Armazena uma nova versão do feed (resposta 200)"""
+        entry = FeedCacheEntry(url, body, etag, last_modified)
+        self._entries[url] = entry
+
+        if self.cache_dir:
+            path = self._path_for(url)
+            tmp_path = f"{path}.tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(entry.to_dict(), f, ensure_ascii=False)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.error(f"Erro ao persistir cache do feed {url}: {str(e)}")
+
+        return entry
+
+    def touch(self, url: str) -> Optional[FeedCacheEntry]:
+        """Marca a entrada como revalidada (resposta 304)"""
+        entry = self.get(url)
+        if entry is not None:
+            entry.fetched_at = time.time()
+        return entry
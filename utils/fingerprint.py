@@ -0,0 +1,61 @@
+# utils/fingerprint.py
+
+import hashlib
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_WHITESPACE = re.compile(r'\s+')
+_TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid')
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """Texto em minúsculas, sem espaços nas pontas e com espaços internos colapsados"""
+    return _WHITESPACE.sub(' ', value or '').strip().casefold()
+
+
+def canonical_link(link: Optional[str]) -> str:
+    """
+    Forma canônica de um link para deduplicação.
+
+    Ignora esquema, "www.", barra final, fragmento e parâmetros de rastreamento
+    (utm_*, fbclid, ...); o host é comparado em minúsculas e os demais
+    parâmetros são ordenados.
+    """
+    link = (link or '').strip()
+    if not link:
+        return ''
+    parts = urlsplit(link if '//' in link else f'//{link}')
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(_TRACKING_PARAMS)
+    ))
+    return urlunsplit(('', host, parts.path.rstrip('/'), query, ''))
+
+
+def content_fingerprint(content_type: str, *parts: Optional[str]) -> str:
+    """
+    Chave de deduplicação (sha256 hex, 64 caracteres) gravada em content.fingerprint.
+
+    Args:
+        content_type: Tipo do conteúdo (evita colisão entre tipos)
+        parts: Campos já normalizados que identificam o conteúdo
+
+    Returns:
+        Hash hexadecimal
+    """
+    key = '\x1f'.join([content_type, *(part or '' for part in parts)])
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def news_fingerprint(title: Optional[str], source_name: Optional[str]) -> str:
+    """Fingerprint de notícia: título e fonte normalizados"""
+    return content_fingerprint('news', normalize_text(title), normalize_text(source_name))
+
+
+def link_fingerprint(content_type: str, title: Optional[str], link: Optional[str]) -> str:
+    """Fingerprint de repositórios, papers e eventos: título normalizado e link canônico"""
+    return content_fingerprint(content_type, normalize_text(title), canonical_link(link))
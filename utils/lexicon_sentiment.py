@@ -0,0 +1,442 @@
+# utils/lexicon_sentiment.py
+
+import re
+import string
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Constantes do VADER (nltk.sentiment.vader.VaderConstants)
+VADER_B_INCR = 0.293
+VADER_C_INCR = 0.733
+VADER_N_SCALAR = -0.74
+VADER_ALPHA = 15.0
+
+_VADER_BOOSTERS = {
+    'absolutely', 'amazingly', 'awfully', 'completely', 'considerably', 'decidedly', 'deeply',
+    'effing', 'enormously', 'entirely', 'especially', 'exceptionally', 'extremely', 'fabulously',
+    'flipping', 'flippin', 'fricking', 'frickin', 'frigging', 'friggin', 'fully', 'fucking',
+    'greatly', 'hella', 'highly', 'hugely', 'incredibly', 'intensely', 'majorly', 'more', 'most',
+    'particularly', 'purely', 'quite', 'really', 'remarkably', 'so', 'substantially', 'thoroughly',
+    'totally', 'tremendously', 'uber', 'unbelievably', 'unusually', 'utterly', 'very'
+}
+_VADER_DAMPENERS = {
+    'almost', 'barely', 'hardly', 'kinda', 'kindof', 'kind-of', 'less', 'little', 'marginally',
+    'occasionally', 'partly', 'scarcely', 'slightly', 'somewhat', 'sorta', 'sortof', 'sort-of'
+}
+_VADER_NEGATIONS = {
+    'aint', 'arent', 'cannot', 'cant', 'couldnt', 'darent', 'didnt', 'doesnt', 'dont', 'hadnt',
+    'hasnt', 'havent', 'isnt', 'mightnt', 'mustnt', 'neither', 'neednt', 'never', 'none', 'nope',
+    'nor', 'not', 'nothing', 'nowhere', 'oughtnt', 'shant', 'shouldnt', 'uhuh', 'uh-uh', 'wasnt',
+    'werent', 'without', 'wont', 'wouldnt', 'rarely', 'seldom', 'despite'
+}
+
+# Negações e intensificadores do analisador padrão do TextBlob (pattern)
+_TEXTBLOB_NEGATIONS = {'no', 'not', 'never'}
+_TEXTBLOB_TOKEN = re.compile(r"\w+(?:[-.]\w+)*|\.\.\.|[^\w\s]")
+_TEXTBLOB_EXCLAMATION_BOOST = 1.25
+_TEXTBLOB_NEGATION_SCALAR = -0.5
+
+# Emoticons por polaridade e marca de sarcasmo do pattern (textblob._text.EMOTICONS
+# e RE_SARCASM): o tokenizador os junta em um token, avaliado como uma opinião própria
+_TEXTBLOB_EMOTICON_GROUPS = {
+    1.0: ("<3", "♥", ">:D", ":-D", ":D", "=-D", "=D", "X-D", "x-D", "XD", "xD", "8-D"),
+    0.75: (">:P", ":-P", ":P", ":-p", ":p", ":-b", ":b", ":c)", ":o)", ":^)"),
+    0.5: (">:)", ":-)", ":)", "=)", "=]", ":]", ":}", ":>", ":3", "8)", "8-)"),
+    0.25: (">;]", ";-)", ";)", ";-]", ";]", ";D", ";^)", "*-)", "*)"),
+    0.05: (">:o", ":-O", ":O", ":o", ":-o", "o_O", "o.O", "°O°", "°o°"),
+    -0.25: (">:/", ":-/", ":/", ":\\", ">:\\", ":-.", ":-s", ":s", ":S", ":-S", ">.>"),
+    -0.75: (">:[", ":-(", ":(", "=(", ":-[", ":[", ":{", ":-<", ":c", ":-c", "=/"),
+    -1.0: (":'(", ":'''(", ";'("),
+}
+_TEXTBLOB_EMOTICONS = {
+    emoticon.lower(): polarity
+    for polarity, emoticons in _TEXTBLOB_EMOTICON_GROUPS.items() for emoticon in emoticons
+}
+_TEXTBLOB_EMOTICON_TOKENS = re.compile(r"(%s)($|\s)" % "|".join(
+    r" ?".join(re.escape(char) for char in emoticon)
+    for emoticons in _TEXTBLOB_EMOTICON_GROUPS.values() for emoticon in emoticons
+))
+_TEXTBLOB_SARCASM = re.compile(r"\( ?\! ?\)")
+_TEXTBLOB_IRONY = "(!)"
+_TEXTBLOB_PUNCTUATION = ".,;:!?()[]{}`''\"@#$^&*+-|=~_"
+
+_VADER_TOKEN = re.compile(r"\S{2,}")
+_PUNCTUATION = string.punctuation
+
+
+def load_vader():
+    """Importa o NLTK apenas quando o VADER é usado e carrega o léxico"""
+    import nltk
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+    try:
+        nltk.data.find('sentiment/vader_lexicon.zip')
+    except LookupError:
+        nltk.download('vader_lexicon', quiet=True)
+    return SentimentIntensityAnalyzer()
+
+
+def _previous_index(mask: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """
+    Para cada posição, índice da última posição anterior (estrita) com mask
+    verdadeira no mesmo documento; -1 quando não existe.
+    """
+    positions = np.where(mask, np.arange(mask.size), -1)
+    last = np.maximum.accumulate(positions) if positions.size else positions
+    previous = np.empty_like(last)
+    if previous.size:
+        previous[0] = -1
+        previous[1:] = last[:-1]
+    # Não atravessa a fronteira do documento
+    previous[previous < starts] = -1
+    return previous
+
+
+class LexiconSentimentEngine:
+    """
+    Pontuação vetorizada de sentimento por léxico (VADER ou TextBlob) para lotes.
+
+    Os textos do lote são tokenizados uma única vez para arrays planos
+    (documento, termo); valências e flags (negação, intensificador, caixa alta)
+    vêm de arrays indexados pelo vocabulário do léxico, as regras de contexto
+    são aplicadas com deslocamentos sobre os arrays e a agregação por documento
+    é um produto da matriz esparsa documento × token pelos valores. O resultado
+    aproxima `polarity_scores` do VADER e `TextBlob(text).sentiment`; regras
+    raras (idiomas do VADER, emoticons e sarcasmo do TextBlob, o índice da
+    primeira ocorrência usado pelo VADER para palavras repetidas) não são
+    reproduzidas, por isso a equivalência é garantida apenas dentro de uma
+    tolerância — veja SentimentAnalysisService.validate_bulk.
+    """
+
+    KINDS = ('vader', 'textblob')
+
+    def __init__(self, kind: str = 'vader', lexicon: Optional[Dict] = None):
+        """
+        Args:
+            kind: 'vader' ou 'textblob'
+            lexicon: Léxico já carregado (palavra -> valência para o VADER; o
+                Sentiment do textblob.en para o TextBlob). None carrega o padrão.
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Tipo de léxico desconhecido: {kind}")
+        self.kind = kind
+        if kind == 'vader':
+            self._build_vader_vocabulary(lexicon if lexicon is not None else self._default_vader_lexicon())
+        else:
+            self._build_textblob_vocabulary(lexicon if lexicon is not None else self._default_textblob_lexicon())
+
+    @staticmethod
+    def _default_vader_lexicon() -> Dict[str, float]:
+        return load_vader().lexicon
+
+    @staticmethod
+    def _default_textblob_lexicon():
+        from textblob.en import sentiment
+        return sentiment
+
+    def _build_vader_vocabulary(self, lexicon: Dict[str, float]):
+        # O id 0 é reservado para palavras fora do vocabulário
+        words = sorted(set(lexicon) | _VADER_BOOSTERS | _VADER_DAMPENERS | _VADER_NEGATIONS
+                       | {'but', 'least', 'at', 'very', 'kind', 'of', 'never', 'so', 'this'})
+        self.vocabulary = {word: index for index, word in enumerate(words, start=1)}
+        size = len(words) + 1
+        self.valence = np.zeros(size, dtype=np.float64)
+        self.in_lexicon = np.zeros(size, dtype=bool)
+        self.booster = np.zeros(size, dtype=np.float64)
+        self.negation = np.zeros(size, dtype=bool)
+        for word, index in self.vocabulary.items():
+            if word in lexicon:
+                self.valence[index] = lexicon[word]
+                self.in_lexicon[index] = True
+            if word in _VADER_BOOSTERS:
+                self.booster[index] = VADER_B_INCR
+            elif word in _VADER_DAMPENERS:
+                self.booster[index] = -VADER_B_INCR
+            self.negation[index] = word in _VADER_NEGATIONS or "n't" in word
+
+    def _build_textblob_vocabulary(self, lexicon):
+        words = sorted(set(lexicon.keys()) | _TEXTBLOB_NEGATIONS)
+        self.vocabulary = {word: index for index, word in enumerate(words, start=1)}
+        size = len(words) + 1
+        self.polarity = np.zeros(size, dtype=np.float64)
+        self.subjectivity = np.zeros(size, dtype=np.float64)
+        self.intensity = np.ones(size, dtype=np.float64)
+        self.known = np.zeros(size, dtype=bool)
+        self.modifier = np.zeros(size, dtype=bool)
+        self.adverb = np.zeros(size, dtype=bool)
+        self.negation = np.zeros(size, dtype=bool)
+        for word, index in self.vocabulary.items():
+            entry = lexicon.get(word)
+            if entry:
+                self.polarity[index], self.subjectivity[index], self.intensity[index] = entry[None]
+                self.known[index] = True
+                self.modifier[index] = 'RB' in entry
+            self.adverb[index] = word.endswith('ly')
+            self.negation[index] = word in _TEXTBLOB_NEGATIONS
+
+    @staticmethod
+    def _flatten(documents: List[List[str]]):
+        """
+        Tokens de todos os documentos em arrays planos.
+
+        Cada token distinto do lote recebe um código; os atributos por token
+        (id no vocabulário, caixa alta etc.) são calculados uma vez por token
+        distinto e expandidos com indexação pelos códigos.
+
+        Returns:
+            (tokens distintos, código de cada token, documento, início do documento, tamanhos)
+        """
+        lengths = np.fromiter((len(tokens) for tokens in documents), dtype=np.int64, count=len(documents))
+        codes: Dict[str, int] = {}
+        inverse = np.fromiter(
+            (codes.setdefault(token, len(codes)) for doc_tokens in documents for token in doc_tokens),
+            dtype=np.int64, count=int(lengths.sum())
+        )
+        doc = np.repeat(np.arange(len(documents)), lengths)
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1])) if len(documents) else lengths
+        starts = np.repeat(offsets, lengths)
+        return list(codes), inverse, doc, starts, lengths
+
+    def _lookup(self, unique: List[str], inverse: np.ndarray) -> np.ndarray:
+        """Ids no vocabulário (0 = desconhecido) de cada token"""
+        unique_ids = np.fromiter((self.vocabulary.get(token.lower(), 0) for token in unique),
+                                 dtype=np.int64, count=len(unique))
+        return unique_ids[inverse]
+
+    @staticmethod
+    def _token_flags(unique: List[str], inverse: np.ndarray, predicate) -> np.ndarray:
+        """Aplica um predicado a cada token distinto e expande para todos os tokens"""
+        return np.fromiter(map(predicate, unique), dtype=bool, count=len(unique))[inverse]
+
+    @staticmethod
+    def _doc_sums(doc: np.ndarray, n_docs: int, columns: np.ndarray) -> np.ndarray:
+        """Soma, por documento, das colunas de valores por token (matriz esparsa docs × tokens)"""
+        from scipy.sparse import csr_matrix
+
+        indicator = csr_matrix(
+            (np.ones(doc.size, dtype=np.float64), (doc, np.arange(doc.size))),
+            shape=(n_docs, doc.size)
+        )
+        return np.asarray(indicator @ columns)
+
+    def score(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Pontua um lote de textos.
+
+        Returns:
+            Arrays alinhados aos textos: 'polarity' e 'subjectivity' e, no VADER,
+            também 'negative', 'neutral' e 'positive'
+        """
+        if self.kind == 'vader':
+            return self._score_vader(texts)
+        return self._score_textblob(texts)
+
+    @staticmethod
+    def _strip_vader_token(token: str) -> str:
+        """Remove a pontuação das bordas, preservando tokens que ficariam com 1 caractere (emoticons)"""
+        stripped = token.strip(_PUNCTUATION)
+        return stripped if len(stripped) > 1 else token
+
+    def _score_vader(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        n_docs = len(texts)
+        # Tokenização do VADER: separação por espaços, descartando tokens de 1 caractere
+        raw, inverse, doc, starts, lengths = self._flatten([_VADER_TOKEN.findall(text) for text in texts])
+        unique = [self._strip_vader_token(token) for token in raw]
+        ids = self._lookup(unique, inverse)
+        position = np.arange(ids.size) - starts
+        is_upper = self._token_flags(unique, inverse, str.isupper)
+
+        # Caixa alta só conta quando parte (não todo) do texto está em maiúsculas
+        upper_counts = np.bincount(doc, weights=is_upper, minlength=n_docs)
+        cap_diff = ((upper_counts > 0) & (upper_counts < lengths))[doc]
+
+        word_id = self.vocabulary.get
+        is_but = ids == word_id('but')
+        is_least = ids == word_id('least')
+        is_kind = ids == word_id('kind')
+        next_is_of = np.zeros(ids.size, dtype=bool)
+        next_is_of[:-1] = (ids[1:] == word_id('of')) & (doc[1:] == doc[:-1])
+        # Comparações do _never_check do VADER diferenciam maiúsculas
+        is_never = self._token_flags(unique, inverse, lambda token: token == 'never')
+        is_so_this = self._token_flags(unique, inverse, lambda token: token in ('so', 'this'))
+        negated = self.negation[ids] | self._token_flags(unique, inverse, lambda token: "n't" in token.lower())
+
+        in_lexicon = self.in_lexicon[ids]
+        valence = self.valence[ids].copy()
+        sign = np.where(valence > 0, 1.0, -1.0)
+        valence += np.where(in_lexicon & is_upper & cap_diff, sign * VADER_C_INCR, 0.0)
+
+        def shifted(values: np.ndarray, k: int, fill) -> np.ndarray:
+            out = np.full(values.size, fill, dtype=values.dtype)
+            if values.size > k:
+                out[k:] = values[:-k]
+            return out
+
+        for k, decay in ((1, 1.0), (2, 0.95), (3, 0.9)):
+            valid = position >= k
+            prev_id = shifted(ids, k, 0)
+            applies = valid & ~self.in_lexicon[prev_id]
+
+            scalar = self.booster[prev_id] * np.where(valence < 0, -1.0, 1.0)
+            caps = (scalar != 0) & shifted(is_upper, k, False) & cap_diff
+            scalar = scalar + np.where(caps, np.where(valence > 0, VADER_C_INCR, -VADER_C_INCR), 0.0)
+            valence = valence + np.where(applies, scalar * decay, 0.0)
+
+            prev_negated = shifted(negated, k, False)
+            if k == 1:
+                factor = np.where(prev_negated, VADER_N_SCALAR, 1.0)
+            elif k == 2:
+                never_so = shifted(is_never, 2, False) & shifted(is_so_this, 1, False)
+                factor = np.where(never_so, 1.5, np.where(prev_negated, VADER_N_SCALAR, 1.0))
+            else:
+                never_so = ((shifted(is_never, 3, False) & shifted(is_so_this, 2, False))
+                            | shifted(is_so_this, 1, False))
+                factor = np.where(never_so, 1.25, np.where(prev_negated, VADER_N_SCALAR, 1.0))
+            valence = np.where(applies, valence * factor, valence)
+
+        # "least" antes da palavra inverte o sentido, exceto em "at least" / "very least"
+        prev_least = shifted(is_least, 1, False) & (position >= 1)
+        prev2 = shifted(ids, 2, 0)
+        least_exempt = (position >= 2) & ((prev2 == word_id('at')) | (prev2 == word_id('very')))
+        valence = np.where(prev_least & ~least_exempt, valence * VADER_N_SCALAR, valence)
+
+        # Apenas palavras do léxico pontuam; intensificadores e "kind of" valem zero
+        scored = in_lexicon & (self.booster[ids] == 0) & ~(is_kind & next_is_of)
+        valence = np.where(scored, valence, 0.0)
+
+        # Regra do "but": metade antes da primeira ocorrência, 1,5x depois
+        first_but = np.full(n_docs, np.iinfo(np.int64).max)
+        np.minimum.at(first_but, doc[is_but], position[is_but])
+        but_at = first_but[doc]
+        has_but = but_at != np.iinfo(np.int64).max
+        valence = np.where(has_but & (position < but_at), valence * 0.5,
+                           np.where(has_but & (position > but_at), valence * 1.5, valence))
+
+        columns = np.column_stack((
+            valence,
+            np.where(valence > 0, valence + 1.0, 0.0),
+            np.where(valence < 0, valence - 1.0, 0.0),
+            (valence == 0).astype(np.float64)
+        ))
+        sum_s, pos_sum, neg_sum, neu_count = self._doc_sums(doc, n_docs, columns).T
+
+        exclamations = np.minimum(np.fromiter((text.count('!') for text in texts), dtype=np.float64,
+                                              count=n_docs), 4) * 0.292
+        questions = np.fromiter((text.count('?') for text in texts), dtype=np.float64, count=n_docs)
+        emphasis = exclamations + np.where(questions > 3, 0.96, np.where(questions > 1, questions * 0.18, 0.0))
+
+        sum_s = sum_s + np.sign(sum_s) * emphasis
+        compound = sum_s / np.sqrt(sum_s * sum_s + VADER_ALPHA)
+        pos_sum = pos_sum + np.where(pos_sum > -neg_sum, emphasis, 0.0)
+        neg_sum = neg_sum - np.where(pos_sum < -neg_sum, emphasis, 0.0)
+        total = pos_sum - neg_sum + neu_count
+        safe_total = np.where(total > 0, total, 1.0)
+        has_tokens = lengths > 0
+
+        negative = np.where(has_tokens, np.round(np.abs(neg_sum / safe_total), 3), 0.0)
+        neutral = np.where(has_tokens, np.round(neu_count / safe_total, 3), 0.0)
+        positive = np.where(has_tokens, np.round(pos_sum / safe_total, 3), 0.0)
+        return {
+            'polarity': np.where(has_tokens, np.round(compound, 4), 0.0),
+            'subjectivity': 1.0 - neutral,
+            'negative': negative,
+            'neutral': neutral,
+            'positive': positive
+        }
+
+    @staticmethod
+    def _textblob_tokens(text: str) -> List[str]:
+        """
+        Tokenização do TextBlob: apóstrofos e pontuação como tokens próprios,
+        emoticons e a marca de sarcasmo (!) reagrupados, tudo em minúsculas
+        """
+        tokens = " ".join(_TEXTBLOB_TOKEN.findall(text.replace("n't", " n't").replace("'", " ' ")))
+        tokens = _TEXTBLOB_SARCASM.sub(_TEXTBLOB_IRONY, tokens)
+        tokens = _TEXTBLOB_EMOTICON_TOKENS.sub(lambda m: m.group(1).replace(" ", "") + m.group(2), tokens)
+        return tokens.lower().split()
+
+    @staticmethod
+    def _textblob_mood(token: str) -> float:
+        """Polaridade do token como emoticon (NaN se não for um), com os critérios do pattern"""
+        if token.isalpha() or len(token) > 5 or token in _TEXTBLOB_PUNCTUATION:
+            return np.nan
+        return _TEXTBLOB_EMOTICONS.get(token, np.nan)
+
+    def _score_textblob(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        n_docs = len(texts)
+        unique, inverse, doc, starts, _ = self._flatten([self._textblob_tokens(text) for text in texts])
+        ids = self._lookup(unique, inverse)
+        index = np.arange(ids.size)
+        known = self.known[ids]
+        negation = self.negation[ids]
+        is_exclamation = self._token_flags(unique, inverse, lambda token: token == '!')
+        short = self._token_flags(unique, inverse, lambda token: len(token.strip("'")) <= 1)
+        long_word = self._token_flags(unique, inverse, lambda token: len(token) > 2)
+        # Emoticons e (!) desconhecidos do léxico abrem uma avaliação própria
+        # (subjetividade 1), sem alterar o estado de modificador e negação
+        mood = np.fromiter(map(self._textblob_mood, unique), dtype=np.float64, count=len(unique))[inverse]
+        irony = self._token_flags(unique, inverse, lambda token: token == _TEXTBLOB_IRONY)
+        mood_polarity = np.where(irony, 0.0, mood)
+        extra = ~known & (irony | ~np.isnan(mood))
+        assessed = known | extra
+        prev_assessed = _previous_index(assessed, starts)
+
+        # Estado sequencial do pattern reproduzido com "última posição anterior":
+        # o modificador vale até uma palavra desconhecida longa; a negação, até
+        # uma palavra desconhecida de mais de um caractere ou uma palavra conhecida
+        prev_known = _previous_index(known, starts)
+        prev_known_id = ids[np.maximum(prev_known, 0)]
+        after_modifier = (prev_known >= 0) & self.modifier[prev_known_id]
+        # Uma negação logo após um advérbio em -ly ("really not good") nega a
+        # avaliação do advérbio e não interrompe o modificador
+        after_adverb = after_modifier & self.adverb[prev_known_id]
+        modifier_reset = _previous_index(~known & long_word & ~(negation & after_adverb), starts)
+        modifier_active = after_modifier & (modifier_reset < prev_known)
+        modified = known & modifier_active
+        consumed = ~known & negation & after_adverb & modifier_active
+
+        prev_negation = _previous_index(negation, starts)
+        negation_reset = _previous_index(~known & ~negation & ~short, starts)
+        negated = known & (prev_negation >= 0) & (prev_negation >= prev_known) \
+            & (negation_reset < prev_negation) & ~consumed[np.maximum(prev_negation, 0)]
+
+        # Cada palavra conhecida não modificada abre uma avaliação; as modificadas
+        # se fundem à anterior (a última aberta, mesmo que por um emoticon) e
+        # sobrescrevem polaridade e subjetividade
+        effective_intensity = np.where(negated, 1.0 / self.intensity[ids], self.intensity[ids])
+        multiplier = np.where(modified, effective_intensity[np.maximum(prev_assessed, 0)], 1.0)
+        polarity = np.where(extra, mood_polarity, np.clip(self.polarity[ids] * multiplier, -1.0, 1.0))
+        subjectivity = np.where(extra, 1.0, np.clip(self.subjectivity[ids] * multiplier, -1.0, 1.0))
+
+        assessed_index = index[assessed]
+        starts_chain = ~modified[assessed_index]
+        chain = np.cumsum(starts_chain) - 1
+        n_chains = int(starts_chain.sum())
+        chain_negated = np.zeros(n_chains, dtype=bool)
+        np.logical_or.at(chain_negated, chain, negated[assessed_index])
+        chain_of = np.full(ids.size, -1, dtype=np.int64)
+        chain_of[assessed_index] = chain
+        chain_negated[chain_of[prev_assessed[consumed]]] = True
+        chain_end = np.zeros(n_chains, dtype=np.int64)
+        chain_end[chain] = assessed_index  # o último de cada cadeia prevalece
+
+        # Exclamações logo após a avaliação reforçam a polaridade
+        exclamation_owner = prev_assessed[is_exclamation]
+        is_chain_end = np.zeros(ids.size, dtype=bool)
+        is_chain_end[chain_end] = True
+        exclamation_owner = exclamation_owner[(exclamation_owner >= 0)]
+        exclamation_owner = exclamation_owner[is_chain_end[exclamation_owner]]
+        boosts = np.bincount(exclamation_owner, minlength=ids.size)[chain_end] if ids.size else np.zeros(0)
+
+        chain_polarity = np.clip(polarity[chain_end] * _TEXTBLOB_EXCLAMATION_BOOST ** boosts, -1.0, 1.0)
+        chain_polarity = np.where(chain_negated, chain_polarity * _TEXTBLOB_NEGATION_SCALAR, chain_polarity)
+        chain_doc = doc[chain_end]
+
+        columns = np.column_stack((chain_polarity, subjectivity[chain_end], np.ones(n_chains)))
+        sums = self._doc_sums(chain_doc, n_docs, columns)
+        counts = np.maximum(sums[:, 2], 1.0)
+        return {
+            'polarity': sums[:, 0] / counts,
+            'subjectivity': sums[:, 1] / counts
+        }
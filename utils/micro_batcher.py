@@ -0,0 +1,164 @@
+# utils/micro_batcher.py
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from utils.stats import percentile
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Agrupa itens de chamadas concorrentes em um único lote de processamento.
+
+    O primeiro pedido abre uma janela de até `max_wait_ms`; pedidos que chegam
+    nesse intervalo entram no mesmo lote, que é despachado antes se atingir
+    `max_batch_size` itens. Cada chamador recebe apenas os resultados dos
+    próprios itens. Enquanto `max_concurrency` lotes estão em processamento, a
+    coleta continua e o próximo lote tende a ficar maior.
+    """
+
+    def __init__(self, process: Callable[[List[Any]], Awaitable[List[Any]]],
+                 max_batch_size: int = 64, max_wait_ms: float = 5.0,
+                 max_concurrency: int = 1, history_size: int = 1000):
+        """
+        Args:
+            process: Corrotina que processa uma lista de itens e devolve os resultados na mesma ordem
+            max_batch_size: Itens por lote a partir dos quais o lote é despachado sem esperar
+            max_wait_ms: Tempo máximo que o primeiro pedido de um lote espera por outros
+            max_concurrency: Lotes processados simultaneamente
+            history_size: Lotes recentes considerados nos percentis das métricas
+        """
+        self.process = process
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.max_concurrency = max(1, max_concurrency)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._inflight: set = set()
+
+        self._requests = 0
+        self._items = 0
+        self._batches = 0
+        self._errors = 0
+        self._batch_sizes: Deque[int] = deque(maxlen=history_size)
+        self._waits_ms: Deque[float] = deque(maxlen=history_size)
+
+    def _ensure_started(self):
+        if self._collector is None or self._collector.done():
+            self._queue = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._collector = asyncio.create_task(self._collect())
+
+    async def submit(self, items: List[Any]) -> List[Any]:
+        """Enfileira os itens e aguarda seus resultados"""
+        if not items:
+            return []
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((list(items), future, time.perf_counter()))
+        return await future
+
+    async def _collect(self):
+        """Loop que monta os lotes a partir da fila de pedidos"""
+        pending: List[Tuple[List[Any], asyncio.Future, float]] = []
+        try:
+            while True:
+                pending = [await self._queue.get()]
+                size = len(pending[0][0])
+                deadline = time.perf_counter() + self.max_wait
+
+                while size < self.max_batch_size:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    try:
+                        request = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    pending.append(request)
+                    size += len(request[0])
+
+                # Pedidos que chegam enquanto todos os slots estão ocupados entram no lote
+                await self._slots.acquire()
+                while size < self.max_batch_size and not self._queue.empty():
+                    request = self._queue.get_nowait()
+                    pending.append(request)
+                    size += len(request[0])
+
+                task = asyncio.create_task(self._run(pending))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+                pending = []
+        finally:
+            # Encerramento: pedidos ainda não despachados são cancelados
+            while self._queue is not None and not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            for _, future, _ in pending:
+                if not future.done():
+                    future.cancel()
+
+    async def _run(self, pending: List[Tuple[List[Any], asyncio.Future, float]]):
+        try:
+            items = [item for request_items, _, _ in pending for item in request_items]
+            dispatched_at = time.perf_counter()
+
+            self._requests += len(pending)
+            self._items += len(items)
+            self._batches += 1
+            self._batch_sizes.append(len(items))
+            for _, _, enqueued_at in pending:
+                self._waits_ms.append((dispatched_at - enqueued_at) * 1000.0)
+
+            try:
+                results = await self.process(items)
+            except Exception as e:
+                self._errors += 1
+                logger.error(f"Erro ao processar lote de {len(items)} itens: {e}")
+                for _, future, _ in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            offset = 0
+            for request_items, future, _ in pending:
+                if not future.done():
+                    future.set_result(results[offset:offset + len(request_items)])
+                offset += len(request_items)
+        finally:
+            self._slots.release()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Contadores acumulados e percentis dos lotes recentes"""
+        return {
+            'requests': self._requests,
+            'items': self._items,
+            'batches': self._batches,
+            'errors': self._errors,
+            'avg_batch_size': self._items / self._batches if self._batches else 0.0,
+            'batch_size_p50': percentile(self._batch_sizes, 50),
+            'batch_size_p95': percentile(self._batch_sizes, 95),
+            'batch_size_max': max(self._batch_sizes) if self._batch_sizes else 0,
+            'wait_ms_p50': percentile(self._waits_ms, 50),
+            'wait_ms_p95': percentile(self._waits_ms, 95),
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000.0
+        }
+
+    async def close(self):
+        """Interrompe a coleta e aguarda os lotes em andamento"""
+        if self._collector is not None:
+            self._collector.cancel()
+            try:
+                await self._collector
+            except asyncio.CancelledError:
+                pass
+            self._collector = None
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
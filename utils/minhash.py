@@ -0,0 +1,145 @@
+# utils/minhash.py
+
+import hashlib
+import re
+import zlib
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+
+class MinHasher:
+    """
+    Assinaturas MinHash de textos e chaves de banda para LSH.
+
+    Os hashes são determinísticos entre processos (crc32 + permutações geradas
+    com semente fixa), então assinaturas podem ser persistidas e comparadas depois.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, shingle_size: int = 3, seed: int = 1,
+                 stop_words: Optional[FrozenSet[str]] = None):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm deve ser múltiplo de bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.shingle_size = shingle_size
+        self.stop_words = stop_words or frozenset()
+
+        # a, b < 2^32: com hashes de 32 bits, a * h + b cabe em uint64 sem estourar
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, 1 << 32, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self._b = generator.randint(0, 1 << 32, size=num_perm, dtype=np.int64).astype(np.uint64)
+
+    def _shingle_hashes(self, text: str) -> np.ndarray:
+        """Hashes (32 bits) dos n-gramas de palavras do texto normalizado"""
+        tokens = [
+            token for token in _TOKEN_PATTERN.findall((text or '').lower())
+            if token not in self.stop_words
+        ]
+        if not tokens:
+            return np.empty(0, dtype=np.uint64)
+        if len(tokens) >= self.shingle_size:
+            shingles = {
+                ' '.join(tokens[i:i + self.shingle_size])
+                for i in range(len(tokens) - self.shingle_size + 1)
+            }
+        else:
+            shingles = {' '.join(tokens)}
+        return np.fromiter(
+            (zlib.crc32(s.encode('utf-8')) for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        Assinatura MinHash (num_perm valores) do texto.
+
+        Textos sem palavras (vazios ou só pontuação) recebem a assinatura vazia
+        (todos os valores em _MAX_HASH), que não gera chaves de banda.
+        """
+        hashes = self._shingle_hashes(text)
+        if not hashes.size:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1)
+
+    def signatures(self, texts: List[str]) -> np.ndarray:
+        """Matriz (n × num_perm) de assinaturas"""
+        if not texts:
+            return np.empty((0, self.num_perm), dtype=np.uint64)
+        return np.vstack([self.signature(text) for text in texts])
+
+    def band_keys(self, signature: np.ndarray) -> List[str]:
+        """Chaves LSH (uma por banda) de uma assinatura, estáveis entre processos; nenhuma para a assinatura vazia"""
+        if is_empty_signature(signature):
+            return []
+        keys = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows_per_band:(band + 1) * self.rows_per_band]
+            digest = hashlib.blake2b(rows.astype(np.uint64).tobytes(), digest_size=8).hexdigest()
+            keys.append(f"{band}:{digest}")
+        return keys
+
+    @staticmethod
+    def similarity(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+        """Estimativa da similaridade de Jaccard entre duas assinaturas"""
+        return float(np.mean(signature_a == signature_b))
+
+
+def is_empty_signature(signature: np.ndarray) -> bool:
+    """Indica se a assinatura é de um texto sem palavras"""
+    return bool(np.all(np.asarray(signature, dtype=np.uint64) == _MAX_HASH))
+
+
+def find_near_duplicate_groups(texts: List[str], threshold: float = 0.8,
+                               hasher: MinHasher = None) -> List[List[int]]:
+    """
+    Agrupa textos quase idênticos usando MinHash + LSH em tempo aproximadamente linear.
+
+    Cada balde LSH compara seus membros apenas com o primeiro item do balde, e os
+    pares confirmados (Jaccard estimado >= threshold) são unidos via union-find.
+    Textos sem palavras ficam sempre em grupos próprios.
+
+    Args:
+        texts: Textos a comparar
+        threshold: Similaridade de Jaccard mínima para considerar duplicata
+        hasher: MinHasher a usar (padrão: 64 permutações, 16 bandas)
+
+    Returns:
+        Grupos de índices, ordenados pelo primeiro índice de cada grupo
+    """
+    hasher = hasher or MinHasher()
+    signatures = hasher.signatures(texts)
+    parent = list(range(len(texts)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets: Dict[Tuple[int, bytes], int] = {}
+    for index, signature in enumerate(signatures):
+        if is_empty_signature(signature):
+            continue
+        for band in range(hasher.bands):
+            rows = signature[band * hasher.rows_per_band:(band + 1) * hasher.rows_per_band]
+            key = (band, rows.tobytes())
+            first = buckets.setdefault(key, index)
+            if first == index:
+                continue
+            root_a, root_b = find(first), find(index)
+            if root_a != root_b and MinHasher.similarity(signatures[first], signature) >= threshold:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    groups: Dict[int, List[int]] = {}
+    for index in range(len(texts)):
+        groups.setdefault(find(index), []).append(index)
+    return list(groups.values())
@@ -0,0 +1,129 @@
+# utils/sentiment_cache.py
+
+import hashlib
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normaliza um texto para a chave do cache (NFC e espaços colapsados).
+
+    Maiúsculas e pontuação são preservadas porque alteram o resultado do VADER
+    e de modelos cased.
+    """
+    return ' '.join(unicodedata.normalize('NFC', text or '').split())
+
+
+def text_hash(text: str) -> str:
+    """sha256 (hex) do texto normalizado"""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+class SentimentCache:
+    """
+    Cache de resultados de sentimento indexado por hash do texto e analisador.
+
+    A primeira camada é um LRU em memória; a segunda, opcional, é a tabela
+    sentiment_analysis, consultada em lote para os textos ausentes da memória.
+    Falhas no banco são registradas e tratadas como ausência no cache. A camada
+    em memória é protegida por lock, pois o serviço de sentimento a acessa a
+    partir do seu pool de threads.
+    """
+
+    def __init__(self, max_entries: int = 10000,
+                 session_factory: Optional[Callable[[], ContextManager]] = None):
+        """
+        Args:
+            max_entries: Capacidade da camada em memória (0 desativa o cache em memória)
+            session_factory: Gerenciador de contexto de sessão (ex.: get_db_session) para a
+                camada persistente; None mantém apenas a memória
+        """
+        self.max_entries = max_entries
+        self.session_factory = session_factory
+        self._entries: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, key: tuple, result: Dict[str, Any]):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_many(self, texts: List[str], analyzer: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Busca resultados para os textos informados.
+
+        Returns:
+            Dicionário texto -> resultado, apenas para os encontrados
+        """
+        texts_by_hash: Dict[str, List[str]] = {}
+        for text in texts:
+            texts_by_hash.setdefault(text_hash(text), []).append(text)
+
+        found_by_hash: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        with self._lock:
+            for digest in texts_by_hash:
+                key = (analyzer, digest)
+                result = self._entries.get(key)
+                if result is None:
+                    missing.append(digest)
+                else:
+                    self._entries.move_to_end(key)
+                    found_by_hash[digest] = result
+
+        if missing and self.session_factory is not None:
+            # SQLAlchemy só é carregado quando a camada persistente está em uso
+            from repositories.sentiment_repository import SentimentRepository
+            try:
+                with self.session_factory() as session:
+                    rows = SentimentRepository(session).get_by_text_hashes(missing, analyzer)
+                    for digest, row in rows.items():
+                        result = {
+                            'polarity': row.polarity,
+                            'subjectivity': row.subjectivity,
+                            'sentiment': row.sentiment,
+                            'confidence': row.confidence
+                        }
+                        if row.detailed_scores is not None:
+                            result['detailed_scores'] = row.detailed_scores
+                        self._remember((analyzer, digest), result)
+                        found_by_hash[digest] = result
+            except Exception as e:
+                logger.warning(f"Falha ao consultar cache persistente de sentimento: {e}")
+
+        return {
+            text: dict(result)
+            for digest, result in found_by_hash.items()
+            for text in texts_by_hash[digest]
+        }
+
+    def put_many(self, results: Dict[str, Dict[str, Any]], analyzer: str):
+        """Armazena resultados indexados por texto (não por hash)"""
+        by_hash = {text_hash(text): result for text, result in results.items()}
+        for digest, result in by_hash.items():
+            self._remember((analyzer, digest), dict(result))
+
+        if by_hash and self.session_factory is not None:
+            from repositories.sentiment_repository import SentimentRepository
+            try:
+                with self.session_factory() as session:
+                    SentimentRepository(session).save_results(by_hash, analyzer)
+            except Exception as e:
+                logger.warning(f"Falha ao gravar cache persistente de sentimento: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
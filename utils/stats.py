@@ -0,0 +1,12 @@
+# utils/stats.py
+
+from typing import Sequence
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Percentil simples (nearest-rank) de uma sequência já coletada (0.0 se vazia)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100.0 * len(ordered))) - 1))
+    return float(ordered[index])
@@ -0,0 +1,76 @@
+# utils/text_vectors.py
+
+from typing import TYPE_CHECKING, Dict, List
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+
+def build_tfidf_vectorizer() -> "TfidfVectorizer":
+    """
+    Vetorizador TF-IDF usado na pontuação de importância e no clustering.
+
+    Ambos os estágios usam a mesma configuração, o que permite calcular a matriz
+    uma única vez por requisição e repassá-la junto com as notícias. O
+    scikit-learn é importado apenas aqui, na primeira vetorização.
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    return TfidfVectorizer(
+        max_features=1000,
+        stop_words='english',
+        ngram_range=(1, 2),
+        dtype=np.float32
+    )
+
+
+def news_text(item: Dict) -> str:
+    """Texto de uma notícia usado na vetorização (título + descrição)"""
+    return f"{item.get('title', '')} {item.get('description', '')}"
+
+
+def news_texts(items: List[Dict]) -> List[str]:
+    return [news_text(item) for item in items]
+
+
+def term_importance(column_sums, n_docs: int) -> np.ndarray:
+    """
+    Importância de cada termo: raiz do peso TF-IDF médio do termo no corpus.
+
+    Args:
+        column_sums: Soma das colunas da matriz TF-IDF (pode ser acumulada por lotes)
+        n_docs: Número de documentos somados
+    """
+    return np.sqrt(np.asarray(column_sums, dtype=np.float32).ravel() / max(n_docs, 1))
+
+
+def raw_importance_scores(x, term_weights: np.ndarray) -> np.ndarray:
+    """Pontuação não normalizada dos documentos de x (tamanho do documento × termos importantes)"""
+    doc_lengths = np.asarray(x.sum(axis=1), dtype=np.float32).ravel()
+    return doc_lengths * np.asarray(x @ term_weights, dtype=np.float32).ravel()
+
+
+def normalize_scores(scores: np.ndarray) -> np.ndarray:
+    """Normalização min-max para o intervalo 0 a 1"""
+    if scores.size > 0:
+        scores = (scores - scores.min()) / (scores.max() - scores.min() + 1e-8)
+    return scores
+
+
+def importance_scores(x) -> np.ndarray:
+    """
+    Pontuação de importância (0 a 1) de cada documento a partir da matriz TF-IDF.
+
+    A matriz permanece esparsa: o produto com o vetor de importância dos termos
+    é feito direto sobre a CSR, sem materializar o array denso docs × termos.
+
+    Args:
+        x: Matriz TF-IDF esparsa (docs × termos)
+
+    Returns:
+        Array float32 com uma pontuação normalizada por documento
+    """
+    term_weights = term_importance(x.sum(axis=0), x.shape[0])
+    return normalize_scores(raw_importance_scores(x, term_weights))